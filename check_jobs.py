@@ -1,20 +1,17 @@
 """Check current jobs in database."""
 
-import sys
-from pathlib import Path
-
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
 from database.connection import DatabaseConnection
 from database.models import JobRaw
 
 db = DatabaseConnection()
 with db.get_session() as session:
-    jobs = session.query(JobRaw).limit(15).all()
+    # Only the columns we print - skips loading description text and ORM objects
+    rows = session.query(
+        JobRaw.title, JobRaw.salary_min, JobRaw.salary_max, JobRaw.city, JobRaw.province
+    ).limit(15).all()
     print("\nSample jobs in database:")
     print("="*100)
-    for job in jobs:
-        salary_str = f"${job.salary_min}-${job.salary_max}" if job.salary_min else "N/A"
-        print(f"{job.title[:35]:35s} | {salary_str:20s} | {job.city}, {job.province}")
+    for title, salary_min, salary_max, city, province in rows:
+        salary_str = f"${salary_min}-${salary_max}" if salary_min else "N/A"
+        print(f"{title[:35]:35s} | {salary_str:20s} | {city}, {province}")
     print("="*100)
@@ -8,17 +8,16 @@ This script systematically collects jobs from:
 - Multiple pages per search
 """
 
-import sys
-from pathlib import Path
-import time
-
-# Add src to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+import asyncio
+import os
+import itertools
+import random
+from concurrent.futures import ProcessPoolExecutor
 
 from collectors.jobbank_collector import JobBankCollector
 from database.connection import DatabaseConnection
-from database.storage import JobStorage
+from database.models import JobRaw
+from database.storage import JobStorage, BulkJobBuffer
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -72,14 +71,101 @@ ROLES = [
     'blockchain developer', 'automation engineer'
 ]
 
-def collect_comprehensive_dataset(max_pages=5, delay_between_searches=1, early_exit_after=80):
+class _SearchPacer:
+    """Space out search starts by a minimum interval, shared by all tasks."""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_start = 0.0
+    
+    async def wait(self):
+        """Reserve the next start slot and sleep until it arrives."""
+        now = asyncio.get_running_loop().time()
+        delay = self._next_start - now
+        self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def _run_searches(collector, buffer, start_count, stats, max_pages, delay_between_searches,
+                        early_exit_after, concurrency):
+    """
+    Fan out every city/role search, keeping at most `concurrency` in flight.
+    
+    Collection and buffering run in worker threads, so a COPY flush never
+    blocks the event loop; the buffer's lock keeps a single writer. The
+    bookkeeping stays on the event loop.
+    """
+    semaphore = asyncio.BoundedSemaphore(concurrency)
+    pacer = _SearchPacer(delay_between_searches)
+    stop = asyncio.Event()
+    total_searches = len(CITIES) * len(ROLES)
+    consecutive_zero_inserts = 0
+    
+    async def run_search(city, role):
+        nonlocal consecutive_zero_inserts
+        async with semaphore:
+            if stop.is_set():
+                return
+            # Delay between searches to be respectful
+            await pacer.wait()
+            if stop.is_set():
+                return
+            
+            stats['searches'] += 1
+            logger.info(f"\n[{stats['searches']}/{total_searches}] Collecting {role} in {city}")
+            
+            try:
+                # Collect jobs
+                jobs = await asyncio.to_thread(collector.collect_with_validation, city, role, max_pages)
+                stats['collected'] += len(jobs)
+                
+                if not jobs or stop.is_set():
+                    return
+                
+                # Queue jobs for bulk insert
+                inserted = await asyncio.to_thread(buffer.add, jobs, 'jobbank')
+                stats['inserted'] += inserted
+                
+                # Track consecutive batches with no new jobs
+                if inserted == 0:
+                    consecutive_zero_inserts += 1
+                    if consecutive_zero_inserts >= early_exit_after:
+                        logger.info(f"\n⚠️  Early exit: {consecutive_zero_inserts} consecutive batches with 0 new jobs (Job Bank pool exhausted)")
+                        stop.set()
+                        return
+                else:
+                    consecutive_zero_inserts = 0
+                
+                # Check if we've reached target (running total, no count(*) per search)
+                current_total = start_count + stats['inserted']
+                
+                logger.info(f"✓ Database now has {current_total} jobs")
+                
+                if current_total >= 5000:
+                    logger.info(f"\n🎉 TARGET REACHED! Collected {current_total} jobs!")
+                    stop.set()
+                    
+            except Exception as e:
+                logger.error(f"Failed to collect {role} in {city}: {e}")
+    
+    # Shuffle so an early exit lands on a spread of cities, not just the first few
+    pairs = list(itertools.product(CITIES, ROLES))
+    random.shuffle(pairs)
+    await asyncio.gather(*(run_search(city, role) for city, role in pairs))
+
+
+def collect_comprehensive_dataset(max_pages=5, delay_between_searches=1, early_exit_after=80, concurrency=20,
+                                  parse_workers=0):
     """
     Collect comprehensive dataset from Job Bank Canada.
     
     Args:
         max_pages: Maximum pages to scrape per city/role combination
-        delay_between_searches: Delay in seconds between searches
+        delay_between_searches: Minimum delay in seconds between search starts
         early_exit_after: Stop after this many consecutive 0-insert batches (Job Bank pool exhausted)
+        concurrency: Maximum number of searches in flight at once
+        parse_workers: Processes for HTML parsing (0 = parse in the fetching threads)
     """
     logger.info("="*80)
     logger.info("COMPREHENSIVE JOB COLLECTION - TARGET: 5,000+ JOBS")
@@ -88,11 +174,11 @@ def collect_comprehensive_dataset(max_pages=5, delay_between_searches=1, early_e
     # Initialize
     db = DatabaseConnection()
     storage = JobStorage(db)
-    collector = JobBankCollector()
+    parse_executor = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+    collector = JobBankCollector(parse_executor=parse_executor)
     
     # Get current count
     with db.get_session() as session:
-        from database.models import JobRaw
         current_count = session.query(JobRaw).count()
     
     logger.info(f"\nStarting with {current_count} jobs in database")
@@ -104,91 +190,41 @@ def collect_comprehensive_dataset(max_pages=5, delay_between_searches=1, early_e
     logger.info(f"  Roles: {len(ROLES)} roles")
     logger.info(f"  Max combinations: {len(CITIES) * len(ROLES)}")
     logger.info(f"  Pages per search: {max_pages}")
+    logger.info(f"  Concurrent searches: {concurrency}")
+    logger.info(f"  Parse workers: {parse_workers or 'in-thread'}")
     logger.info(f"  Estimated max jobs: ~{len(CITIES) * len(ROLES) * max_pages * 25}\n")
     
-    total_collected = 0
-    total_inserted = 0
-    search_count = 0
-    consecutive_zero_inserts = 0
-    early_exit_triggered = False
+    stats = {'collected': 0, 'inserted': 0, 'searches': 0}
+    buffer = BulkJobBuffer(storage)
     
     try:
-        for city in CITIES:
-            if early_exit_triggered:
-                break
-            for role in ROLES:
-                search_count += 1
-                
-                logger.info(f"\n[{search_count}/{len(CITIES) * len(ROLES)}] Collecting {role} in {city}")
-                
-                try:
-                    # Collect jobs
-                    jobs = collector.collect_with_validation(city, role, max_pages)
-                    total_collected += len(jobs)
-                    
-                    if jobs:
-                        # Store jobs
-                        inserted = storage.insert_raw_jobs(jobs, 'jobbank')
-                        total_inserted += inserted
-                        
-                        # Track consecutive batches with no new jobs
-                        if inserted == 0:
-                            consecutive_zero_inserts += 1
-                            if consecutive_zero_inserts >= early_exit_after:
-                                logger.info(f"\n⚠️  Early exit: {consecutive_zero_inserts} consecutive batches with 0 new jobs (Job Bank pool exhausted)")
-                                early_exit_triggered = True
-                                break
-                        else:
-                            consecutive_zero_inserts = 0
-                        
-                        # Check if we've reached target
-                        with db.get_session() as session:
-                            from database.models import JobRaw
-                            current_total = session.query(JobRaw).count()
-                        
-                        logger.info(f"✓ Database now has {current_total} jobs")
-                        
-                        if current_total >= 5000:
-                            logger.info(f"\n🎉 TARGET REACHED! Collected {current_total} jobs!")
-                            break
-                    
-                    # Delay between searches to be respectful
-                    time.sleep(delay_between_searches)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to collect {role} in {city}: {e}")
-                    continue
-            
-            if early_exit_triggered:
-                break
-            
-            # Check if target reached (break outer loop)
-            with db.get_session() as session:
-                from database.models import JobRaw
-                current_total = session.query(JobRaw).count()
-            
-            if current_total >= 5000:
-                break
+        try:
+            asyncio.run(_run_searches(
+                collector, buffer, current_count, stats,
+                max_pages, delay_between_searches, early_exit_after, concurrency
+            ))
+        finally:
+            buffer.flush()
+            if parse_executor is not None:
+                parse_executor.shutdown(cancel_futures=True)
         
         # Final stats
         with db.get_session() as session:
-            from database.models import JobRaw
             final_count = session.query(JobRaw).count()
         
         logger.info("\n" + "="*80)
         logger.info("COLLECTION COMPLETE")
         logger.info("="*80)
         logger.info(f"Starting count: {current_count}")
-        logger.info(f"Jobs collected: {total_collected}")
-        logger.info(f"New jobs inserted: {total_inserted}")
+        logger.info(f"Jobs collected: {stats['collected']}")
+        logger.info(f"New jobs inserted: {buffer.inserted}")
         logger.info(f"Final count: {final_count}")
-        logger.info(f"Searches performed: {search_count}")
+        logger.info(f"Searches performed: {stats['searches']}")
         logger.info("="*80)
         
     except KeyboardInterrupt:
         logger.info("\n\n⚠️  Collection interrupted by user")
         with db.get_session() as session:
-            from database.models import JobRaw
             final_count = session.query(JobRaw).count()
         logger.info(f"Partial collection: {final_count} jobs in database")
 
@@ -197,13 +233,18 @@ if __name__ == '__main__':
     
     parser = argparse.ArgumentParser(description='Collect comprehensive job dataset')
     parser.add_argument('--pages', type=int, default=5, help='Max pages per search (default: 5)')
-    parser.add_argument('--delay', type=float, default=0.5, help='Delay between searches in seconds (default: 0.5)')
+    parser.add_argument('--delay', type=float, default=0.5, help='Delay between search starts in seconds (default: 0.5)')
     parser.add_argument('--early-exit', type=int, default=80, help='Stop after N consecutive 0-insert batches (default: 80)')
+    parser.add_argument('--concurrency', type=int, default=20, help='Max searches in flight at once (default: 20)')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help=f'Processes for HTML parsing, 0 = in-thread (this machine has {os.cpu_count()} CPUs)')
     
     args = parser.parse_args()
     
     collect_comprehensive_dataset(
         max_pages=args.pages,
         delay_between_searches=args.delay,
-        early_exit_after=args.early_exit
+        early_exit_after=args.early_exit,
+        concurrency=args.concurrency,
+        parse_workers=args.parse_workers
     )
@@ -7,12 +7,12 @@ Reaches 5,000+ jobs by combining multiple data sources.
 - ADZUNA_APP_ID, ADZUNA_APP_KEY: Free at developer.adzuna.com
 """
 
-import sys
-from pathlib import Path
-import time
-
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+import asyncio
+import itertools
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from collectors.jobbank_collector import JobBankCollector
 from collectors.jsearch_collector import JSearchCollector
@@ -21,9 +21,11 @@ from collectors.adzuna_collector import AdzunaCollector
 from collectors.remoteok_collector import RemoteOKCollector
 from collectors.rss_collectors import IndeedRSSCollector, WorkopolisRSSCollector
 from database.connection import DatabaseConnection
-from database.storage import JobStorage
+from database.models import JobRaw
+from database.storage import JobStorage, BulkJobBuffer
 from utils.config import Config
 from utils.logger import setup_logger
+from utils.retry_logic import RateLimiter
 
 logger = setup_logger(__name__)
 
@@ -36,34 +38,190 @@ ROLES = [
     'backend developer', 'frontend developer', 'mobile developer', 'security engineer'
 ]
 
+# Concurrent searches per source - APIs with tight quotas get fewer workers.
+# Job Bank's own rate limiter still bounds its request rate.
+SOURCE_CONCURRENCY = {
+    'jobbank': 16,
+    'jsearch': 4,
+    'rapidapi': 4,
+    'adzuna': 4,
+    'indeed': 2,
+    'workopolis': 2,
+}
+DEFAULT_SOURCE_CONCURRENCY = 4
+
+# Minimum spacing between search starts within one source
+SEARCH_INTERVAL_SECONDS = 0.5
 
-def collect_from_source(collector, storage, db, source_name: str, cities: list, roles: list, max_pages: int):
-    """Collect from a single source and return (collected_count, inserted_count)."""
+
+def collect_from_source(collector, buffer, start_count: int, stop, source_name: str,
+                        cities: list, roles: list, max_pages: int):
+    """
+    Collect from a single source and return (collected_count, inserted_count).
+    
+    City/role searches run on a small thread pool (see SOURCE_CONCURRENCY)
+    while a per-source RateLimiter spaces out search starts. Results are
+    handed to the buffer from this thread as they complete. `start_count` is
+    the job total before collection began; the running total comes from the
+    shared buffer instead of re-counting jobs_raw. Setting `stop` ends every
+    source.
+    """
     total_collected = 0
     total_inserted = 0
+    limiter = RateLimiter(SEARCH_INTERVAL_SECONDS)
     
-    for city in cities:
-        for role in roles:
+    def search(city, role):
+        if stop.is_set():
+            return []
+        limiter.wait()  # Brief delay between requests
+        return collector.collect_with_validation(city, role, max_pages)
+    
+    workers = SOURCE_CONCURRENCY.get(source_name, DEFAULT_SOURCE_CONCURRENCY)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Shuffle so an early stop lands on a spread of cities, not just the first few
+        pairs = list(itertools.product(cities, roles))
+        random.shuffle(pairs)
+        futures = {
+            executor.submit(search, city, role): (city, role)
+            for city, role in pairs
+        }
+        for future in as_completed(futures):
+            city, role = futures[future]
             try:
-                jobs = collector.collect_with_validation(city, role, max_pages)
-                total_collected += len(jobs)
-                if jobs:
-                    inserted = storage.insert_raw_jobs(jobs, source_name)
-                    total_inserted += inserted
-                    
-                    with db.get_session() as session:
-                        from database.models import JobRaw
-                        current = session.query(JobRaw).count()
-                    logger.info(f"  {source_name}: {current} total jobs | +{inserted} new")
-                    
-                    if current >= 5000:
-                        return total_collected, total_inserted, True
-                        
+                jobs = future.result()
             except Exception as e:
                 logger.warning(f"  {source_name} failed for {role} in {city}: {e}")
-            time.sleep(0.5)  # Brief delay between requests
+                continue
+            
+            total_collected += len(jobs)
+            if jobs and not stop.is_set():
+                inserted = buffer.add(jobs, source_name)
+                total_inserted += inserted
+                
+                current = start_count + buffer.added
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"  {source_name}: {current} total jobs | +{inserted} new")
+                
+                if current >= 5000:
+                    stop.set()
+            
+            if stop.is_set():
+                # Queued searches return immediately once stop is set
+                for pending in futures:
+                    pending.cancel()
+                break
             
-    return total_collected, total_inserted, False
+    return total_collected, total_inserted
+
+
+def collect_remoteok(buffer, start_count: int, stop):
+    """Collect RemoteOK's single feed and return (collected_count, inserted_count)."""
+    collector = RemoteOKCollector()
+    jobs = collector.collect_all_roles(ROLES)
+    valid = [j for j in jobs if collector.validate_job(j)]
+    inserted = 0
+    if valid and not stop.is_set():
+        inserted = buffer.add(valid, 'remoteok')
+        current = start_count + buffer.added
+        logger.info(f"  remoteok: {current} total jobs | +{inserted} new")
+        if current >= 5000:
+            stop.set()
+    return len(jobs), inserted
+
+
+async def run_source(label: str, source_name: str, func, *args, tip: str = None) -> int:
+    """
+    Run one source in a worker thread and return the number of new jobs.
+    
+    Sources hit independent hosts, so running them side by side overlaps
+    their network waits. A failing source is logged and counts as zero.
+    """
+    logger.info(f"\n📥 {label}")
+    try:
+        _, inserted = await asyncio.to_thread(func, *args)
+        return inserted
+    except Exception as e:
+        logger.warning(f"{source_name} failed: {e}")
+        if tip:
+            logger.info(f"  Tip: {tip}")
+        return 0
+
+
+async def collect_all_sources(args, buffer, start_count: int) -> int:
+    """Run every enabled source concurrently and return the number of new jobs."""
+    stop = threading.Event()
+    tasks = []
+    
+    def from_source(factory, source_name, cities, roles, pages):
+        # Build the collector inside the worker so constructor errors are
+        # reported per source, like the old sequential blocks did
+        def run():
+            return collect_from_source(factory(), buffer, start_count, stop,
+                                       source_name, cities, roles, pages)
+        return run
+    
+    # 1. Job Bank (always works, no API key needed)
+    if 'jobbank' in args.sources:
+        tasks.append(run_source(
+            "SOURCE 1: Job Bank Canada", 'Job Bank',
+            from_source(JobBankCollector, 'jobbank', CITIES, ROLES, args.pages)
+        ))
+    
+    # 2. JSearch API (subscribe at rapidapi.com/letscrape-6bRBa3QguO5/api/jsearch)
+    if 'jsearch' in args.sources and Config.RAPIDAPI_KEY:
+        tasks.append(run_source(
+            "SOURCE 2: JSearch API (RapidAPI)", 'JSearch',
+            from_source(JSearchCollector, 'jsearch', CITIES[:6], ROLES[:10], 3),  # Expanded: more cities, roles, pages
+            tip="Subscribe to JSearch at RapidAPI, add RAPIDAPI_KEY to .env"
+        ))
+
+    # 3. LinkedIn Jobs (RapidAPI - uses RAPIDAPI_HOST=linkedin-jobs.p.rapidapi.com)
+    if 'linkedin' in args.sources and Config.RAPIDAPI_KEY:
+        tasks.append(run_source(
+            "SOURCE 3: LinkedIn Jobs API (RapidAPI)", 'LinkedIn Jobs',
+            from_source(RapidAPICollector, 'rapidapi', CITIES[:6], ROLES[:8], 2),
+            tip="Subscribe to LinkedIn Jobs at RapidAPI, set RAPIDAPI_HOST in .env"
+        ))
+
+    # 4. Adzuna (free - register at developer.adzuna.com)
+    if 'adzuna' in args.sources and Config.ADZUNA_APP_ID and Config.ADZUNA_APP_KEY:
+        tasks.append(run_source(
+            "SOURCE 4: Adzuna API (free)", 'Adzuna',
+            from_source(AdzunaCollector, 'adzuna', CITIES[:6], ROLES, 3),
+            tip="Register at developer.adzuna.com, add ADZUNA_APP_ID and ADZUNA_APP_KEY to .env"
+        ))
+
+    # 5. RemoteOK (free, no key - remote jobs)
+    if 'remoteok' in args.sources:
+        tasks.append(run_source(
+            "SOURCE 5: RemoteOK (free, no key)", 'RemoteOK',
+            collect_remoteok, buffer, start_count, stop
+        ))
+
+    # 6. Indeed RSS (may be limited by Indeed)
+    if 'indeed' in args.sources:
+        tasks.append(run_source(
+            "SOURCE 6: Indeed RSS", 'Indeed RSS',
+            from_source(IndeedRSSCollector, 'indeed', CITIES[:6], ROLES[:8], 1)
+        ))
+
+    # 7. Workopolis RSS (may return HTML - feed deprecated)
+    if 'workopolis' in args.sources:
+        workopolis_cities = ['Toronto', 'Ottawa', 'Calgary', 'Vancouver', 'Montreal', 'Saskatoon', 'Regina', 'Winnipeg']
+        tasks.append(run_source(
+            "SOURCE 7: Workopolis RSS", 'Workopolis',
+            from_source(WorkopolisRSSCollector, 'workopolis', workopolis_cities, ROLES[:6], 1)
+        ))
+    
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning(f"Source task failed: {result}")
+    
+    if stop.is_set():
+        logger.info("\n🎉 TARGET REACHED!")
+    
+    return sum(r for r in results if isinstance(r, int))
 
 
 def main():
@@ -87,137 +245,25 @@ def main():
     storage = JobStorage(db)
     
     with db.get_session() as session:
-        from database.models import JobRaw
         start_count = session.query(JobRaw).count()
     
     logger.info(f"\nStarting with {start_count} jobs")
     logger.info(f"Sources: {', '.join(args.sources)}\n")
     
-    target_reached = False
-    total_inserted = 0
-    
-    # 1. Job Bank (always works, no API key needed)
-    if 'jobbank' in args.sources:
-        logger.info("\n📥 SOURCE 1: Job Bank Canada")
-        collector = JobBankCollector()
-        _, inserted, target_reached = collect_from_source(
-            collector, storage, db, 'jobbank',
-            CITIES, ROLES, args.pages
-        )
-        total_inserted += inserted
-        if target_reached:
-            logger.info("\n🎉 TARGET REACHED!")
-            return
-    
-    # 2. JSearch API (subscribe at rapidapi.com/letscrape-6bRBa3QguO5/api/jsearch)
-    if 'jsearch' in args.sources and Config.RAPIDAPI_KEY and not target_reached:
-        logger.info("\n📥 SOURCE 2: JSearch API (RapidAPI)")
-        try:
-            collector = JSearchCollector()
-            _, inserted, target_reached = collect_from_source(
-                collector, storage, db, 'jsearch',
-                CITIES[:6], ROLES[:10], 3  # Expanded: more cities, roles, pages
-            )
-            total_inserted += inserted
-            if target_reached:
-                logger.info("\n🎉 TARGET REACHED!")
-                return
-        except Exception as e:
-            logger.warning(f"JSearch failed: {e}")
-            logger.info("  Tip: Subscribe to JSearch at RapidAPI, add RAPIDAPI_KEY to .env")
-
-    # 3. LinkedIn Jobs (RapidAPI - uses RAPIDAPI_HOST=linkedin-jobs.p.rapidapi.com)
-    if 'linkedin' in args.sources and Config.RAPIDAPI_KEY and not target_reached:
-        logger.info("\n📥 SOURCE 3: LinkedIn Jobs API (RapidAPI)")
-        try:
-            collector = RapidAPICollector()
-            _, inserted, target_reached = collect_from_source(
-                collector, storage, db, 'rapidapi',
-                CITIES[:6], ROLES[:8], 2
-            )
-            total_inserted += inserted
-            if target_reached:
-                logger.info("\n🎉 TARGET REACHED!")
-                return
-        except Exception as e:
-            logger.warning(f"LinkedIn Jobs failed: {e}")
-            logger.info("  Tip: Subscribe to LinkedIn Jobs at RapidAPI, set RAPIDAPI_HOST in .env")
-
-    # 4. Adzuna (free - register at developer.adzuna.com)
-    if 'adzuna' in args.sources and Config.ADZUNA_APP_ID and Config.ADZUNA_APP_KEY and not target_reached:
-        logger.info("\n📥 SOURCE 4: Adzuna API (free)")
-        try:
-            collector = AdzunaCollector()
-            _, inserted, target_reached = collect_from_source(
-                collector, storage, db, 'adzuna',
-                CITIES[:6], ROLES, 3
-            )
-            total_inserted += inserted
-            if target_reached:
-                logger.info("\n🎉 TARGET REACHED!")
-                return
-        except Exception as e:
-            logger.warning(f"Adzuna failed: {e}")
-            logger.info("  Tip: Register at developer.adzuna.com, add ADZUNA_APP_ID and ADZUNA_APP_KEY to .env")
-
-    # 5. RemoteOK (free, no key - remote jobs)
-    if 'remoteok' in args.sources and not target_reached:
-        logger.info("\n📥 SOURCE 5: RemoteOK (free, no key)")
-        try:
-            collector = RemoteOKCollector()
-            jobs = collector.collect_all_roles(ROLES)
-            valid = [j for j in jobs if collector.validate_job(j)]
-            if valid:
-                inserted = storage.insert_raw_jobs(valid, 'remoteok')
-                total_inserted += inserted
-                with db.get_session() as session:
-                    from database.models import JobRaw
-                    current = session.query(JobRaw).count()
-                logger.info(f"  remoteok: {current} total jobs | +{inserted} new")
-                if current >= 5000:
-                    target_reached = True
-        except Exception as e:
-            logger.warning(f"RemoteOK failed: {e}")
-
-    # 6. Indeed RSS (may be limited by Indeed)
-    if 'indeed' in args.sources and not target_reached:
-        logger.info("\n📥 SOURCE 6: Indeed RSS")
-        try:
-            collector = IndeedRSSCollector()
-            _, inserted, target_reached = collect_from_source(
-                collector, storage, db, 'indeed',
-                CITIES[:6], ROLES[:8], 1
-            )
-            total_inserted += inserted
-            if target_reached:
-                logger.info("\n🎉 TARGET REACHED!")
-                return
-        except Exception as e:
-            logger.warning(f"Indeed RSS failed: {e}")
-
-    # 7. Workopolis RSS (may return HTML - feed deprecated)
-    if 'workopolis' in args.sources and not target_reached:
-        logger.info("\n📥 SOURCE 7: Workopolis RSS")
-        try:
-            collector = WorkopolisRSSCollector()
-            workopolis_cities = ['Toronto', 'Ottawa', 'Calgary', 'Vancouver', 'Montreal', 'Saskatoon', 'Regina', 'Winnipeg']
-            _, inserted, target_reached = collect_from_source(
-                collector, storage, db, 'workopolis',
-                workopolis_cities, ROLES[:6], 1
-            )
-            total_inserted += inserted
-        except Exception as e:
-            logger.warning(f"Workopolis failed: {e}")
+    buffer = BulkJobBuffer(storage)
+    try:
+        asyncio.run(collect_all_sources(args, buffer, start_count))
+    finally:
+        buffer.flush()
     
     # Final stats
     with db.get_session() as session:
-        from database.models import JobRaw
         final_count = session.query(JobRaw).count()
     
     logger.info("\n" + "="*80)
     logger.info("COLLECTION COMPLETE")
     logger.info("="*80)
-    logger.info(f"Starting: {start_count} | New: +{total_inserted} | Final: {final_count}")
+    logger.info(f"Starting: {start_count} | New: +{buffer.inserted} | Final: {final_count}")
     logger.info("="*80)
     
     if final_count < args.target:
@@ -4,29 +4,61 @@ Monitor the progress of the 5000+ job collection.
 Run this periodically to check status.
 """
 
-import sys
-from pathlib import Path
-
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
 
 from database.connection import DatabaseConnection
-from database.models import JobRaw, JobFeatures, ScraperMetrics
-from sqlalchemy import func
+from sqlalchemy import text
 import time
 
-def show_progress():
+# Everything show_progress() prints, fetched in one round-trip. The list
+# sections come back as JSON arrays (decoded to Python lists by psycopg2).
+PROGRESS_QUERY = text("""
+    WITH totals AS (
+        SELECT count(*) AS total_jobs FROM jobs_raw
+    ), features AS (
+        SELECT count(*) AS total_features FROM jobs_features
+    ), cities AS (
+        SELECT city, count(job_id) AS count
+        FROM jobs_raw
+        GROUP BY city
+        ORDER BY count(job_id) DESC
+        LIMIT 15
+    ), recent AS (
+        SELECT title, city, province, created_at
+        FROM jobs_raw
+        ORDER BY created_at DESC
+        LIMIT 10
+    ), metrics AS (
+        SELECT to_char(run_date, 'YYYY-MM-DD HH24:MI') AS run_date, jobs_collected, jobs_valid
+        FROM scraper_metrics
+        ORDER BY run_date DESC
+        LIMIT 5
+    )
+    SELECT
+        totals.total_jobs,
+        features.total_features,
+        (SELECT coalesce(json_agg(json_build_array(city, count) ORDER BY count DESC), '[]') FROM cities),
+        (SELECT coalesce(json_agg(json_build_array(title, city, province) ORDER BY created_at DESC), '[]') FROM recent),
+        (SELECT coalesce(json_agg(json_build_array(run_date, jobs_collected, jobs_valid) ORDER BY run_date DESC), '[]') FROM metrics)
+    FROM totals, features
+""")
+
+
+# Cheap change detector for watch mode: cumulative inserts into jobs_raw
+# from the statistics collector, no table access
+INSERTS_QUERY = text("SELECT n_tup_ins FROM pg_stat_user_tables WHERE relname = 'jobs_raw'")
+
+
+def show_progress(db=None):
     """Show collection progress."""
-    db = DatabaseConnection()
+    db = db or DatabaseConnection()
     
     print("\n" + "="*80)
     print("📊 COLLECTION PROGRESS - TARGET: 5,000+ JOBS")
     print("="*80)
     
     with db.get_session() as session:
-        # Total counts
-        total_jobs = session.query(JobRaw).count()
-        total_features = session.query(JobFeatures).count()
+        # Single aggregated query for counts, cities, recent jobs and metrics
+        total_jobs, total_features, city_counts, recent, metrics = session.execute(PROGRESS_QUERY).one()
         
         # Progress
         target = 5000
@@ -47,26 +79,19 @@ def show_progress():
         
         # City breakdown
         print(f"\n📍 TOP 15 CITIES:")
-        city_counts = session.query(
-            JobRaw.city,
-            func.count(JobRaw.job_id).label('count')
-        ).group_by(JobRaw.city).order_by(func.count(JobRaw.job_id).desc()).limit(15).all()
-        
         for i, (city, count) in enumerate(city_counts, 1):
             print(f"   {i:2d}. {city:20s} {count:4d} jobs")
         
         # Recent jobs
         print(f"\n🆕 RECENT ADDITIONS (last 10):")
-        recent = session.query(JobRaw).order_by(JobRaw.created_at.desc()).limit(10).all()
-        for job in recent:
-            print(f"   • {job.title[:50]:50s} | {job.city}, {job.province}")
+        for title, city, province in recent:
+            print(f"   • {title[:50]:50s} | {city}, {province}")
         
         # Metrics
-        metrics = session.query(ScraperMetrics).order_by(ScraperMetrics.run_date.desc()).limit(5).all()
         if metrics:
             print(f"\n📈 RECENT COLLECTION RUNS:")
-            for m in metrics:
-                print(f"   • {m.run_date.strftime('%Y-%m-%d %H:%M')}: {m.jobs_collected} collected, {m.jobs_valid} new")
+            for run_date, jobs_collected, jobs_valid in metrics:
+                print(f"   • {run_date}: {jobs_collected} collected, {jobs_valid} new")
         
         print("\n" + "="*80)
         
@@ -89,9 +114,18 @@ if __name__ == '__main__':
     
     if args.watch:
         print("📡 WATCH MODE - Press Ctrl+C to stop")
+        db = DatabaseConnection()
+        last_inserts = None
         try:
             while True:
-                show_progress()
+                # Only rebuild the full report when jobs_raw has seen new inserts
+                with db.get_session() as session:
+                    inserts = session.execute(INSERTS_QUERY).scalar()
+                if last_inserts is not None and inserts == last_inserts:
+                    print(f"⏸️  {time.strftime('%H:%M:%S')} - no new jobs since last check")
+                else:
+                    show_progress(db)
+                    last_inserts = inserts
                 time.sleep(args.interval)
         except KeyboardInterrupt:
             print("\n\n👋 Monitoring stopped\n")
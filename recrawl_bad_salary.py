@@ -9,8 +9,13 @@ Usage:
     python recrawl_bad_salary.py [--limit N] [--dry-run]
 
 Options:
-    --limit N   Max jobs to process (default: all)
-    --dry-run   Show what would be updated without writing to DB
+    --limit N        Max jobs to process (default: all)
+    --dry-run        Show what would be updated without writing to DB
+    --concurrency N  Detail pages in flight at once (default: 50); throughput
+                     is set by the shared Job Bank rate limit, not by this
+
+Results are written every UPDATE_BATCH_SIZE rows as they arrive, so an
+interrupted run keeps everything fetched before it stopped.
 """
 
 from utils.logger import setup_logger
@@ -18,11 +23,7 @@ from database.storage import JobStorage
 from database.connection import DatabaseConnection
 from collectors.jobbank_collector import JobBankCollector
 from sqlalchemy import text
-import sys
-from pathlib import Path
-
-src_path = Path(__file__).resolve().parent / "src"
-sys.path.insert(0, str(src_path))
+import asyncio
 
 
 logger = setup_logger(__name__)
@@ -30,6 +31,87 @@ logger = setup_logger(__name__)
 # Jobs with salary_max < this are considered "bad" (hourly misparsed as annual)
 BAD_SALARY_THRESHOLD = 10000
 
+# Job Bank jobs with bad salary, newest first. COALESCE(salary_max, salary_mid)
+# is split into explicit branches so each one can use an index (see
+# idx_jobs_bad_salary_* in sql/schema.sql). LIMIT NULL means no limit.
+BAD_SALARY_QUERY = text("""
+    SELECT job_id, url, title, salary_min, salary_max
+    FROM jobs_raw
+    WHERE source = 'jobbank'
+    AND url IS NOT NULL
+    AND (salary_max < :t
+    OR (salary_max IS NULL AND salary_mid < :t)
+    OR salary_min < :t)
+    ORDER BY posted_date DESC
+    LIMIT :lim
+""")
+
+# Rows sent per batched UPDATE - at the Job Bank rate limit (one page per
+# JOBBANK_RATE_LIMIT_SECONDS) that is a write every few minutes
+UPDATE_BATCH_SIZE = 100
+
+
+async def recrawl(collector, storage, rows, concurrency: int, dry_run: bool, stats: dict):
+    """
+    Fetch detail pages for all rows and write the results as they arrive.
+    
+    At most `concurrency` fetches are in flight; the collector is blocking,
+    so each runs in a worker thread and its own rate limiter still spaces
+    out request starts. Completed rows are flushed with one UPDATE per
+    UPDATE_BATCH_SIZE, and whatever is pending is flushed when the run ends
+    or is interrupted. `stats` counts 'updated' and 'failed' rows.
+    """
+    semaphore = asyncio.BoundedSemaphore(concurrency)
+
+    async def bounded_fetch(row):
+        async with semaphore:
+            try:
+                return row, await asyncio.to_thread(collector.fetch_job_detail, row[1])
+            except Exception as e:
+                return row, e
+
+    pending = []
+
+    def flush():
+        count = storage.update_jobs_description_and_salary(pending, page_size=UPDATE_BATCH_SIZE)
+        stats['updated'] += count
+        stats['failed'] += len(pending) - count
+        pending.clear()
+
+    tasks = [asyncio.ensure_future(bounded_fetch(row)) for row in rows]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            (job_id, url, title, sal_min, sal_max), detail = await next_result
+            if isinstance(detail, Exception):
+                logger.error(f"  Error for {job_id}: {detail}")
+                stats['failed'] += 1
+                continue
+            if not detail:
+                logger.warning(f"  Failed to fetch: {url}")
+                stats['failed'] += 1
+                continue
+
+            desc = detail.get("description", "")
+            new_min = detail.get("salary_min")
+            new_max = detail.get("salary_max")
+            logger.info(
+                f"{'[DRY-RUN] ' if dry_run else ''}{job_id} - {title[:50]}: "
+                f"desc={len(desc)} chars, salary={new_min}-{new_max}")
+
+            if dry_run:
+                stats['updated'] += 1
+                continue
+
+            # Store full description (no truncation)
+            pending.append((job_id, desc, new_min, new_max))
+            if len(pending) >= UPDATE_BATCH_SIZE:
+                flush()
+    finally:
+        for task in tasks:
+            task.cancel()
+        if pending:
+            flush()
+
 
 def main():
     import argparse
@@ -39,6 +121,10 @@ def main():
                         help="Max jobs to process (0=all)")
     parser.add_argument("--dry-run", action="store_true",
                         help="Don't write to DB")
+    parser.add_argument("--concurrency", type=int, default=50,
+                        help="Detail pages in flight at once; throughput is set by "
+                             "the shared Job Bank rate limit "
+                             "(JOBBANK_RATE_LIMIT_SECONDS), not by this")
     args = parser.parse_args()
 
     logger.info("=" * 60)
@@ -51,18 +137,10 @@ def main():
 
     # Find Job Bank jobs with bad salary
     with db.get_session() as session:
-        q = f"""
-            SELECT job_id, url, title, salary_min, salary_max
-            FROM jobs_raw
-            WHERE source = 'jobbank'
-            AND url IS NOT NULL
-            AND (COALESCE(salary_max, salary_mid) < {BAD_SALARY_THRESHOLD}
-            OR (salary_min IS NOT NULL AND salary_min < {BAD_SALARY_THRESHOLD}))
-            ORDER BY posted_date DESC
-        """
-        if args.limit > 0:
-            q += f" LIMIT {args.limit}"
-        rows = session.execute(text(q)).fetchall()
+        rows = session.execute(
+            BAD_SALARY_QUERY,
+            {"t": BAD_SALARY_THRESHOLD, "lim": args.limit if args.limit > 0 else None}
+        ).fetchall()
 
     logger.info(f"Found {len(rows)} Job Bank jobs with bad salary data")
 
@@ -70,48 +148,16 @@ def main():
         logger.info("Nothing to re-crawl.")
         return
 
-    updated = 0
-    failed = 0
+    stats = {'updated': 0, 'failed': 0}
 
-    for job_id, url, title, sal_min, sal_max in rows:
-        logger.info(f"Re-crawling: {job_id} - {title[:50]}...")
-        try:
-            detail = collector.fetch_job_detail(url)
-            if not detail:
-                logger.warning(f"  Failed to fetch: {url}")
-                failed += 1
-                continue
-
-            desc = detail.get("description", "")
-            new_min = detail.get("salary_min")
-            new_max = detail.get("salary_max")
-
-            if args.dry_run:
-                logger.info(
-                    f"  [DRY-RUN] Would update: desc={len(desc)} chars, salary={new_min}-{new_max}")
-                updated += 1
-                continue
-
-            # Store full description (no truncation)
-            success = storage.update_job_description_and_salary(
-                job_id=job_id,
-                description=desc,
-                salary_min=new_min,
-                salary_max=new_max,
-            )
-            if success:
-                updated += 1
-                logger.info(
-                    f"  Updated: desc={len(desc)} chars, salary={new_min}-{new_max}")
-            else:
-                failed += 1
-
-        except Exception as e:
-            logger.error(f"  Error: {e}")
-            failed += 1
+    logger.info(f"Fetching {len(rows)} detail pages ({args.concurrency} in flight)...")
+    try:
+        asyncio.run(recrawl(collector, storage, rows, args.concurrency, args.dry_run, stats))
+    except KeyboardInterrupt:
+        logger.info("\nInterrupted - results fetched so far have been saved")
 
     logger.info("=" * 60)
-    logger.info(f"Done: {updated} updated, {failed} failed")
+    logger.info(f"Done: {stats['updated']} updated, {stats['failed']} failed")
     if args.dry_run:
         logger.info("(Dry run - no changes written)")
 
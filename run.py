@@ -1,18 +1,12 @@
 #!/usr/bin/env python3
 """
 Runner script for Canada Tech Job Compass CLI.
-This properly sets up the Python path and imports.
+Requires the project to be installed (pip install -e .); runs src/main.py,
+which is not installed as a top-level module.
 """
 
-import sys
+import runpy
 from pathlib import Path
 
-# Add src directory to Python path
-repo_root = Path(__file__).resolve().parent
-src_path = repo_root / "src"
-sys.path.insert(0, str(src_path))
-
-# Now import and run the main CLI
 if __name__ == '__main__':
-    from main import cli
-    cli()
+    runpy.run_path(str(Path(__file__).resolve().parent / 'src' / 'main.py'), run_name='__main__')
@@ -173,6 +173,7 @@ CREATE INDEX IF NOT EXISTS idx_jobs_role ON jobs_raw(title);
 CREATE INDEX IF NOT EXISTS idx_jobs_date ON jobs_raw(posted_date);
 CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs_raw(source);
 CREATE INDEX IF NOT EXISTS idx_jobs_province ON jobs_raw(province);
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs_raw(created_at DESC);
 
 -- Composite indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_jobs_city_date ON jobs_raw(city, posted_date);
@@ -182,6 +183,10 @@ CREATE INDEX IF NOT EXISTS idx_jobs_city_role ON jobs_raw(city, title);
 -- Salary range queries
 CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs_raw(salary_mid) WHERE salary_mid IS NOT NULL;
 
+-- Bad-salary re-crawl (recrawl_bad_salary.py): one index per OR branch
+CREATE INDEX IF NOT EXISTS idx_jobs_bad_salary_max ON jobs_raw(salary_max) WHERE source = 'jobbank';
+CREATE INDEX IF NOT EXISTS idx_jobs_bad_salary_min ON jobs_raw(salary_min) WHERE source = 'jobbank';
+
 -- jobs_features indexes
 CREATE INDEX IF NOT EXISTS idx_features_exp_level ON jobs_features(exp_level);
 CREATE INDEX IF NOT EXISTS idx_features_is_junior ON jobs_features(is_junior);
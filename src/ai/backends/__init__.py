@@ -10,6 +10,7 @@ import os
 from typing import Optional
 
 from .base import LLMBackend
+from .cache import CachedBackend
 from .ollama_backend import OllamaBackend
 from .openai_backend import OpenAIBackend
 
@@ -19,6 +20,7 @@ def get_llm_backend(provider: str = None) -> LLMBackend:
     Factory: return LLM backend based on config.
     
     Env: LLM_PROVIDER=ollama|openai (default: ollama)
+         LLM_CACHE_ENABLED=true|false (default: true) - cache responses in SQLite
     
     Returns:
         LLMBackend instance
@@ -26,9 +28,16 @@ def get_llm_backend(provider: str = None) -> LLMBackend:
     provider = (provider or os.getenv("LLM_PROVIDER", "ollama")).lower()
     
     if provider == "ollama":
-        return OllamaBackend()
-    if provider == "openai":
-        return OpenAIBackend()
+        backend = OllamaBackend()
+    elif provider == "openai":
+        backend = OpenAIBackend()
+    else:
+        backend = None
+    
+    if backend is not None:
+        if os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true":
+            return CachedBackend(backend)
+        return backend
     
     raise ValueError(
         f"Unknown LLM_PROVIDER={provider}. "
@@ -36,4 +45,4 @@ def get_llm_backend(provider: str = None) -> LLMBackend:
     )
 
 
-__all__ = ["LLMBackend", "OllamaBackend", "OpenAIBackend", "get_llm_backend"]
+__all__ = ["LLMBackend", "CachedBackend", "OllamaBackend", "OpenAIBackend", "get_llm_backend"]
@@ -1,7 +1,8 @@
 """Base class for LLM backends - plug-and-play with Ollama, OpenAI, etc."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 
 
 class LLMBackend(ABC):
@@ -20,3 +21,21 @@ class LLMBackend(ABC):
             Assistant response text
         """
         pass
+
+    async def achat(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> str:
+        """
+        Async chat() for use with asyncio.gather.
+        
+        Backends with a native async client override this; the default runs
+        chat() in a worker thread.
+        """
+        return await asyncio.to_thread(self.chat, messages, temperature)
+
+    def chat_stream(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> Iterator[str]:
+        """
+        Yield the assistant reply in chunks as they arrive.
+        
+        Closing the generator early (e.g. once a verdict is known) stops the
+        underlying request. The default yields chat() as a single chunk.
+        """
+        yield self.chat(messages, temperature)
@@ -0,0 +1,138 @@
+"""Persistent response cache for LLM backends - repeat questions skip the network round-trip."""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Iterator, Optional
+
+from .base import LLMBackend
+
+# A validator reply that says yes - the caller stops streaming right after it
+_VALID_YES_RE = re.compile(r"VALID:\s*YES", re.IGNORECASE)
+
+
+class CachedBackend(LLMBackend):
+    """
+    Wrap any LLMBackend with an exact-match SQLite cache of chat() responses.
+
+    Key = SHA-256 of (backend class, model, temperature, normalized messages).
+    Only the first user turn - the natural-language question - is normalized:
+    whitespace is collapsed and case folded, so "Data analyst jobs in  Toronto"
+    and "data analyst jobs in toronto" share an entry. Later user turns and
+    assistant turns (SQL, feedback) are hashed exactly as sent, so queries
+    differing only inside a string literal never collide. Entries older than
+    ttl_hours are ignored and overwritten.
+    """
+
+    def __init__(self, inner: LLMBackend, db_path: str = None, ttl_hours: float = None):
+        self.inner = inner
+        self.model = getattr(inner, "model", None)
+        self.db_path = db_path or os.getenv("LLM_CACHE_PATH", os.path.join("cache", "llm_cache.sqlite3"))
+        self.ttl_seconds = 3600 * (ttl_hours if ttl_hours is not None else float(os.getenv("LLM_CACHE_TTL_HOURS", "168")))
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, response TEXT, created REAL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _key(self, messages: List[Dict[str, str]], temperature: float) -> str:
+        normalized = []
+        question_seen = False
+        for m in messages:
+            content = m.get("content") or ""
+            if m.get("role") == "system":
+                # System prompts are large and constant - digest them once
+                content = _system_digest(content)
+            elif m.get("role") == "user" and not question_seen:
+                content = " ".join(content.split()).lower()
+                question_seen = True
+            normalized.append([m.get("role"), content])
+        payload = json.dumps([type(self.inner).__name__, self.model, temperature, normalized])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def chat(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> str:
+        key = self._key(messages, temperature)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        resp = self.inner.chat(messages, temperature=temperature)
+        if resp:
+            self._put(key, resp)
+        return resp
+
+    def chat_stream(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> Iterator[str]:
+        key = self._key(messages, temperature)
+        cached = self._get(key)
+        if cached is not None:
+            yield cached
+            return
+        parts = []
+        complete = False
+        try:
+            for chunk in self.inner.chat_stream(messages, temperature=temperature):
+                parts.append(chunk)
+                yield chunk
+            complete = True
+        finally:
+            resp = "".join(parts).strip()
+            if complete:
+                if resp:
+                    self._put(key, resp)
+            elif _VALID_YES_RE.search(resp):
+                # Closed early at a positive validator verdict - cache the
+                # verdict itself, never any other truncated reply
+                self._put(key, "VALID: YES")
+
+    async def achat(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> str:
+        key = self._key(messages, temperature)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        resp = await self.inner.achat(messages, temperature=temperature)
+        if resp:
+            self._put(key, resp)
+        return resp
+
+    def _get(self, key: str) -> Optional[str]:
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT response, created FROM kv WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row and time.time() - row[1] < self.ttl_seconds:
+            return row[0]
+        return None
+
+    def _put(self, key: str, response: str):
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO kv (key, response, created) VALUES (?, ?, ?)",
+                    (key, response, time.time()),
+                )
+                conn.commit()
+        except sqlite3.Error:
+            pass  # Cache is best-effort; never fail the query because of it
+
+
+@lru_cache(maxsize=32)
+def _system_digest(content: str) -> str:
+    """Whitespace-normalized SHA-256 of a system prompt, memoized per prompt text."""
+    return hashlib.sha256(" ".join(content.split()).encode("utf-8")).hexdigest()
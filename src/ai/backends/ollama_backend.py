@@ -1,10 +1,15 @@
 """Ollama backend - cloud (Ollama.com) or local. Cloud preferred when OLLAMA_API_KEY is set."""
 
 import os
-from typing import List, Dict
+from typing import List, Dict, Iterator
 
 from .base import LLMBackend
 
+try:
+    import ollama
+except ImportError:
+    ollama = None
+
 OLLAMA_CLOUD_HOST = "https://ollama.com"
 # Cloud models: llama3.2 not on cloud. Use qwen3-next:80b, ministral-3:8b, etc. See ollama.com/search?c=cloud
 OLLAMA_CLOUD_DEFAULT_MODEL = "qwen3-next:80b"
@@ -25,16 +30,47 @@ class OllamaBackend(LLMBackend):
         else:
             self.host = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
             self.headers = {}
+        self._client = None
+        self._aclient = None
 
-    def chat(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> str:
-        try:
-            import ollama
-        except ImportError:
+    def _client_kwargs(self) -> Dict:
+        if ollama is None:
             raise ImportError("Install ollama: pip install ollama")
-
         kwargs = {"host": self.host}
         if self.headers:
             kwargs["headers"] = self.headers
-        client = ollama.Client(**kwargs)
-        resp = client.chat(model=self.model, messages=messages, options={"temperature": temperature})
+        return kwargs
+
+    def _get_client(self):
+        """Create the ollama client on first use and reuse it (keeps the HTTP connection alive)."""
+        if self._client is None:
+            self._client = ollama.Client(**self._client_kwargs())
+        return self._client
+
+    def _get_async_client(self):
+        """Create the ollama AsyncClient on first use and reuse it."""
+        if self._aclient is None:
+            self._aclient = ollama.AsyncClient(**self._client_kwargs())
+        return self._aclient
+
+    def chat(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> str:
+        resp = self._get_client().chat(model=self.model, messages=messages, options={"temperature": temperature})
+        return (resp.get("message", {}).get("content") or "").strip()
+
+    def chat_stream(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> Iterator[str]:
+        stream = self._get_client().chat(
+            model=self.model, messages=messages, options={"temperature": temperature}, stream=True
+        )
+        try:
+            for chunk in stream:
+                content = chunk.get("message", {}).get("content")
+                if content:
+                    yield content
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()  # Drop the HTTP response if the caller stopped early
+
+    async def achat(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> str:
+        resp = await self._get_async_client().chat(model=self.model, messages=messages, options={"temperature": temperature})
         return (resp.get("message", {}).get("content") or "").strip()
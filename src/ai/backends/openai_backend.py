@@ -1,10 +1,17 @@
 """OpenAI backend - cloud API."""
 
+import hashlib
 import os
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Iterator
 
 from .base import LLMBackend
 
+try:
+    from openai import OpenAI, AsyncOpenAI
+except ImportError:
+    OpenAI = AsyncOpenAI = None
+
 
 class OpenAIBackend(LLMBackend):
     """Use OpenAI API. Requires OPENAI_API_KEY."""
@@ -14,13 +21,60 @@ class OpenAIBackend(LLMBackend):
         self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not set in .env")
+        self._client = None
+        self._aclient = None
+
+    def _get_client(self):
+        """Create the OpenAI client on first use and reuse it (keeps its connection pool warm)."""
+        if self._client is None:
+            if OpenAI is None:
+                raise ImportError("Install openai: pip install openai")
+            self._client = OpenAI(api_key=self.api_key)
+        return self._client
+
+    def _get_async_client(self):
+        """Create the AsyncOpenAI client on first use and reuse it."""
+        if self._aclient is None:
+            if AsyncOpenAI is None:
+                raise ImportError("Install openai: pip install openai")
+            self._aclient = AsyncOpenAI(api_key=self.api_key)
+        return self._aclient
+
+    def _request(self, messages: List[Dict[str, str]], temperature: float) -> Dict:
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "extra_body": self._cache_routing(messages),
+        }
 
     def chat(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> str:
-        from openai import OpenAI
-        client = OpenAI(api_key=self.api_key)
-        r = client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=temperature,
-        )
+        r = self._get_client().chat.completions.create(**self._request(messages, temperature))
+        return (r.choices[0].message.content or "").strip()
+
+    def chat_stream(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> Iterator[str]:
+        stream = self._get_client().chat.completions.create(**self._request(messages, temperature), stream=True)
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            stream.close()  # Drop the HTTP response if the caller stopped early
+
+    async def achat(self, messages: List[Dict[str, str]], temperature: float = 0.1) -> str:
+        r = await self._get_async_client().chat.completions.create(**self._request(messages, temperature))
         return (r.choices[0].message.content or "").strip()
+
+    @staticmethod
+    def _cache_routing(messages: List[Dict[str, str]]) -> Dict[str, str]:
+        """Route requests sharing a system prompt to the same prompt cache."""
+        system = next((m["content"] for m in messages if m.get("role") == "system"), "")
+        if not system:
+            return {}
+        return {"prompt_cache_key": _prompt_digest(system)}
+
+
+@lru_cache(maxsize=32)
+def _prompt_digest(text: str) -> str:
+    """Hash a system prompt once - the same few prompts are sent on every call."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
@@ -9,7 +9,12 @@ User asks e.g. "Find me Data Analyst jobs in Toronto"
 """
 
 import os
-from typing import Tuple, Optional
+import re
+import textwrap
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
 
 from .backends import get_llm_backend
 
@@ -46,26 +51,21 @@ Always add ORDER BY jr.posted_date DESC and LIMIT 100.
 """
 
 
-def _get_llm():
-    """Get configured LLM backend (Ollama or OpenAI)."""
-    return get_llm_backend()
+def _compact(text: str) -> str:
+    """Drop common indentation, trailing spaces and extra blank lines - they cost tokens, not meaning."""
+    text = textwrap.dedent(text).strip()
+    text = re.sub(r"[ \t]+$", "", text, flags=re.M)
+    return re.sub(r"\n{3,}", "\n\n", text)
 
 
-def generate_sql(user_query: str, feedback: Optional[str] = None) -> str:
-    """
-    Convert user natural language to PostgreSQL SELECT query.
-    
-    Args:
-        user_query: e.g. "Find me Data Analyst jobs in Toronto"
-        feedback: If validation failed, feedback from validator
-        
-    Returns:
-        SQL SELECT query string
-    """
-    llm = _get_llm()
-    
-    sys_msg = f"""You are a SQL expert. Convert the user's question into a PostgreSQL query.
-{SCHEMA}
+# Normalized once at import so the prompt prefix stays byte-stable
+SCHEMA = _compact(SCHEMA)
+
+# System prompts are built once so every request starts with byte-identical
+# text - provider-side prompt caches only reuse an exact prefix.
+_SYS_MSG_SQL = """You are a SQL expert. Convert the user's question into a PostgreSQL query.
+
+""" + SCHEMA + """
 
 RULES:
 - Output ONLY valid SQL, no markdown, no explanation.
@@ -89,25 +89,186 @@ SELECT jr.title, jr.company, jr.city, jr.province, jr.source, jr.posted_date, jr
 FROM jobs_raw jr
 WHERE (jr.remote_type IN ('remote','hybrid') OR jr.title ILIKE '%remote%') AND jr.title ILIKE '%Python%'
 ORDER BY jr.posted_date DESC NULLS LAST LIMIT 100;"""
+
+_SYS_MSG_VALIDATOR = """You are a SQL validation agent. Given a user question and a SQL query, determine if the query correctly implements the user's intent.
+Answer in exact format:
+VALID: yes
+OR
+VALID: no
+FEEDBACK: [brief explanation of what's wrong and how to fix]"""
+
+
+# Statements a generated query must never contain (whole words, so
+# columns like updated_at don't trip it)
+_FORBIDDEN_RE = re.compile(r"\b(DROP|DELETE|UPDATE|INSERT|TRUNCATE|ALTER|GRANT|REVOKE)\b")
+# Markdown fence lines such as ```sql and the closing ```
+_FENCE_RE = re.compile(r"^[ \t]*```[^\n]*(?:\n|\Z)", re.M)
+_WORD_RE = re.compile(r"[a-z0-9+#.]+")
+# Words that carry no filter of their own, so needn't appear in the SQL
+_QUERY_STOPWORDS = frozenset("""
+    a an and any all are at by find for from get give i in is it jobs job list me my
+    of on or please posted posting postings role roles show that the to what which
+    with within
+""".split())
+# SQL syntax words: a question word only counts as covered when it shows up
+# as an identifier or literal, never by matching e.g. the NOT of IS NOT NULL
+_SQL_KEYWORDS = frozenset("""
+    select from where and or not in is null like ilike between order by group having
+    limit offset desc asc as on join left right inner outer distinct case when then
+    else end count sum avg min max coalesce interval current_date now true false
+""".split())
+# Questions that exclude something need the validator to check the direction
+_NEGATION_WORDS = frozenset("not no except without excluding exclude outside".split())
+_VALID_RE = re.compile(r"VALID:\s*(YES|NO)", re.IGNORECASE)
+_OUTPUT_RE = re.compile(r"Output #(\d+):\s*(.+?)(?=Output #\d+:|\Z)", re.S)
+
+
+@lru_cache(maxsize=1)
+def _get_llm():
+    """
+    Get configured LLM backend (Ollama or OpenAI).
+    
+    Resolved once per process so its HTTP clients and cache connection are
+    reused; call _get_llm.cache_clear() after changing LLM_* env vars.
+    """
+    return get_llm_backend()
+
+
+def generate_sql(user_query: str, feedback: Optional[str] = None, temperature: float = 0.1) -> str:
+    """
+    Convert user natural language to PostgreSQL SELECT query.
     
-    user_msg = user_query
+    Args:
+        user_query: e.g. "Find me Data Analyst jobs in Toronto"
+        feedback: If validation failed, feedback from validator
+        temperature: Sampling temperature (varied by parallel attempts)
+        
+    Returns:
+        SQL SELECT query string
+    """
+    llm = _get_llm()
+    
+    messages = [
+        {"role": "system", "content": _SYS_MSG_SQL},
+        {"role": "user", "content": user_query},
+    ]
     if feedback:
-        user_msg = f"Previous query was wrong. Feedback: {feedback}\n\nOriginal question: {user_query}\n\nGenerate a corrected SQL query."
-    
-    sql = llm.chat(
-        messages=[
-            {"role": "system", "content": sys_msg},
-            {"role": "user", "content": user_msg},
-        ],
-        temperature=0.1,
-    )
-    # Extract SQL if wrapped in markdown
+        # Feedback goes in a new turn so the system prompt and question stay unchanged
+        messages.append({
+            "role": "user",
+            "content": f"Previous query was wrong. Feedback: {feedback}\n\nGenerate a corrected SQL query.",
+        })
+    
+    sql = llm.chat(messages=messages, temperature=temperature)
+    return _strip_fences(sql)
+
+
+def _strip_fences(sql: str) -> str:
+    """Extract SQL if wrapped in markdown."""
     if sql.startswith("```"):
-        lines = sql.split("\n")
-        sql = "\n".join(l for l in lines if not l.strip().startswith("```"))
+        sql = _FENCE_RE.sub("", sql).strip()
     return sql
 
 
+def _generate_sql_chunk(queries: List[str]) -> Dict[int, str]:
+    """Ask for every query in one prompt; return {index: sql} for the slots that parsed."""
+    if len(queries) == 1:
+        return {0: generate_sql(queries[0])}
+    
+    instances = "\n".join(f"Instance #{i}: {q}" for i, q in enumerate(queries, 1))
+    messages = [
+        {"role": "system", "content": _SYS_MSG_SQL},
+        {"role": "user", "content": (
+            f"Convert each instance below into its own SQL query.\n\n{instances}\n\n"
+            f"Respond with one line 'Output #i:' followed by the SQL for each of the "
+            f"{len(queries)} instances, in order."
+        )},
+    ]
+    resp = _get_llm().chat(messages=messages, temperature=0.1)
+    
+    results = {}
+    for num, sql in _OUTPUT_RE.findall(resp or ""):
+        idx = int(num) - 1
+        sql = _strip_fences(sql.strip()).strip()
+        if 0 <= idx < len(queries) and sql.upper().startswith("SELECT"):
+            results[idx] = sql
+    return results
+
+
+def generate_sql_batch(queries: List[str], batch_size: int = 8, max_workers: int = 4) -> List[Optional[str]]:
+    """
+    Generate SQL for many questions, packing batch_size of them into each
+    LLM call so the schema prompt is paid once per batch, not per question.
+    
+    Batches run concurrently. Questions whose slot is missing or unparseable
+    are retried in batches half the size, down to single generate_sql() calls.
+    Results are not validated; pass them through validate_query() as needed.
+    
+    Args:
+        queries: Natural-language questions
+        batch_size: Questions per LLM call
+        max_workers: Batches in flight at once
+        
+    Returns:
+        SQL per question, in input order (None if generation failed)
+    """
+    results: List[Optional[str]] = [None] * len(queries)
+    remaining = list(range(len(queries)))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while remaining:
+            chunks = [remaining[i:i + batch_size] for i in range(0, len(remaining), batch_size)]
+            futures = {executor.submit(_generate_sql_chunk, [queries[i] for i in chunk]): chunk for chunk in chunks}
+            failed = []
+            for future, chunk in futures.items():
+                try:
+                    parsed = future.result()
+                except Exception:
+                    parsed = {}
+                for pos, idx in enumerate(chunk):
+                    if pos in parsed:
+                        results[idx] = parsed[pos]
+                    else:
+                        failed.append(idx)
+            if batch_size == 1:
+                break
+            remaining = failed
+            batch_size = max(1, batch_size // 2)
+    
+    return results
+
+
+def _structural_ok(sql: str, user_query: str) -> bool:
+    """
+    Cheap deterministic check that lets validate_query skip the LLM call.
+    
+    Passes only when the query has the expected shape (SELECT ... FROM
+    jobs_raw ... ORDER BY ... LIMIT) and every meaningful word of the
+    question (role, city, province, numbers) appears as a whole identifier
+    or literal word in the SQL. Questions with a negation ("not in
+    Toronto") never pass, since a matching word says nothing about which
+    way the filter goes. Anything looser - e.g. "last week" rewritten as
+    INTERVAL '7 days' - falls through to the LLM validator.
+    """
+    s = sql.lower()
+    if not s.lstrip().startswith("select"):
+        return False
+    if "from jobs_raw" not in s or "order by" not in s or "limit" not in s:
+        return False
+    words = [w.strip(".") for w in _WORD_RE.findall(user_query.lower())]
+    if _NEGATION_WORDS.intersection(words):
+        return False
+    keywords = [w for w in words if w and w not in _QUERY_STOPWORDS]
+
+    # Whole tokens only, with qualified names (jr.city) split into parts
+    tokens = set()
+    for token in _WORD_RE.findall(s):
+        tokens.add(token.strip("."))
+        tokens.update(token.split("."))
+    tokens -= _SQL_KEYWORDS
+    return bool(keywords) and all(kw in tokens for kw in keywords)
+
+
 def validate_query(user_query: str, sql: str) -> Tuple[bool, str]:
     """
     Validation agent: check if generated SQL correctly implements user intent.
@@ -119,27 +280,33 @@ def validate_query(user_query: str, sql: str) -> Tuple[bool, str]:
     s = sql.strip().upper()
     if not s.startswith("SELECT"):
         return False, "Query must be SELECT only."
-    for bad in ("DROP", "DELETE", "UPDATE", "INSERT", "TRUNCATE"):
-        if bad in s:
-            return False, f"Query contains forbidden operation: {bad}"
+    bad = _FORBIDDEN_RE.search(s)
+    if bad:
+        return False, f"Query contains forbidden operation: {bad.group(1)}"
+
+    if os.getenv("LLM_STRUCTURAL_CHECK", "false").lower() == "true" and _structural_ok(sql, user_query):
+        return True, ""
     
     llm = _get_llm()
     
-    resp = llm.chat(
-        messages=[
-            {"role": "system", "content": """You are a SQL validation agent. Given a user question and a SQL query, determine if the query correctly implements the user's intent.
-Answer in exact format:
-VALID: yes
-OR
-VALID: no
-FEEDBACK: [brief explanation of what's wrong and how to fix]"""},
-            {"role": "user", "content": f"User question: {user_query}\n\nGenerated SQL:\n{sql}"},
-        ],
-        temperature=0,
-    )
-    resp = (resp or "").strip().upper()
-    if "VALID: YES" in resp:
-        return True, ""
+    messages = [
+        {"role": "system", "content": _SYS_MSG_VALIDATOR},
+        # Question and SQL in separate turns: the response cache normalizes the
+        # question but must hash the SQL verbatim
+        {"role": "user", "content": f"User question: {user_query}"},
+        {"role": "user", "content": f"Generated SQL:\n{sql}"},
+    ]
+    # Stream the verdict: "VALID: yes" arrives in the first few tokens, so
+    # stop there instead of waiting for the rest of the reply. A verdict can
+    # only complete in the tail of the text so far, so only that is searched
+    reply = ""
+    with closing(llm.chat_stream(messages=messages, temperature=0)) as stream:
+        for chunk in stream:
+            match = _VALID_RE.search(reply[-32:] + chunk)
+            reply += chunk
+            if match and match.group(1).upper() == "YES":
+                return True, ""
+    resp = reply.strip().upper()
     feedback = ""
     if "FEEDBACK:" in resp:
         feedback = resp.split("FEEDBACK:", 1)[-1].strip()
@@ -150,9 +317,15 @@ def nl_to_sql_and_validate(user_query: str, max_attempts: int = 3) -> Tuple[Opti
     """
     Generate SQL from natural language with validation loop.
     
+    Set LLM_PARALLEL_ATTEMPTS=true to use nl_to_sql_parallel() instead; leave
+    it off for rate-limited providers.
+    
     Returns:
         (sql, error) - sql if success, error message if failed
     """
+    if os.getenv("LLM_PARALLEL_ATTEMPTS", "false").lower() == "true":
+        return nl_to_sql_parallel(user_query, k=max_attempts)
+    
     sql = None
     feedback = None
     
@@ -164,3 +337,47 @@ def nl_to_sql_and_validate(user_query: str, max_attempts: int = 3) -> Tuple[Opti
         # Re-iterate with feedback
     
     return sql, f"Could not generate valid query after {max_attempts} attempts. Last feedback: {feedback}"
+
+
+# Temperatures for speculative attempts, cycled when k exceeds the list
+PARALLEL_TEMPERATURES = (0.0, 0.2, 0.4)
+
+
+def _generate_and_validate(user_query: str, temperature: float) -> Tuple[str, bool, str]:
+    sql = generate_sql(user_query, temperature=temperature)
+    ok, feedback = validate_query(user_query, sql)
+    return sql, ok, feedback
+
+
+def nl_to_sql_parallel(user_query: str, k: int = 3) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Speculative variant of nl_to_sql_and_validate: run k generate+validate
+    attempts at once (varied temperatures) and return the first valid SQL.
+    
+    Latency is one generate+validate round instead of up to k in sequence,
+    at the cost of k times the LLM calls.
+    
+    Returns:
+        (sql, error) - sql if success, error message if failed
+    """
+    temperatures = [PARALLEL_TEMPERATURES[i % len(PARALLEL_TEMPERATURES)] for i in range(k)]
+    executor = ThreadPoolExecutor(max_workers=k)
+    pending = {executor.submit(_generate_and_validate, user_query, t) for t in temperatures}
+    sql, feedback = None, None
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    candidate, ok, fb = future.result()
+                except Exception as e:
+                    feedback = str(e)
+                    continue
+                if ok:
+                    return candidate, None
+                sql, feedback = candidate, fb
+    finally:
+        # Don't wait for slower attempts once we have an answer
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return sql, f"Could not generate valid query after {k} parallel attempts. Last feedback: {feedback}"
@@ -1,6 +1,6 @@
 """Collectors package for Canada Tech Job Compass."""
 
-from .base_collector import BaseCollector
+from .base_collector import BaseCollector, JobRecord
 from .jobbank_collector import JobBankCollector
 from .rapidapi_collector import RapidAPICollector
 from .jsearch_collector import JSearchCollector
@@ -10,6 +10,7 @@ from .rss_collectors import IndeedRSSCollector, WorkopolisRSSCollector
 
 __all__ = [
     'BaseCollector',
+    'JobRecord',
     'JobBankCollector',
     'RapidAPICollector',
     'JSearchCollector',
@@ -5,14 +5,43 @@ Register at https://developer.adzuna.com/ for free API keys.
 Set ADZUNA_APP_ID and ADZUNA_APP_KEY in .env.
 """
 
-import hashlib
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlparse
 
 import requests
 
-from .base_collector import BaseCollector
-from utils import Config, retry_on_exception
+from .base_collector import BaseCollector, REMOTE_KEYWORDS, parse_json, short_hash
+from utils import Config, retry_on_exception, host_rate_limiter, RateLimitedError, ConditionalCache
+
+# Lookup tables built once at import rather than on every call
+_PROVINCE_BY_CITY = {
+    'toronto': 'ON', 'ottawa': 'ON', 'mississauga': 'ON', 'hamilton': 'ON',
+    'calgary': 'AB', 'edmonton': 'AB',
+    'vancouver': 'BC', 'victoria': 'BC', 'surrey': 'BC',
+    'saskatoon': 'SK', 'regina': 'SK',
+    'winnipeg': 'MB',
+    'montreal': 'QC', 'quebec city': 'QC', 'laval': 'QC',
+}
+
+_PROVINCE_BY_NAME = {
+    'ontario': 'ON', 'on': 'ON',
+    'alberta': 'AB', 'ab': 'AB',
+    'british columbia': 'BC', 'bc': 'BC', 'b.c.': 'BC',
+    'quebec': 'QC', 'qc': 'QC', 'québec': 'QC',
+    'manitoba': 'MB', 'mb': 'MB',
+    'saskatchewan': 'SK', 'sk': 'SK',
+    'nova scotia': 'NS', 'ns': 'NS',
+    'new brunswick': 'NB', 'nb': 'NB',
+}
+
+
+@lru_cache(maxsize=1024)
+def _province_for_city(city: str) -> str:
+    """Province code for a city; memoized since the same few cities repeat on every page."""
+    return _PROVINCE_BY_CITY.get((city or '').lower().strip(), '')
 
 
 class AdzunaCollector(BaseCollector):
@@ -33,9 +62,16 @@ class AdzunaCollector(BaseCollector):
                 "Register at https://developer.adzuna.com/"
             )
 
+        # Shared session so page fetches reuse pooled keep-alive connections;
+        # sized for collect_many() searches x concurrent pages
+        self.session = self._create_session(pool_maxsize=16)
+        # ETag/Last-Modified per search page, so unchanged pages come back as 304
+        self.http_cache = ConditionalCache() if Config.CACHE_ENABLED else None
+
     @retry_on_exception(
-        exceptions=(requests.Timeout, requests.ConnectionError),
-        max_attempts=Config.MAX_RETRIES
+        exceptions=(requests.Timeout, requests.ConnectionError, RateLimitedError),
+        max_attempts=Config.MAX_RETRIES,
+        return_none=True
     )
     def _fetch_page(self, role: str, city: str, page: int) -> Optional[Dict]:
         """Fetch one page from Adzuna API."""
@@ -52,18 +88,37 @@ class AdzunaCollector(BaseCollector):
                 'results_per_page': 20,
                 'content-type': 'application/json',
             }
-            response = requests.get(url, params=params, timeout=Config.JOBBANK_REQUEST_TIMEOUT)
+            cache_key = f"{url}?what={role}&where={city}"
+            host = urlparse(url).netloc
+
+            def get(headers: Dict[str, str]):
+                host_rate_limiter.acquire(host)
+                return self.session.get(url, params=params, headers=headers, timeout=Config.JOBBANK_REQUEST_TIMEOUT)
+
+            body = None
+            if self.http_cache:
+                response = get(self.http_cache.conditional_headers(cache_key))
+                body, response = self.http_cache.body_or_refetch(cache_key, response, lambda: get({}))
+            else:
+                response = get({})
+            retry_after = host_rate_limiter.update_from_headers(host, response.headers)
+            if body:
+                return parse_json(body)
 
             if response.status_code == 401:
                 self.logger.error("Adzuna API auth failed - check ADZUNA_APP_ID and ADZUNA_APP_KEY")
                 return None
             if response.status_code == 429:
                 self.logger.warning("Adzuna API rate limit reached")
-                return None
+                raise RateLimitedError(host, retry_after)
 
             response.raise_for_status()
-            return response.json()
+            if self.http_cache:
+                self.http_cache.store(cache_key, response)
+            return parse_json(response.content)
 
+        except RateLimitedError:
+            raise
         except Exception as e:
             self.logger.error(f"Adzuna API error: {e}")
             return None
@@ -73,18 +128,32 @@ class AdzunaCollector(BaseCollector):
         self.logger.info(f"Fetching Adzuna: {role} in {city}")
 
         all_jobs = []
-        for page in range(1, max_pages + 1):
-            data = self._fetch_page(role, city, page)
-            if not data:
-                break
-
+        # Same for every row of this search - work out once, not per job
+        today = datetime.now().date().isoformat()
+        default_province = self._infer_province(city)
+
+        # Fetch all pages at once (the host rate limiter still paces them),
+        # then walk them in order so an empty page ends the search as before
+        with ThreadPoolExecutor(max_workers=max(1, max_pages)) as executor:
+            futures = [
+                executor.submit(self._fetch_page, role, city, page)
+                for page in range(1, max_pages + 1)
+            ]
+            pages = []
+            for future in futures:
+                data = future.result()
+                if not data:
+                    break
+                pages.append(data)
+
+        for data in pages:
             results = data.get('results', [])
             if not results:
                 break
 
             for item in results:
                 try:
-                    job = self._parse_job(item, city)
+                    job = self._parse_job(item, city, today, default_province)
                     if job:
                         all_jobs.append(job)
                 except Exception as e:
@@ -94,8 +163,17 @@ class AdzunaCollector(BaseCollector):
         self.logger.info(f"Collected {len(all_jobs)} jobs from Adzuna")
         return all_jobs
 
-    def _parse_job(self, data: Dict, default_city: str) -> Optional[Dict[str, Any]]:
-        """Parse Adzuna job result."""
+    def _parse_job(self, data: Dict, default_city: str, today: str = None,
+                   default_province: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Parse Adzuna job result.
+        
+        Args:
+            data: One item from the API's results list
+            default_city: City searched for, used when the item has none
+            today: Fallback posted date (ISO); computed if not given
+            default_province: Province of default_city; computed if not given
+        """
         try:
             title = data.get('title', '').strip()
             if not title:
@@ -120,12 +198,12 @@ class AdzunaCollector(BaseCollector):
                 if not province:
                     province = self._province_from_area(location)
             if not province:
-                province = self._infer_province(default_city)
+                province = default_province if default_province is not None else self._infer_province(default_city)
 
             job_id_raw = data.get('id')
             if not job_id_raw:
                 link = data.get('redirect_url', data.get('link', ''))
-                job_id_raw = hashlib.md5(link.encode()).hexdigest()[:12] if link else None
+                job_id_raw = short_hash(link) if link else None
             if not job_id_raw:
                 return None
 
@@ -135,7 +213,7 @@ class AdzunaCollector(BaseCollector):
                 salary_min, salary_max = salary_max, salary_min
 
             created = data.get('created')
-            posted_date = datetime.now().date().isoformat()
+            posted_date = today or datetime.now().date().isoformat()
             if created:
                 try:
                     if 'T' in str(created):
@@ -171,32 +249,13 @@ class AdzunaCollector(BaseCollector):
 
     def _infer_province(self, city: str) -> str:
         """Infer province from city name."""
-        province_map = {
-            'toronto': 'ON', 'ottawa': 'ON', 'mississauga': 'ON', 'hamilton': 'ON',
-            'calgary': 'AB', 'edmonton': 'AB',
-            'vancouver': 'BC', 'victoria': 'BC', 'surrey': 'BC',
-            'saskatoon': 'SK', 'regina': 'SK',
-            'winnipeg': 'MB',
-            'montreal': 'QC', 'quebec city': 'QC', 'laval': 'QC',
-        }
-        return province_map.get((city or '').lower().strip(), '')
+        return _province_for_city(city)
 
     def _province_from_name(self, name: str) -> str:
         """Map province/region name to 2-letter code."""
         if not name:
             return ''
-        n = str(name).lower().strip()
-        map = {
-            'ontario': 'ON', 'on': 'ON',
-            'alberta': 'AB', 'ab': 'AB',
-            'british columbia': 'BC', 'bc': 'BC', 'b.c.': 'BC',
-            'quebec': 'QC', 'qc': 'QC', 'québec': 'QC',
-            'manitoba': 'MB', 'mb': 'MB',
-            'saskatchewan': 'SK', 'sk': 'SK',
-            'nova scotia': 'NS', 'ns': 'NS',
-            'new brunswick': 'NB', 'nb': 'NB',
-        }
-        return map.get(n, '')
+        return _PROVINCE_BY_NAME.get(str(name).lower().strip(), '')
 
     def _province_from_area(self, location: dict) -> str:
         """Extract province from Adzuna location.area array."""
@@ -212,7 +271,7 @@ class AdzunaCollector(BaseCollector):
     def _detect_remote(self, text: str) -> Optional[str]:
         """Detect remote work from text."""
         text_lower = (text or '').lower()
-        if any(k in text_lower for k in ['remote', 'work from home', 'wfh', 'distributed']):
+        if any(k in text_lower for k in REMOTE_KEYWORDS):
             if 'hybrid' in text_lower:
                 return 'hybrid'
             return 'remote'
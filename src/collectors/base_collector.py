@@ -3,13 +3,195 @@ Base collector class - Abstract base for all job collectors.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, Union
+import hashlib
+import json
 import logging
+import time
+from urllib.parse import urlencode
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional HTTP/2 client: concurrent fetches multiplex over one connection
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+except ImportError:
+    httpx = None
+
+# Optional faster JSON parser for API responses
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from utils import Config, ConditionalCache, host_rate_limiter
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Phrases that mark a posting as remote, matched as lowercase substrings.
+# Substring checks (str.find's fast search) beat a regex alternation here:
+# the remote scan dominates per-job parse time on long descriptions
+REMOTE_KEYWORDS = ('remote', 'work from home', 'wfh', 'distributed')
+
+
+def short_hash(text: str, length: int = 12) -> str:
+    """
+    Stable short id for a URL or path, used when a source gives no job id.
+    
+    Stays MD5 on purpose: these digests are stored in job_id, and changing
+    the algorithm would re-key every existing row and defeat deduplication.
+    
+    Args:
+        text: String to hash (usually the job URL)
+        length: Number of hex characters to keep
+        
+    Returns:
+        First `length` hex characters of the digest
+    """
+    return hashlib.md5(text.encode(), usedforsecurity=False).hexdigest()[:length]
+
+
+if httpx is not None:
+    class _RetryTransport(httpx.HTTPTransport):
+        """
+        httpx transport that applies a urllib3 Retry like the session adapters do.
+        
+        httpx's own `retries` only covers failed connects, so without this an
+        HTTP/2 client gave up on the first timeout or 5xx the requests path
+        would have retried. Requests with an allowed method are re-sent on
+        timeouts, network errors and status_forcelist responses, with
+        exponential backoff.
+        """
+        
+        def __init__(self, retry: Retry, **kwargs):
+            super().__init__(**kwargs)
+            self.retry = retry
+        
+        def handle_request(self, request: 'httpx.Request') -> 'httpx.Response':
+            retry = self.retry
+            if retry.allowed_methods is not None and request.method not in retry.allowed_methods:
+                return super().handle_request(request)
+            status_forcelist = retry.status_forcelist or ()
+            for attempt in range(retry.total + 1):
+                last = attempt == retry.total
+                try:
+                    response = super().handle_request(request)
+                except (httpx.TimeoutException, httpx.NetworkError):
+                    if last:
+                        raise
+                else:
+                    if last or response.status_code not in status_forcelist:
+                        return response
+                    response.close()
+                time.sleep(min(Retry.DEFAULT_BACKOFF_MAX, retry.backoff_factor * (2 ** attempt)))
+
+
+def parse_json(body: Union[bytes, str]) -> Any:
+    """
+    Parse an API response body, with orjson when it is installed.
+    
+    Takes the raw bytes (response.content) so neither parser needs
+    requests' charset detection and decode first.
+    
+    Args:
+        body: JSON document as bytes or str
+        
+    Returns:
+        Parsed value; raises ValueError on malformed input
+    """
+    return _json_loads(body)
+
+
+class JobRecord(MutableMapping):
+    """
+    Compact job record with the standard collector keys as __slots__.
+    
+    Behaves like the job dictionaries every stage already consumes
+    (job['title'], job.get(...), {**job}, 'key' in job) but stores the
+    twelve fixed fields without a per-job hash table. Keys outside the
+    standard set (e.g. 'validation_issues') go to a small overflow dict
+    created on first use.
+    """
+    
+    __slots__ = (
+        'source', 'job_id', 'title', 'company', 'city', 'province', 'description',
+        'salary_min', 'salary_max', 'remote_type', 'posted_date', 'url', '_extra'
+    )
+    FIELDS = __slots__[:-1]
+    _FIELD_SET = frozenset(FIELDS)
+    
+    def __init__(self, source: str, job_id: str, title: str, company: str, city: str,
+                 province: str, description: str = '', salary_min: Optional[int] = None,
+                 salary_max: Optional[int] = None, remote_type: Optional[str] = None,
+                 posted_date: Optional[str] = None, url: Optional[str] = None):
+        self.source = source
+        self.job_id = job_id
+        self.title = title
+        self.company = company
+        self.city = city
+        self.province = province
+        self.description = description
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.remote_type = remote_type
+        self.posted_date = posted_date
+        self.url = url
+        self._extra = None
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        if key in self._FIELD_SET:
+            raise TypeError(f"Cannot delete standard job field: {key}")
+        if self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        del self._extra[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._FIELD_SET or (self._extra is not None and key in self._extra)
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self.FIELDS
+        if self._extra:
+            yield from self._extra
+    
+    def __len__(self) -> int:
+        return len(self.FIELDS) + (len(self._extra) if self._extra else 0)
+    
+    def __repr__(self) -> str:
+        return f"JobRecord({self.asdict()!r})"
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._FIELD_SET:
+            return getattr(self, key)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+    
+    def asdict(self) -> Dict[str, Any]:
+        """Plain dict copy, for serialization boundaries that need a real dict."""
+        return dict(self.items())
+
 
 class BaseCollector(ABC):
     """Abstract base class for all data collectors."""
@@ -30,6 +212,9 @@ class BaseCollector(ABC):
     # Optional keys (can be None)
     OPTIONAL_KEYS = ['salary_min', 'salary_max', 'remote_type']
     
+    # Searches collect_many() runs at once; per-host rate limits still apply
+    MAX_CONCURRENT_SEARCHES = 4
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize base collector.
@@ -40,6 +225,144 @@ class BaseCollector(ABC):
         self.config = config
         self.logger = setup_logger(self.__class__.__name__)
     
+    def _create_session(self, pool_connections: int = 1, pool_maxsize: int = 8,
+                        max_retries: Any = 0, headers: Dict[str, str] = None) -> requests.Session:
+        """
+        Build the collector's shared HTTP session.
+        
+        One session per collector, shared by all its threads: requests'
+        connection pool is thread-safe, so concurrent searches and pages reuse
+        the same keep-alive connections. (Collectors never share a host, so a
+        cross-collector or per-thread session would only split the pool.)
+        
+        Args:
+            pool_connections: Number of hosts to keep pools for
+            pool_maxsize: Keep-alive connections kept per host; size it for
+                collect_many() searches x concurrent pages
+            max_retries: Retry count or urllib3 Retry for the adapter
+            headers: Default headers sent with every request
+            
+        Returns:
+            Session with a pooled adapter mounted for http and https
+        """
+        session = requests.Session()
+        if headers:
+            session.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _create_http2_client(self, retry: Retry, pool_maxsize: int = 8, headers: Dict[str, str] = None,
+                             timeout: float = None, **client_kwargs) -> Optional['httpx.Client']:
+        """
+        Build an HTTP/2 client with the same retry policy as the session.
+        
+        Args:
+            retry: urllib3 Retry applied to timeouts, network errors and
+                status_forcelist responses (see _RetryTransport)
+            pool_maxsize: Maximum (and keep-alive) connections
+            headers: Default headers; connection-specific ones are not
+                allowed in HTTP/2 and are dropped
+            timeout: Default request timeout in seconds
+            **client_kwargs: Passed on to httpx.Client (e.g. follow_redirects)
+            
+        Returns:
+            httpx.Client, or None when httpx[http2] is not installed
+        """
+        if httpx is None:
+            return None
+        transport = _RetryTransport(
+            retry,
+            http2=True,
+            limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+        )
+        headers = {k: v for k, v in (headers or {}).items() if k.lower() != 'connection'}
+        return httpx.Client(transport=transport, headers=headers, timeout=timeout, **client_kwargs)
+    
+    def _create_api_clients(self, headers: Dict[str, str], http2: bool) -> None:
+        """
+        Set up session, HTTP/2 client and response cache for a JSON API collector.
+        
+        Both clients retry connection errors, timeouts and 5xx with the same
+        backoff; 429 is left to the caller so the host rate limiter sees it.
+        Recent responses are reused for HTTP_CACHE_TTL seconds, so re-running
+        a search doesn't spend API quota; older ones are revalidated with their
+        ETag/Last-Modified so an unchanged page comes back as 304.
+        
+        Args:
+            headers: Default headers for the HTTP/2 client
+            http2: Use HTTP/2 (when httpx[http2] is installed) so concurrent
+                fetches share one multiplexed connection
+        """
+        retry = Retry(
+            total=Config.MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False
+        )
+        self.session = self._create_session(max_retries=retry)
+        self.http2_client = (self._create_http2_client(retry, headers=headers, timeout=Config.JOBBANK_REQUEST_TIMEOUT)
+                             if http2 else None)
+        self.http_cache = (ConditionalCache(ttl_seconds=Config.HTTP_CACHE_TTL or None)
+                           if Config.CACHE_ENABLED else None)
+    
+    def _can_request(self) -> bool:
+        """Whether _cached_get may send a request (override to enforce a quota)."""
+        return True
+    
+    def _cached_get(self, url: str, params: Dict[str, Any], headers: Dict[str, str],
+                    host: str) -> Tuple[Optional[Union[bytes, str]], Any, Optional[float]]:
+        """
+        GET an API page through the response cache and the host rate limiter.
+        
+        Uses the clients from _create_api_clients(). A fresh cached body is
+        returned without a request; otherwise the cached validators are sent
+        and a 304 is answered from the cache. Successful responses are stored.
+        
+        Args:
+            url: Endpoint URL
+            params: Query parameters (also the cache key)
+            headers: Request headers
+            host: Host name for host_rate_limiter
+            
+        Returns:
+            (body, response, retry_after): body is the cached body on a cache
+            hit (response None) or a 304 (response set), else None; response
+            is None when _can_request() refused the request
+        """
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}"
+        if self.http_cache:
+            body = self.http_cache.get_fresh(cache_key)
+            if body:
+                return body, None, None
+        if not self._can_request():
+            return None, None, None
+        
+        client = self.http2_client or self.session
+        
+        def get(request_headers: Dict[str, str]):
+            host_rate_limiter.acquire(host)
+            return client.get(url, headers=request_headers, params=params, timeout=Config.JOBBANK_REQUEST_TIMEOUT)
+        
+        if not self.http_cache:
+            response = get(headers)
+            return None, response, host_rate_limiter.update_from_headers(host, response.headers)
+        
+        response = get({**headers, **self.http_cache.conditional_headers(cache_key)})
+        body, response = self.http_cache.body_or_refetch(cache_key, response, lambda: get(headers))
+        retry_after = host_rate_limiter.update_from_headers(host, response.headers)
+        if body:
+            return body, response, retry_after
+        if 200 <= response.status_code < 300:
+            self.http_cache.store(cache_key, response)
+        return None, response, retry_after
+    
     @abstractmethod
     def collect(self, city: str, role: str, max_pages: int = 5) -> List[Dict[str, Any]]:
         """
@@ -120,3 +443,27 @@ class BaseCollector(ABC):
         except Exception as e:
             self.logger.error(f"Collection failed: {e}", exc_info=True)
             return []
+    
+    def collect_many(self, pairs: Iterable[Tuple[str, str]], max_pages: int = 5,
+                     max_workers: int = None) -> List[Dict[str, Any]]:
+        """
+        Collect and validate many (city, role) searches concurrently.
+        
+        Searches share this collector's HTTP session, so they reuse its
+        pooled connections instead of each opening their own.
+        
+        Args:
+            pairs: (city, role) tuples to search
+            max_pages: Maximum pages per search
+            max_workers: Searches in flight (default: MAX_CONCURRENT_SEARCHES)
+            
+        Returns:
+            Validated jobs from every search, in the order of pairs
+        """
+        pairs = list(pairs)
+        workers = min(max_workers or self.MAX_CONCURRENT_SEARCHES, len(pairs)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda pair: self.collect_with_validation(pair[0], pair[1], max_pages), pairs
+            )
+            return [job for jobs in results for job in jobs]
@@ -3,17 +3,145 @@ Job Bank Canada collector - Web scraping with BeautifulSoup.
 """
 
 import re
+import sys
 import time
-import hashlib
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
-from urllib.parse import urljoin
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+from datetime import date, datetime, timedelta
+from urllib.parse import urljoin, urlencode, quote_plus
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib3.util.retry import Retry
 
-from .base_collector import BaseCollector
-from utils import Config, retry_on_exception, rate_limit
+# Optional HTTP/2 client: concurrent page fetches multiplex over one connection
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+except ImportError:
+    httpx = None
+
+from .base_collector import BaseCollector, JobRecord, short_hash
+from utils import Config, retry_on_exception, rate_limit, ConditionalCache
+
+# lxml's C parser is several times faster than html.parser; fall back if it's missing
+try:
+    import lxml.html
+    from lxml import etree
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml = etree = None
+    HTML_PARSER = 'html.parser'
+
+
+# Province names as they appear in Job Bank locations -> 2-letter codes
+_PROVINCE_MAP = MappingProxyType({
+    'ontario': 'ON', 'british columbia': 'BC', 'alberta': 'AB',
+    'saskatchewan': 'SK', 'manitoba': 'MB', 'quebec': 'QC',
+    'nova scotia': 'NS', 'new brunswick': 'NB',
+    'newfoundland and labrador': 'NL', 'prince edward island': 'PE',
+    'northwest territories': 'NT', 'nunavut': 'NU', 'yukon': 'YT'
+})
+
+# Patterns used per article / per field, compiled once
+_JOB_ID_RE = re.compile(r'/(\d+)/?$')
+_PAREN_LOC_RE = re.compile(r'^(.+?)\s*\(([A-Z]{2})\)$')
+_SAL_RANGE_RE = re.compile(r'([\d.]+)(?:to|-|–)([\d.]+)', re.IGNORECASE)
+_SAL_SINGLE_RE = re.compile(r'([\d.]+)')
+_SAL_STRIP = str.maketrans('', '', ', $')
+_ISO_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+# "February 08, 2026" - same shape strptime's "%B %d, %Y" accepted
+_MONTH_DATE_RE = re.compile(r'^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$')
+_MONTHS = MappingProxyType({
+    name: number for number, name in enumerate(
+        ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+         'august', 'september', 'october', 'november', 'december'), start=1)
+})
+_DAYS_AGO_RE = re.compile(r'(\d+)\s+days?\s+ago', re.IGNORECASE)
+_SALARY_LABEL_RES = tuple(re.compile(label, re.I) for label in ('Salary', 'Wage', 'Compensation', 'Pay'))
+
+
+@lru_cache(maxsize=4096)
+def _hash_path(path: str) -> str:
+    """Short id for a path without a numeric id; the same paths recur across pages and re-crawls."""
+    return short_hash(path)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching one class token (like BS4's class_=), not a substring."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if etree is not None:
+    # Compiled once; the search-results parser walks lxml elements directly
+    # jobbank.gc.ca serves UTF-8; lxml would assume Latin-1 for bytes without a meta charset
+    _UTF8_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+    _XP_ARTICLES = etree.XPath(f"//article[{_has_class('action-buttons')}]")
+    _XP_LINK = etree.XPath(f".//a[{_has_class('resultJobItem')}]")
+    _XP_TITLE = etree.XPath(f".//span[{_has_class('noctitle')}]")
+    _XP_BUSINESS = etree.XPath(f".//li[{_has_class('business')}]")
+    _XP_LOCATION = etree.XPath(f".//li[{_has_class('location')}]")
+    _XP_SALARY = etree.XPath(f".//li[{_has_class('salary')}]")
+    _XP_DATE = etree.XPath(f".//li[{_has_class('date')}]")
+
+
+def _element_text(el, skip=None) -> str:
+    """
+    Text of an lxml element, matching BS4's get_text(strip=True).
+    
+    Each text node is stripped and the pieces are joined without spaces.
+    Subtrees for which skip(child) is true are left out, but their tail
+    text (which follows the child) is kept.
+    """
+    if skip is None:
+        return ''.join(t.strip() for t in el.itertext())
+    parts = []
+    
+    def walk(node):
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str) and not skip(child):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+    
+    walk(el)
+    return ''.join(t.strip() for t in parts)
+
+
+def _is_hidden_location_part(el) -> bool:
+    """Screen-reader labels and icons inside Job Bank's location item."""
+    if 'wb-inv' in (el.get('class') or '').split():
+        return True
+    return el.tag == 'span' and el.get('aria-hidden') == 'true'
+
+# BS4 fallback only builds the result articles, not head/nav/scripts/footer
+_ARTICLE_STRAINER = SoupStrainer('article', class_='action-buttons')
+
+# Transport errors worth retrying, for whichever client is in use
+_RETRY_EXCEPTIONS = (requests.Timeout, requests.ConnectionError)
+if httpx is not None:
+    _RETRY_EXCEPTIONS += (httpx.TimeoutException, httpx.TransportError)
+
+# Per-process parser used by _parse_page_worker (created on first use in each worker)
+_worker_collector = None
+
+
+def _parse_page_worker(html: bytes, city: str, today: Optional[date] = None) -> List[Dict[str, Any]]:
+    """
+    Parse one search results page in a worker process.
+    
+    Module-level so ProcessPoolExecutor can pickle it; see
+    JobBankCollector.parse_executor.
+    """
+    global _worker_collector
+    if _worker_collector is None:
+        _worker_collector = JobBankCollector()
+    return list(_worker_collector._parse_jobs_from_html(html, city, today))
 
 
 class JobBankCollector(BaseCollector):
@@ -31,34 +159,88 @@ class JobBankCollector(BaseCollector):
         'Upgrade-Insecure-Requests': '1'
     }
     
-    def __init__(self, config: Dict[str, Any] = None):
-        """Initialize Job Bank collector."""
+    # collect_many() runs as many searches as the connection pool can serve
+    # with each search's page lookahead; the shared _fetch_page rate limit
+    # still spaces every request to the host
+    MAX_CONCURRENT_SEARCHES = max(1, Config.JOBBANK_POOL_SIZE // max(1, Config.JOBBANK_PAGE_WORKERS))
+    
+    def __init__(self, config: Dict[str, Any] = None, parse_executor=None):
+        """
+        Initialize Job Bank collector.
+        
+        Args:
+            config: Configuration dictionary
+            parse_executor: Optional ProcessPoolExecutor for HTML parsing. Parsing
+                is CPU-bound and holds the GIL, so with many concurrent searches
+                it pays to move it off the fetching threads.
+        """
         super().__init__(config or {})
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
+        self.parse_executor = parse_executor
+        # One host, so one connection pool, sized for concurrent searches so they
+        # share keep-alive connections; transient connection errors and 5xx are
+        # retried at the transport level (by both the session and the HTTP/2 client)
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+        self.session = self._create_session(
+            pool_maxsize=Config.JOBBANK_POOL_SIZE,
+            max_retries=retry,
+            headers=self.HEADERS
+        )
+        
+        # ETag/Last-Modified per URL, so unchanged pages come back as 304
+        self.http_cache = ConditionalCache() if Config.CACHE_ENABLED else None
+        
+        # With httpx[http2] installed, page fetches go over HTTP/2 instead
+        self.http2_client = None
+        if Config.JOBBANK_HTTP2:
+            self.http2_client = self._create_http2_client(
+                retry,
+                pool_maxsize=Config.JOBBANK_POOL_SIZE,
+                headers=self.HEADERS,
+                timeout=Config.JOBBANK_REQUEST_TIMEOUT,
+                follow_redirects=True
+            )
     
     @rate_limit(min_interval=Config.JOBBANK_RATE_LIMIT_SECONDS)
     @retry_on_exception(
-        exceptions=(requests.Timeout, requests.ConnectionError),
+        exceptions=_RETRY_EXCEPTIONS,
         max_attempts=Config.MAX_RETRIES
     )
-    def _fetch_page(self, url: str) -> Optional[str]:
+    def _fetch_page(self, url: str) -> Optional[bytes]:
         """
         Fetch HTML content from URL with rate limiting and retry.
         
+        Returns the undecoded body, which skips requests' charset guessing
+        and a decode/re-encode of every page. The lxml path decodes it as
+        UTF-8 (what jobbank.gc.ca serves, see _UTF8_PARSER) regardless of
+        any meta charset; BeautifulSoup detects the encoding itself.
+        
+        Sends the validators cached for url; on 304 Not Modified the cached
+        HTML is returned instead of downloading the page again.
+        
         Args:
             url: URL to fetch
             
         Returns:
-            HTML content as string, or None if failed
+            HTML content as bytes, or None if failed
         """
         try:
-            response = self.session.get(
+            client = self.http2_client or self.session
+            headers = self.http_cache.conditional_headers(url) if self.http_cache else {}
+            response = client.get(
                 url,
+                headers=headers,
                 timeout=Config.JOBBANK_REQUEST_TIMEOUT
             )
+            if self.http_cache:
+                body, response = self.http_cache.body_or_refetch(
+                    url, response, lambda: client.get(url, timeout=Config.JOBBANK_REQUEST_TIMEOUT)
+                )
+                if body:
+                    return body
             response.raise_for_status()
-            return response.text
+            if self.http_cache:
+                self.http_cache.store(url, response)
+            return response.content
         except Exception as e:
             self.logger.error(f"Failed to fetch {url}: {e}")
             return None
@@ -76,28 +258,55 @@ class JobBankCollector(BaseCollector):
             List of job dictionaries
         """
         all_jobs = []
-        
-        for page in range(1, max_pages + 1):
-            self.logger.info(f"Scraping page {page}/{max_pages} for {role} in {city}")
-            
-            # Build URL
-            url = self._build_url(city, role, page)
+        # One clock read per search; every relative date on its pages uses it
+        today = datetime.now().date()
+        
+        # Keep up to JOBBANK_PAGE_WORKERS pages in flight so one page's network
+        # wait overlaps the next; the shared rate limit still spaces requests.
+        # Pages are consumed in order, so a missing or empty page still ends
+        # the search, wasting at most workers - 1 lookahead fetches.
+        workers = max(1, min(Config.JOBBANK_PAGE_WORKERS, max_pages))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            next_page = 1
             
-            # Fetch HTML
-            html = self._fetch_page(url)
-            if not html:
-                self.logger.warning(f"Failed to fetch page {page}, stopping")
-                break
+            def submit_next():
+                nonlocal next_page
+                if next_page <= max_pages:
+                    self.logger.info(f"Scraping page {next_page}/{max_pages} for {role} in {city}")
+                    url = self._build_url(city, role, next_page)
+                    pending.append((next_page, executor.submit(self._fetch_page, url)))
+                    next_page += 1
             
-            # Parse jobs from HTML
-            jobs = self._parse_jobs_from_html(html, city)
+            for _ in range(workers):
+                submit_next()
             
-            if not jobs:
-                self.logger.info(f"No more jobs found on page {page}, stopping")
-                break
+            while pending:
+                page, future = pending.popleft()
+                
+                # Fetch HTML
+                html = future.result()
+                if not html:
+                    self.logger.warning(f"Failed to fetch page {page}, stopping")
+                    break
+                
+                # Parse jobs from HTML straight into all_jobs
+                before = len(all_jobs)
+                if self.parse_executor is not None:
+                    all_jobs.extend(self.parse_executor.submit(_parse_page_worker, html, city, today).result())
+                else:
+                    all_jobs.extend(self._parse_jobs_from_html(html, city, today))
+                found = len(all_jobs) - before
+                
+                if not found:
+                    self.logger.info(f"No more jobs found on page {page}, stopping")
+                    break
+                
+                self.logger.info(f"Found {found} jobs on page {page}")
+                submit_next()
             
-            all_jobs.extend(jobs)
-            self.logger.info(f"Found {len(jobs)} jobs on page {page}")
+            for _, future in pending:
+                future.cancel()
         
         self.logger.info(f"Total jobs collected: {len(all_jobs)}")
         return all_jobs
@@ -115,51 +324,135 @@ class JobBankCollector(BaseCollector):
             Complete URL
         """
         params = {
-            'searchstring': role.replace(' ', '+'),
+            'searchstring': role,
             'location': city,
             'postedDate': '30',  # Last 30 days
             'sort': 'posted',
             'page': str(page)
         }
         
-        query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-        return f"{self.BASE_URL}?{query_string}"
+        # Encodes spaces as '+' and escapes '&', '#', apostrophes and non-ASCII
+        return f"{self.BASE_URL}?{urlencode(params, quote_via=quote_plus)}"
     
-    def _parse_jobs_from_html(self, html: str, city: str) -> List[Dict[str, Any]]:
+    def _parse_jobs_from_html(self, html: Union[bytes, str], city: str,
+                              today: Optional[date] = None) -> Iterator[Dict[str, Any]]:
         """
-        Parse job listings from HTML.
+        Parse job listings from HTML, yielding each job as it is parsed.
+        
+        Uses lxml and compiled XPath when available, which skips the
+        BeautifulSoup wrapper objects entirely; otherwise falls back to BS4.
         
         Args:
-            html: HTML content
+            html: HTML content (raw bytes from _fetch_page, or str)
             city: City name for normalization
+            today: Reference date for relative posting dates (default: now)
             
-        Returns:
-            List of job dictionaries
+        Yields:
+            Job dictionaries
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        jobs = []
+        if today is None:
+            today = datetime.now().date()
+        if etree is None:
+            yield from self._parse_jobs_from_soup(html, city, today)
+            return
+        
+        try:
+            if isinstance(html, bytes):
+                tree = lxml.html.fromstring(html, parser=_UTF8_PARSER)
+            else:
+                tree = lxml.html.fromstring(html)
+        except ValueError:
+            # lxml refuses str input that carries an XML encoding declaration
+            tree = lxml.html.fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            return
         
         # Find all job listing articles - they have class "action-buttons"
-        job_articles = soup.find_all('article', class_='action-buttons')
+        for article in _XP_ARTICLES(tree):
+            try:
+                job = self._parse_job_element(article, city, today)
+            except Exception as e:
+                self.logger.warning(f"Failed to parse job article: {e}")
+                continue
+            if job:
+                yield job
+    
+    def _parse_job_element(self, article, city: str, today: Optional[date] = None) -> Optional[Dict[str, Any]]:
+        """
+        Parse single job article element (lxml).
+        
+        Args:
+            article: lxml article element
+            city: City for location normalization
+            today: Reference date for relative posting dates
+            
+        Returns:
+            Job dictionary or None if parsing failed
+        """
+        try:
+            # Find the <a> tag with class "resultJobItem"
+            links = _XP_LINK(article)
+            if not links:
+                return None
+            link = links[0]
+            
+            job_path = link.get('href', '')
+            if not job_path:
+                return None
+            
+            # Extract job title from span with class "noctitle"
+            titles = _XP_TITLE(link)
+            if not titles:
+                return None
+            title = _element_text(titles[0])
+            
+            # Extract company from li with class "business"
+            business = _XP_BUSINESS(link)
+            company = _element_text(business[0]) if business else "Unknown"
+            
+            # Extract location from li with class "location", minus screen-reader text and icons
+            locations = _XP_LOCATION(link)
+            location = _element_text(locations[0], skip=_is_hidden_location_part) if locations else None
+            
+            salary = _XP_SALARY(link)
+            dates = _XP_DATE(link)
+            return self._build_job(
+                job_path, title, company, location, city,
+                _element_text(salary[0]) if salary else None,
+                _element_text(dates[0]) if dates else None,
+                today
+            )
+            
+        except Exception as e:
+            self.logger.debug(f"Failed to parse job article: {e}")
+            return None
+    
+    def _parse_jobs_from_soup(self, html: Union[bytes, str], city: str,
+                              today: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+        """BeautifulSoup version of _parse_jobs_from_html, used when lxml is not installed."""
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=_ARTICLE_STRAINER)
+        
+        # Only job listing articles (class "action-buttons") were parsed
+        job_articles = soup.find_all('article', class_='action-buttons', recursive=False)
         
         for article in job_articles:
             try:
-                job = self._parse_job_article(article, city)
-                if job:
-                    jobs.append(job)
+                job = self._parse_job_article(article, city, today)
             except Exception as e:
                 self.logger.warning(f"Failed to parse job article: {e}")
                 continue
-        
-        return jobs
+            if job:
+                yield job
     
-    def _parse_job_article(self, article: BeautifulSoup, city: str) -> Optional[Dict[str, Any]]:
+    def _parse_job_article(self, article: BeautifulSoup, city: str,
+                           today: Optional[date] = None) -> Optional[Dict[str, Any]]:
         """
         Parse single job article element.
         
         Args:
             article: BeautifulSoup article element
             city: City for location normalization
+            today: Reference date for relative posting dates
             
         Returns:
             Job dictionary or None if parsing failed
@@ -174,10 +467,6 @@ class JobBankCollector(BaseCollector):
             if not job_path:
                 return None
             
-            # Generate job ID from path
-            job_id = self._extract_job_id_from_path(job_path)
-            url = urljoin('https://www.jobbank.gc.ca', job_path)
-            
             # Extract job title from span with class "noctitle"
             title_tag = link_tag.find('span', class_='noctitle')
             if not title_tag:
@@ -190,6 +479,7 @@ class JobBankCollector(BaseCollector):
             
             # Extract location from li with class "location"
             location_tag = link_tag.find('li', class_='location')
+            location = None
             if location_tag:
                 # Remove screen-reader-only text (class wb-inv)
                 for invisible in location_tag.find_all(class_='wb-inv'):
@@ -197,40 +487,72 @@ class JobBankCollector(BaseCollector):
                 for icon in location_tag.find_all(['span'], {'aria-hidden': 'true'}):
                     icon.decompose()
                 location = location_tag.get_text(strip=True)
-                # Remove any "Location" prefix that might remain
-                location = re.sub(r'^Location\s*', '', location, flags=re.IGNORECASE)
-            else:
-                location = city
             
-            city_normalized, province = self._parse_location(location)
-            
-            # Extract salary from li with class "salary"
             salary_tag = link_tag.find('li', class_='salary')
-            salary_min, salary_max = self._parse_salary(salary_tag.get_text(strip=True)) if salary_tag else (None, None)
-            
-            # Extract posting date from li with class "date"
             date_tag = link_tag.find('li', class_='date')
-            posted_date = self._parse_date(date_tag.get_text(strip=True) if date_tag else None)
-            
-            return {
-                'source': 'jobbank',
-                'job_id': f"jobbank_{job_id}",
-                'title': title,
-                'company': company,
-                'city': city_normalized or city,
-                'province': province,
-                'description': '',  # Will be fetched separately if needed
-                'salary_min': salary_min,
-                'salary_max': salary_max,
-                'remote_type': None,
-                'posted_date': posted_date,
-                'url': url
-            }
+            return self._build_job(
+                job_path, title, company, location, city,
+                salary_tag.get_text(strip=True) if salary_tag else None,
+                date_tag.get_text(strip=True) if date_tag else None,
+                today
+            )
             
         except Exception as e:
             self.logger.debug(f"Failed to parse job article: {e}")
             return None
     
+    def _build_job(self, job_path: str, title: str, company: str, location: Optional[str], city: str,
+                   salary_text: Optional[str], date_text: Optional[str],
+                   today: Optional[date] = None) -> JobRecord:
+        """
+        Turn the text fields of one search result into a job dictionary.
+        
+        Args:
+            job_path: href of the result link
+            title, company: Extracted text
+            location: Location text, or None if the result has none
+            city: City searched for (fallback location)
+            salary_text, date_text: Extracted text, or None if absent
+            today: Reference date for relative posting dates
+            
+        Returns:
+            JobRecord (a dict-like job with the standard keys)
+        """
+        # Generate job ID from path
+        job_id = self._extract_job_id_from_path(job_path)
+        url = urljoin('https://www.jobbank.gc.ca', job_path)
+        
+        if location is not None:
+            # Remove any "Location" prefix that might remain
+            if location[:8].lower() == 'location':
+                location = location[8:].lstrip()
+        else:
+            location = city
+        
+        city_normalized, province = self._parse_location(location)
+        # The same few hundred companies/cities and 13 provinces repeat across
+        # thousands of jobs - intern them so every job shares one string object
+        company = sys.intern(company)
+        city_normalized = sys.intern(city_normalized or city)
+        province = sys.intern(province)
+        salary_min, salary_max = self._parse_salary(salary_text) if salary_text is not None else (None, None)
+        posted_date = self._parse_date(date_text, today)
+        
+        return JobRecord(
+            source='jobbank',
+            job_id=f"jobbank_{job_id}",
+            title=title,
+            company=company,
+            city=city_normalized,
+            province=province,
+            description='',  # Will be fetched separately if needed
+            salary_min=salary_min,
+            salary_max=salary_max,
+            remote_type=None,
+            posted_date=posted_date,
+            url=url
+        )
+    
     def fetch_job_detail(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Fetch full job detail page and parse description + salary.
@@ -250,7 +572,7 @@ class JobBankCollector(BaseCollector):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         result = {'description': '', 'salary_min': None, 'salary_max': None}
         
         # Job Bank detail: description often in div#job-description or similar
@@ -274,8 +596,8 @@ class JobBankCollector(BaseCollector):
         
         # Salary: look for "Salary" or "Wage" section
         salary_text = ''
-        for label in ['Salary', 'Wage', 'Compensation', 'Pay']:
-            el = soup.find(string=re.compile(label, re.I))
+        for label_re in _SALARY_LABEL_RES:
+            el = soup.find(string=label_re)
             if el:
                 parent = el.parent
                 for _ in range(5):
@@ -297,12 +619,12 @@ class JobBankCollector(BaseCollector):
     def _extract_job_id_from_path(self, path: str) -> str:
         """Extract job ID from URL path."""
         # Extract numeric ID or generate hash from path
-        match = re.search(r'/(\d+)/?$', path)
+        match = _JOB_ID_RE.search(path)
         if match:
             return match.group(1)
         else:
             # Generate hash from path if no ID found
-            return hashlib.md5(path.encode()).hexdigest()[:12]
+            return _hash_path(path)
     
     def _parse_location(self, location: str) -> Tuple[str, str]:
         """
@@ -314,36 +636,22 @@ class JobBankCollector(BaseCollector):
         Returns:
             Tuple of (city, province_code)
         """
-        province_map = {
-            'ontario': 'ON', 'british columbia': 'BC', 'alberta': 'AB',
-            'saskatchewan': 'SK', 'manitoba': 'MB', 'quebec': 'QC',
-            'nova scotia': 'NS', 'new brunswick': 'NB',
-            'newfoundland and labrador': 'NL', 'prince edward island': 'PE',
-            'northwest territories': 'NT', 'nunavut': 'NU', 'yukon': 'YT'
-        }
-        
         # Try to match "City (PROV)" pattern first (e.g., "Toronto (ON)")
-        paren_match = re.search(r'^(.+?)\s*\(([A-Z]{2})\)$', location)
+        paren_match = _PAREN_LOC_RE.search(location)
         if paren_match:
-            city = paren_match.group(1).strip()
-            province = paren_match.group(2).strip()
-            return city, province
-        
-        # Otherwise use comma separation
-        parts = [p.strip() for p in location.split(',')]
-        city = parts[0] if parts else "Unknown"
-        
-        province = ""
-        if len(parts) > 1:
-            prov_text = parts[1].lower()
-            # Check if it's already a 2-letter code
-            if len(parts[1].strip()) == 2:
-                province = parts[1].strip().upper()
-            else:
-                # Look up full name
-                province = province_map.get(prov_text, parts[1].strip()[:2].upper())
-        
-        return city, province
+            return paren_match.group(1).strip(), paren_match.group(2).strip()
+        
+        # Otherwise use comma separation: "City, Province[, ...]"
+        city, comma, rest = location.partition(',')
+        city = city.strip()
+        if not comma:
+            return city, ""
+        
+        prov = rest.partition(',')[0].strip()
+        # Check if it's already a 2-letter code, else look up full name
+        if len(prov) == 2:
+            return city, prov.upper()
+        return city, _PROVINCE_MAP.get(prov.lower(), prov[:2].upper())
     
     # Minimum plausible annual salary (CAD) - filter out hourly rates misparsed as annual
     MIN_ANNUAL_SALARY = 10000
@@ -360,26 +668,26 @@ class JobBankCollector(BaseCollector):
         Returns:
             Tuple of (min_salary, max_salary) - always min <= max, or (None, None)
         """
-        if not salary_text or 'not' in salary_text.lower():
+        if not salary_text:
             return None, None
         
         text_lower = salary_text.lower()
+        if 'not' in text_lower:
+            return None, None
         is_hourly = any(x in text_lower for x in ['hourly', 'per hour', '/hr', '/ hour'])
         is_biweekly = 'biweekly' in text_lower or 'bi-weekly' in text_lower
         
         # Remove formatting but keep decimal for hourly (e.g. $25.50)
-        cleaned = salary_text.replace(',', '').replace('$', '').replace(' ', '')
+        cleaned = salary_text.translate(_SAL_STRIP)
         
         # Try range: "60000to80000" or "60000-80000" or "25.50-35.00"
-        range_pattern = r'([\d.]+)(?:to|-|–)([\d.]+)'
-        match = re.search(range_pattern, cleaned, re.IGNORECASE)
+        match = _SAL_RANGE_RE.search(cleaned)
         
         if match:
             v1, v2 = float(match.group(1)), float(match.group(2))
             v1, v2 = min(v1, v2), max(v1, v2)
         else:
-            single_pattern = r'([\d.]+)'
-            match = re.search(single_pattern, cleaned)
+            match = _SAL_SINGLE_RE.search(cleaned)
             if match:
                 v1 = v2 = float(match.group(1))
             else:
@@ -401,46 +709,49 @@ class JobBankCollector(BaseCollector):
         
         return v1, v2
     
-    def _parse_date(self, date_text: Optional[str]) -> str:
+    def _parse_date(self, date_text: Optional[str], today: Optional[date] = None) -> str:
         """
         Parse posting date from text.
         
         Args:
             date_text: Date text (e.g., "Posted 5 days ago", "February 08, 2026")
+            today: Reference date for relative dates; pass it in when parsing
+                many jobs so the clock is read once (default: now)
             
         Returns:
             ISO format date string (YYYY-MM-DD)
         """
+        if today is None:
+            today = datetime.now().date()
+        
         if not date_text:
-            return datetime.now().date().isoformat()
+            return today.isoformat()
         
         # Try ISO format first
-        iso_match = re.search(r'(\d{4}-\d{2}-\d{2})', date_text)
+        iso_match = _ISO_DATE_RE.search(date_text)
         if iso_match:
             return iso_match.group(1)
         
-        # Try "Month DD, YYYY" format (e.g., "February 08, 2026")
-        try:
-            parsed_date = datetime.strptime(date_text.strip(), "%B %d, %Y")
-            return parsed_date.date().isoformat()
-        except ValueError:
-            pass
+        # Try "Month DD, YYYY" format (e.g., "February 08, 2026") - a regex and
+        # month table instead of strptime, which is slow and raises on every miss
+        month_match = _MONTH_DATE_RE.match(date_text.strip())
+        if month_match:
+            month = _MONTHS.get(month_match.group(1).lower())
+            if month:
+                try:
+                    return date(int(month_match.group(3)), month, int(month_match.group(2))).isoformat()
+                except ValueError:
+                    pass  # e.g. February 30
         
         # Try "X days ago"
-        days_match = re.search(r'(\d+)\s+days?\s+ago', date_text, re.IGNORECASE)
+        days_match = _DAYS_AGO_RE.search(date_text)
         if days_match:
             days = int(days_match.group(1))
-            date = datetime.now().date() - timedelta(days=days)
-            return date.isoformat()
+            return (today - timedelta(days=days)).isoformat()
         
         # Try "yesterday"
         if 'yesterday' in date_text.lower():
-            date = datetime.now().date() - timedelta(days=1)
-            return date.isoformat()
-        
-        # Try "today"
-        if 'today' in date_text.lower():
-            return datetime.now().date().isoformat()
+            return (today - timedelta(days=1)).isoformat()
         
-        # Default to today
-        return datetime.now().date().isoformat()
+        # "today" and anything unrecognized default to today
+        return today.isoformat()
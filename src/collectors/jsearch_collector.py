@@ -7,14 +7,67 @@ Subscribe at: https://rapidapi.com/letscrape-6bRBa3QguO5/api/jsearch
 """
 
 import re
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 import requests
 
-from .base_collector import BaseCollector
-from utils import Config, retry_on_exception
+from .base_collector import BaseCollector, JobRecord, REMOTE_KEYWORDS, parse_json, short_hash
+from utils import Config, retry_on_exception, RateLimitedError
+
+
+# Patterns used per job, compiled once
+_ISO_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+# Response keys the job list may live under, in order of preference
+_JOB_LIST_KEYS = ('data', 'jobs', 'results')
+
+# Province names/codes (lowercase) -> 2-letter codes, built once at import
+_PROVINCE_MAP = {
+    'ontario': 'ON', 'on': 'ON',
+    'british columbia': 'BC', 'bc': 'BC',
+    'alberta': 'AB', 'ab': 'AB',
+    'quebec': 'QC', 'qc': 'QC', 'québec': 'QC',
+    'manitoba': 'MB', 'mb': 'MB',
+    'saskatchewan': 'SK', 'sk': 'SK',
+    'nova scotia': 'NS', 'ns': 'NS',
+    'new brunswick': 'NB', 'nb': 'NB',
+    'newfoundland': 'NL', 'nl': 'NL',
+    'pei': 'PE', 'pe': 'PE',
+}
+
+
+@lru_cache(maxsize=1024)
+def _province_code(state: str) -> str:
+    """2-letter code for a state/province value; memoized since the same few repeat on every page."""
+    return _PROVINCE_MAP.get(state.strip().lower(), state[:2].upper() if len(state) >= 2 else '')
+
+
+@lru_cache(maxsize=4096)
+def _date_from_raw(date_str: str) -> Optional[str]:
+    """
+    ISO date from an ISO string or Unix timestamp, or None if unrecognized.
+    
+    Memoized since postings in a batch share the same few day-quantized
+    values. "Today" fallbacks are left to the caller so they are never cached.
+    """
+    # ISO format
+    iso_match = _ISO_DATE_RE.search(date_str)
+    if iso_match:
+        return iso_match.group(1)
+    
+    # Timestamp
+    if date_str.replace('.', '').isdigit():
+        try:
+            ts = float(date_str)
+            if ts > 1e12:  # milliseconds
+                ts /= 1000
+            return datetime.fromtimestamp(ts).date().isoformat()
+        except (ValueError, OverflowError, OSError):
+            pass
+    return None
 
 
 class JSearchCollector(BaseCollector):
@@ -23,6 +76,9 @@ class JSearchCollector(BaseCollector):
     BASE_URL = "https://jsearch.p.rapidapi.com/search"
     HOST = "jsearch.p.rapidapi.com"
     
+    # Pages of one search fetched at once; the host rate limiter still paces them
+    MAX_PAGE_WORKERS = 4
+    
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize JSearch collector."""
         super().__init__(config or {})
@@ -35,15 +91,23 @@ class JSearchCollector(BaseCollector):
         
         if not self.api_key:
             self.logger.warning("RAPIDAPI_KEY not configured for JSearch")
+        
+        # Shared session (or HTTP/2 client) so page fetches reuse pooled
+        # keep-alive connections, plus the response cache
+        self._create_api_clients(self.headers, http2=Config.RAPIDAPI_HTTP2)
     
     def _get_host(self) -> str:
         """Allow override via RAPIDAPI_JSEARCH_HOST env var."""
         import os
         return os.getenv('RAPIDAPI_JSEARCH_HOST', self.HOST)
     
+    # Transport and 5xx retries happen in the clients' transports (see
+    # _create_api_clients); only a 429 is retried here, after the host
+    # limiter has recorded its Retry-After
     @retry_on_exception(
-        exceptions=(requests.Timeout, requests.ConnectionError),
-        max_attempts=Config.MAX_RETRIES
+        exceptions=(RateLimitedError,),
+        max_attempts=Config.MAX_RETRIES,
+        return_none=True
     )
     def _fetch_jobs(self, params: Dict[str, Any]) -> Optional[Dict]:
         """
@@ -57,21 +121,18 @@ class JSearchCollector(BaseCollector):
         """
         if not self.api_key:
             return None
-            
-        host = self._get_host()
-        headers = {**self.headers, 'X-RapidAPI-Host': host}
         
+        host = self._get_host()
         try:
-            response = requests.get(
-                self.BASE_URL,
-                headers=headers,
-                params=params,
-                timeout=Config.JOBBANK_REQUEST_TIMEOUT
+            body, response, retry_after = self._cached_get(
+                self.BASE_URL, params, {**self.headers, 'X-RapidAPI-Host': host}, host
             )
+            if body:
+                return parse_json(body)
             
             if response.status_code == 429:
                 self.logger.warning("JSearch API rate limit exceeded - wait or upgrade plan")
-                return None
+                raise RateLimitedError(host, retry_after)
             
             if response.status_code in (401, 403):
                 self.logger.error(
@@ -85,8 +146,10 @@ class JSearchCollector(BaseCollector):
                 return None
             
             response.raise_for_status()
-            return response.json()
+            return parse_json(response.content)
             
+        except RateLimitedError:
+            raise
         except requests.exceptions.HTTPError as e:
             self.logger.error(f"JSearch API HTTP error: {e}")
             return None
@@ -109,22 +172,27 @@ class JSearchCollector(BaseCollector):
         self.logger.info(f"Fetching from JSearch: {role} in {city}")
         
         all_jobs = []
-        
-        for page in range(max_pages):
-            params = {
+        param_list = [
+            {
                 'query': f"{role} in {city}, Canada",
                 'page': str(page + 1),
                 'num_pages': '1',
                 'date_posted': 'month'
             }
-            
-            data = self._fetch_jobs(params)
-            
+            for page in range(max_pages)
+        ]
+        
+        # Fetch the pages concurrently, then walk them in order so a missing
+        # or empty page still ends the search
+        with ThreadPoolExecutor(max_workers=max(1, min(max_pages, self.MAX_PAGE_WORKERS))) as executor:
+            pages = list(executor.map(self._fetch_jobs, param_list))
+        
+        for data in pages:
             if not data:
                 break
             
             # JSearch returns { "data": [ {...}, ... ] } or { "jobs": [...] }
-            job_list = data.get('data', data.get('jobs', data.get('results', [])))
+            job_list = next((data[k] for k in _JOB_LIST_KEYS if k in data), [])
             
             if not job_list:
                 break
@@ -168,9 +236,7 @@ class JSearchCollector(BaseCollector):
             if job_id_raw is not None:
                 job_id = str(job_id_raw)
             else:
-                job_id = hashlib.md5(
-                    str(data.get('job_apply_link', data.get('link', ''))).encode()
-                ).hexdigest()[:12]
+                job_id = short_hash(str(data.get('job_apply_link', data.get('link', ''))))
             
             title = data.get('job_title') or data.get('title') or data.get('position', '')
             if not title:
@@ -213,25 +279,27 @@ class JSearchCollector(BaseCollector):
             # Description
             description = data.get('job_description') or data.get('description', '')
             
-            # Remote detection
+            # Remote detection - only copy the description when there is an
+            # employment type to append
+            employment_type = data.get('job_employment_type')
             remote_type = self._detect_remote(
-                str(description) + ' ' + str(data.get('job_employment_type', ''))
+                f"{description} {employment_type}" if employment_type else str(description)
             )
             
-            return {
-                'source': 'jsearch',
-                'job_id': f"jsearch_{job_id}",
-                'title': title,
-                'company': company,
-                'city': city,
-                'province': province,
-                'description': (description or '')[:2000],
-                'salary_min': salary_min,
-                'salary_max': salary_max,
-                'remote_type': remote_type,
-                'posted_date': posted_date,
-                'url': url or f"https://www.google.com/search?q={title}+{company}+jobs"
-            }
+            return JobRecord(
+                source='jsearch',
+                job_id=f"jsearch_{job_id}",
+                title=title,
+                company=company,
+                city=city,
+                province=province,
+                description=(description or '')[:2000],
+                salary_min=salary_min,
+                salary_max=salary_max,
+                remote_type=remote_type,
+                posted_date=posted_date,
+                url=url or f"https://www.google.com/search?q={title}+{company}+jobs"
+            )
             
         except Exception as e:
             self.logger.debug(f"Parse error: {e}")
@@ -239,49 +307,20 @@ class JSearchCollector(BaseCollector):
     
     def _normalize_province(self, state: str, city: str) -> str:
         """Map state/province name to 2-letter code."""
-        province_map = {
-            'ontario': 'ON', 'on': 'ON',
-            'british columbia': 'BC', 'bc': 'BC',
-            'alberta': 'AB', 'ab': 'AB',
-            'quebec': 'QC', 'qc': 'QC', 'québec': 'QC',
-            'manitoba': 'MB', 'mb': 'MB',
-            'saskatchewan': 'SK', 'sk': 'SK',
-            'nova scotia': 'NS', 'ns': 'NS',
-            'new brunswick': 'NB', 'nb': 'NB',
-            'newfoundland': 'NL', 'nl': 'NL',
-            'pei': 'PE', 'pe': 'PE',
-        }
         if not state:
             return ''
-        normalized = province_map.get(state.strip().lower(), state[:2].upper() if len(state) >= 2 else '')
-        return normalized
+        return _province_code(state)
     
     def _parse_date(self, date_str: Optional[str]) -> str:
         """Parse date to ISO format."""
         if not date_str:
             return datetime.now().date().isoformat()
-        
-        # ISO format
-        iso_match = re.search(r'(\d{4}-\d{2}-\d{2})', str(date_str))
-        if iso_match:
-            return iso_match.group(1)
-        
-        # Timestamp
-        if str(date_str).replace('.', '').isdigit():
-            try:
-                ts = float(date_str)
-                if ts > 1e12:  # milliseconds
-                    ts /= 1000
-                return datetime.fromtimestamp(ts).date().isoformat()
-            except (ValueError, OSError):
-                pass
-        
-        return datetime.now().date().isoformat()
+        return _date_from_raw(str(date_str)) or datetime.now().date().isoformat()
     
     def _detect_remote(self, text: str) -> Optional[str]:
         """Detect remote work from text."""
         text_lower = (text or '').lower()
-        if any(k in text_lower for k in ['remote', 'work from home', 'wfh', 'distributed']):
+        if any(k in text_lower for k in REMOTE_KEYWORDS):
             if 'hybrid' in text_lower:
                 return 'hybrid'
             return 'remote'
@@ -5,11 +5,54 @@ RapidAPI collector - LinkedIn Jobs API integration.
 import re
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from urllib.parse import urlparse
 
 import requests
 
-from .base_collector import BaseCollector
-from utils import Config, retry_on_exception
+from .base_collector import BaseCollector, JobRecord, REMOTE_KEYWORDS, parse_json
+from utils import Config, retry_on_exception, RateLimitedError
+
+
+# Patterns used per job, compiled once
+_ISO_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_NUMBER_RE = re.compile(r'[\d.]+')
+_SAL_STRIP = str.maketrans('', '', ', $')
+_REMOTE_KEYWORDS = REMOTE_KEYWORDS + ('telecommute',)
+_HYBRID_KEYWORDS = ('hybrid', 'flexible', 'partial remote')
+
+# Response keys the job list may live under, in order of preference
+_JOB_LIST_KEYS = ('data', 'jobs')
+
+# Province names (lowercase) -> 2-letter codes, built once at import
+_PROVINCE_MAP = {
+    'ontario': 'ON', 'british columbia': 'BC', 'alberta': 'AB',
+    'saskatchewan': 'SK', 'manitoba': 'MB', 'quebec': 'QC',
+    'nova scotia': 'NS', 'new brunswick': 'NB'
+}
+
+
+@lru_cache(maxsize=4096)
+def _date_from_raw(date_str: str) -> Optional[str]:
+    """
+    ISO date from an ISO string or millisecond timestamp, or None if unrecognized.
+    
+    Memoized since postings in a batch share the same few values. "Today"
+    fallbacks are left to the caller so they are never cached.
+    """
+    # Try ISO format
+    iso_match = _ISO_DATE_RE.search(date_str)
+    if iso_match:
+        return iso_match.group(1)
+    
+    # Try timestamp (milliseconds)
+    if date_str.isdigit():
+        try:
+            timestamp = int(date_str) / 1000  # Convert ms to seconds
+            return datetime.fromtimestamp(timestamp).date().isoformat()
+        except (ValueError, OverflowError, OSError):
+            pass
+    return None
 
 
 class RapidAPICollector(BaseCollector):
@@ -31,10 +74,25 @@ class RapidAPICollector(BaseCollector):
         
         self.request_count = 0
         self.max_requests = 500  # Free tier limit
+        
+        # Shared session (or HTTP/2 client) so searches reuse pooled
+        # keep-alive connections, plus the response cache
+        self._create_api_clients(self.headers, http2=Config.RAPIDAPI_HTTP2)
     
+    def _can_request(self) -> bool:
+        """Stop at the free-tier request limit (cached responses cost no quota)."""
+        if self.request_count >= self.max_requests:
+            self.logger.warning(f"RapidAPI request limit reached ({self.max_requests})")
+            return False
+        return True
+    
+    # Transport and 5xx retries happen in the clients' transports (see
+    # _create_api_clients); only a 429 is retried here, after the host
+    # limiter has recorded its Retry-After
     @retry_on_exception(
-        exceptions=(requests.Timeout, requests.ConnectionError, requests.HTTPError),
-        max_attempts=Config.MAX_RETRIES
+        exceptions=(RateLimitedError,),
+        max_attempts=Config.MAX_RETRIES,
+        return_none=True
     )
     def _fetch_jobs(self, params: Dict[str, Any]) -> Optional[Dict]:
         """
@@ -46,22 +104,22 @@ class RapidAPICollector(BaseCollector):
         Returns:
             API response as dictionary, or None if failed
         """
-        if self.request_count >= self.max_requests:
-            self.logger.warning(f"RapidAPI request limit reached ({self.max_requests})")
-            return None
-        
+        host = urlparse(self.BASE_URL).netloc
         try:
-            response = requests.get(
-                self.BASE_URL,
-                headers=self.headers,
-                params=params,
-                timeout=Config.JOBBANK_REQUEST_TIMEOUT
-            )
+            body, response, retry_after = self._cached_get(self.BASE_URL, params, self.headers, host)
+            if body:
+                # A 304 revalidation still counts against the quota; a fresh
+                # cache hit (no response) costs nothing
+                if response is not None:
+                    self.request_count += 1
+                return parse_json(body)
+            if response is None:
+                return None  # Request limit reached
             
             # Check for rate limiting
             if response.status_code == 429:
                 self.logger.error("RapidAPI rate limit exceeded")
-                return None
+                raise RateLimitedError(host, retry_after)
             
             # Check for auth errors
             if response.status_code == 401 or response.status_code == 403:
@@ -70,9 +128,10 @@ class RapidAPICollector(BaseCollector):
             
             response.raise_for_status()
             self.request_count += 1
+            return parse_json(response.content)
             
-            return response.json()
-            
+        except RateLimitedError:
+            raise
         except requests.exceptions.HTTPError as e:
             self.logger.error(f"RapidAPI HTTP error: {e}")
             return None
@@ -129,7 +188,7 @@ class RapidAPICollector(BaseCollector):
         jobs = []
         
         # LinkedIn Jobs API returns jobs in 'data' or 'jobs' key
-        job_list = data.get('data', data.get('jobs', []))
+        job_list = next((data[k] for k in _JOB_LIST_KEYS if k in data), [])
         
         if not isinstance(job_list, list):
             self.logger.warning("Unexpected response format from RapidAPI")
@@ -192,20 +251,20 @@ class RapidAPICollector(BaseCollector):
             # Detect remote work
             remote_type = self._detect_remote(description, title)
             
-            return {
-                'source': 'rapidapi',
-                'job_id': f"rapidapi_{job_id_raw}",
-                'title': title,
-                'company': company,
-                'city': city_normalized,
-                'province': province,
-                'description': description[:1000] if description else '',  # Limit description length
-                'salary_min': salary_min,
-                'salary_max': salary_max,
-                'remote_type': remote_type,
-                'posted_date': posted_date,
-                'url': url
-            }
+            return JobRecord(
+                source='rapidapi',
+                job_id=f"rapidapi_{job_id_raw}",
+                title=title,
+                company=company,
+                city=city_normalized,
+                province=province,
+                description=description[:1000] if description else '',  # Limit description length
+                salary_min=salary_min,
+                salary_max=salary_max,
+                remote_type=remote_type,
+                posted_date=posted_date,
+                url=url
+            )
             
         except Exception as e:
             self.logger.debug(f"Failed to parse job data: {e}")
@@ -222,12 +281,6 @@ class RapidAPICollector(BaseCollector):
         Returns:
             Tuple of (city, province_code)
         """
-        province_map = {
-            'ontario': 'ON', 'british columbia': 'BC', 'alberta': 'AB',
-            'saskatchewan': 'SK', 'manitoba': 'MB', 'quebec': 'QC',
-            'nova scotia': 'NS', 'new brunswick': 'NB'
-        }
-        
         # Remove "Canada" from location
         location_clean = location.replace(', Canada', '').replace(',Canada', '').strip()
         
@@ -240,7 +293,7 @@ class RapidAPICollector(BaseCollector):
             if len(parts[1].strip()) == 2:
                 province = parts[1].strip().upper()
             else:
-                province = province_map.get(prov_text, parts[1].strip()[:2].upper())
+                province = _PROVINCE_MAP.get(prov_text, parts[1].strip()[:2].upper())
         
         return city, province
     
@@ -260,8 +313,8 @@ class RapidAPICollector(BaseCollector):
         text_lower = salary_text.lower()
         is_hourly = any(x in text_lower for x in ['hourly', 'per hour', '/hr', '/ hour'])
         
-        cleaned = salary_text.replace(',', '').replace('$', '').replace(' ', '')
-        numbers = re.findall(r'[\d.]+', cleaned)
+        cleaned = salary_text.translate(_SAL_STRIP)
+        numbers = _NUMBER_RE.findall(cleaned)
         
         if len(numbers) >= 2:
             v1, v2 = float(numbers[0]), float(numbers[1])
@@ -294,22 +347,8 @@ class RapidAPICollector(BaseCollector):
         if not date_str:
             return datetime.now().date().isoformat()
         
-        # Try ISO format
-        iso_match = re.search(r'(\d{4}-\d{2}-\d{2})', date_str)
-        if iso_match:
-            return iso_match.group(1)
-        
-        # Try timestamp (milliseconds)
-        if date_str.isdigit():
-            try:
-                timestamp = int(date_str) / 1000  # Convert ms to seconds
-                date = datetime.fromtimestamp(timestamp).date()
-                return date.isoformat()
-            except:
-                pass
-        
         # Default to today
-        return datetime.now().date().isoformat()
+        return _date_from_raw(date_str) or datetime.now().date().isoformat()
     
     def _detect_remote(self, description: str, title: str) -> Optional[str]:
         """
@@ -324,11 +363,8 @@ class RapidAPICollector(BaseCollector):
         """
         text = (description + ' ' + title).lower()
         
-        remote_keywords = ['remote', 'work from home', 'wfh', 'telecommute', 'distributed']
-        hybrid_keywords = ['hybrid', 'flexible', 'partial remote']
-        
-        if any(keyword in text for keyword in remote_keywords):
-            if any(keyword in text for keyword in hybrid_keywords):
+        if any(k in text for k in _REMOTE_KEYWORDS):
+            if any(k in text for k in _HYBRID_KEYWORDS):
                 return 'hybrid'
             return 'remote'
         
@@ -5,15 +5,100 @@ API: https://remoteok.com/api
 Terms: Link back to RemoteOK, mention as source.
 """
 
+import html
 import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-import requests
+# Optional lazy JSON parser: collect_all_roles then reads only each item's
+# title and builds dicts just for the items that match
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
-from .base_collector import BaseCollector
+from .base_collector import BaseCollector, JobRecord, parse_json
 from utils import Config
 
+# Patterns used per job, compiled once
+_ISO_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+# Characters html.unescape never reads past, so it is safe to split before them
+_ENTITY_BREAK_RE = re.compile(r'[ \t\n\f]')
+
+# Province names/codes (lowercase) -> 2-letter codes, built once at import
+_PROVINCE_MAP = {'ontario': 'ON', 'on': 'ON', 'alberta': 'AB', 'ab': 'AB',
+                 'british columbia': 'BC', 'bc': 'BC', 'quebec': 'QC', 'qc': 'QC'}
+
+
+def _role_title_matcher(role_words: set):
+    """
+    Predicate: does a raw position/title value share a whole word with role_words?
+
+    A compiled alternation of the words runs first as a cheap prefilter - a
+    title can only share a word if one occurs in it as a substring, and most
+    titles fail this without allocating anything. Survivors get the exact
+    whole-word check. With no role words, any non-empty title matches.
+    """
+    role_word_re = re.compile('|'.join(map(re.escape, role_words))) if role_words else None
+
+    def matches(title) -> bool:
+        if not isinstance(title, str):
+            return False
+        title_lower = title.strip().lower()
+        if not title_lower:
+            return False
+        if role_word_re is None:
+            return True
+        return role_word_re.search(title_lower) is not None and not role_words.isdisjoint(title_lower.split())
+
+    return matches
+
+
+def _strip_html_capped(text: str, cap: int = 2000, chunk: int = 4096) -> str:
+    """
+    Unescape text, replace tags with spaces and cut the result to cap chars.
+
+    Gives the same result as _HTML_TAG_RE.sub(' ', html.unescape(text))[:cap]
+    but works through the input a chunk at a time and stops once cap chars
+    are produced, so long descriptions aren't unescaped and scanned in full.
+    Chunks end before whitespace (no entity spans it), and anything from an
+    unclosed '<' on is held back until the rest of the tag arrives.
+
+    Args:
+        text: Raw HTML description
+        cap: Maximum length of the result
+        chunk: Approximate number of input chars processed per step
+
+    Returns:
+        Plain-text description of at most cap chars
+    """
+    parts = []
+    size = 0
+    pending = ''
+    start = 0
+    end_of_text = len(text)
+    while start < end_of_text and size < cap:
+        end = start + chunk
+        if end < end_of_text:
+            m = _ENTITY_BREAK_RE.search(text, end)
+            end = m.start() if m else end_of_text
+        else:
+            end = end_of_text
+        pending += html.unescape(text[start:end])
+        start = end
+
+        cut = len(pending)
+        if start < end_of_text:
+            unclosed = pending.find('<', pending.rfind('>') + 1)
+            if unclosed != -1:
+                cut = unclosed
+        piece = _HTML_TAG_RE.sub(' ', pending[:cut])
+        pending = pending[cut:]
+        parts.append(piece)
+        size += len(piece)
+    return ''.join(parts)[:cap]
+
 
 class RemoteOKCollector(BaseCollector):
     """Collect remote jobs from RemoteOK (free, no key)."""
@@ -23,39 +108,31 @@ class RemoteOKCollector(BaseCollector):
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize RemoteOK collector."""
         super().__init__(config or {})
+        # Reused across collect() calls so per-role searches share one connection
+        self.session = self._create_session(headers={'User-Agent': Config.USER_AGENT})
 
     def collect_all_roles(self, roles: list) -> List[Dict[str, Any]]:
         """Fetch once and filter by multiple roles (avoids repeated API calls)."""
         self.logger.info("Fetching RemoteOK (all roles)")
+
+        all_role_words = set()
+        for r in roles:
+            all_role_words.update(r.lower().split())
+
         try:
-            resp = requests.get(
-                self.API_URL,
-                headers={'User-Agent': Config.USER_AGENT},
-                timeout=30
-            )
+            resp = self.session.get(self.API_URL, timeout=30)
             resp.raise_for_status()
-            data = resp.json()
+            items = (self._matching_items(resp.content, _role_title_matcher(all_role_words))
+                     if all_role_words else [])
         except Exception as e:
             self.logger.error(f"RemoteOK API error: {e}")
             return []
 
-        if not isinstance(data, list) or len(data) < 2:
-            return []
-
-        all_role_words = set()
-        for r in roles:
-            all_role_words.update(r.lower().split())
-
         jobs = []
         seen_ids = set()
-        for item in data[1:]:
-            if not isinstance(item, dict):
-                continue
+        for item in items:
             try:
-                title = (item.get('position') or item.get('title') or '').strip()
-                if not title or not all_role_words.intersection(set(title.lower().split())):
-                    continue
-                job = self._parse_job(item, all_role_words)
+                job = self._parse_job(item)  # Title already matched
                 if job and job['job_id'] not in seen_ids:
                     seen_ids.add(job['job_id'])
                     jobs.append(job)
@@ -65,32 +142,58 @@ class RemoteOKCollector(BaseCollector):
         self.logger.info(f"Collected {len(jobs)} jobs from RemoteOK")
         return jobs
 
+    def _matching_items(self, body: bytes, title_matches) -> List[Dict[str, Any]]:
+        """
+        Job items of an API response whose title passes title_matches.
+
+        With pysimdjson installed the response is parsed lazily: only each
+        item's title is read, and only matching items become dicts. Otherwise
+        the whole response is parsed and then filtered.
+
+        Args:
+            body: Raw API response (a JSON array led by a legal notice)
+            title_matches: Predicate on an item's position/title value
+
+        Returns:
+            Matching items as dicts, in API order
+        """
+        if simdjson is not None:
+            parser = simdjson.Parser()
+            data = parser.parse(body)
+            if not isinstance(data, simdjson.Array):
+                return []
+            items = []
+            for i, element in enumerate(data):
+                if i == 0 or not isinstance(element, simdjson.Object):
+                    continue
+                if title_matches(element.get('position') or element.get('title')):
+                    items.append(element.as_dict())
+            return items
+
+        data = parse_json(body)
+        if not isinstance(data, list):
+            return []
+        return [
+            item for item in data[1:]
+            if isinstance(item, dict) and title_matches(item.get('position') or item.get('title'))
+        ]
+
     def collect(self, city: str, role: str, max_pages: int = 1) -> List[Dict[str, Any]]:
         """Collect jobs - single page (API returns all jobs). Filter by role."""
         self.logger.info(f"Fetching RemoteOK: {role}")
 
         try:
-            resp = requests.get(
-                self.API_URL,
-                headers={'User-Agent': Config.USER_AGENT},
-                timeout=30
-            )
+            resp = self.session.get(self.API_URL, timeout=30)
             resp.raise_for_status()
-            data = resp.json()
+            items = self._matching_items(resp.content, _role_title_matcher(set(role.lower().split())))
         except Exception as e:
             self.logger.error(f"RemoteOK API error: {e}")
             return []
 
-        if not isinstance(data, list) or len(data) < 2:
-            return []
-
         jobs = []
-        role_words = set(role.lower().split())
-        for item in data[1:]:  # Skip first (API info)
-            if not isinstance(item, dict):
-                continue
+        for item in items:
             try:
-                job = self._parse_job(item, role_words)
+                job = self._parse_job(item)  # Title already matched
                 if job:
                     jobs.append(job)
             except Exception as e:
@@ -107,10 +210,8 @@ class RemoteOKCollector(BaseCollector):
         if not title:
             return None
 
-        if role_words:
-            title_lower = title.lower()
-            if not role_words.intersection(set(title_lower.split())):
-                return None
+        if role_words and role_words.isdisjoint(title.lower().split()):
+            return None
 
         company = (data.get('company') or 'Unknown').strip()
         if not company:
@@ -125,35 +226,31 @@ class RemoteOKCollector(BaseCollector):
 
         desc = data.get('description', '') or ''
         if isinstance(desc, str):
-            from html import unescape
-            import html
-            desc = html.unescape(desc)
-            import re as re_mod
-            desc = re_mod.sub(r'<[^>]+>', ' ', desc)[:2000]
+            desc = _strip_html_capped(desc)
 
         date_str = data.get('date', '')
         posted = datetime.now().date().isoformat()
         if date_str:
-            m = re.search(r'(\d{4}-\d{2}-\d{2})', str(date_str))
+            m = _ISO_DATE_RE.search(str(date_str))
             if m:
                 posted = m.group(1)
 
         url = (data.get('url') or '').strip() or f"https://remoteok.com/remote-jobs/{data.get('slug', job_id)}"
 
-        return {
-            'source': 'remoteok',
-            'job_id': f"remoteok_{job_id}",
-            'title': title,
-            'company': company,
-            'city': city,
-            'province': province,
-            'description': desc[:2000] if desc else '',
-            'salary_min': None,
-            'salary_max': None,
-            'remote_type': 'remote',
-            'posted_date': posted,
-            'url': url or f"https://remoteok.com/"
-        }
+        return JobRecord(
+            source='remoteok',
+            job_id=f"remoteok_{job_id}",
+            title=title,
+            company=company,
+            city=city,
+            province=province,
+            description=desc if isinstance(desc, str) else '',
+            salary_min=None,
+            salary_max=None,
+            remote_type='remote',
+            posted_date=posted,
+            url=url or f"https://remoteok.com/"
+        )
 
     def _parse_location(self, loc: str) -> tuple:
         """Parse location to (city, province)."""
@@ -163,11 +260,10 @@ class RemoteOKCollector(BaseCollector):
         if 'canada' in loc_lower or 'ca' in loc_lower:
             parts = [p.strip() for p in loc.split(',')]
             city = parts[0] if parts else 'Remote'
-            prov_map = {'ontario': 'ON', 'on': 'ON', 'alberta': 'AB', 'ab': 'AB',
-                        'british columbia': 'BC', 'bc': 'BC', 'quebec': 'QC', 'qc': 'QC'}
             province = ''
             for p in parts[1:]:
-                province = prov_map.get(p.lower(), prov_map.get(p.lower()[:2], ''))
+                p_lower = p.lower()
+                province = _PROVINCE_MAP.get(p_lower) or _PROVINCE_MAP.get(p_lower[:2], '')
                 if province:
                     break
             province = province or 'ON'
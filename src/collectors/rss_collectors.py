@@ -3,15 +3,32 @@ RSS feed collectors - Indeed and Workopolis.
 """
 
 import re
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlparse
 
 import feedparser
 
-from .base_collector import BaseCollector
-from utils import retry_on_exception, Config
+from .base_collector import BaseCollector, short_hash
+from utils import retry_on_exception, Config, host_rate_limiter, RateLimitedError
+
+
+# Sent with every feed request; Accept asks for XML rather than an HTML page
+_FEED_HEADERS = {
+    'User-Agent': Config.USER_AGENT,
+    'Accept': 'application/rss+xml, application/xml, text/xml'
+}
+
+# City (lowercase) -> 2-letter province code, shared by both feeds
+_PROVINCE_BY_CITY = {
+    'toronto': 'ON', 'ottawa': 'ON', 'mississauga': 'ON', 'hamilton': 'ON',
+    'calgary': 'AB', 'edmonton': 'AB',
+    'vancouver': 'BC', 'victoria': 'BC', 'surrey': 'BC',
+    'saskatoon': 'SK', 'regina': 'SK',
+    'winnipeg': 'MB',
+    'montreal': 'QC', 'quebec city': 'QC', 'laval': 'QC'
+}
 
 
 class IndeedRSSCollector(BaseCollector):
@@ -30,10 +47,14 @@ class IndeedRSSCollector(BaseCollector):
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize Indeed RSS collector."""
         super().__init__(config or {})
+        # Shared session so feeds for every city/role reuse keep-alive
+        # connections instead of a new TCP+TLS handshake per fetch
+        self.session = self._create_session(headers=_FEED_HEADERS)
     
     @retry_on_exception(
         exceptions=(Exception,),
-        max_attempts=Config.MAX_RETRIES
+        max_attempts=Config.MAX_RETRIES,
+        return_none=True
     )
     def _fetch_feed(self, url: str) -> Optional[feedparser.FeedParserDict]:
         """
@@ -46,10 +67,20 @@ class IndeedRSSCollector(BaseCollector):
             Parsed feed or None if failed. Returns feed even if bozo (malformed)
             if entries exist - we can still extract some jobs.
         """
+        host = urlparse(url).netloc
         try:
+            host_rate_limiter.acquire(host)
+            resp = self.session.get(url, timeout=15)
+            retry_after = host_rate_limiter.update_from_headers(host, resp.headers)
+            if resp.status_code == 429:
+                self.logger.warning("Indeed RSS rate limit reached")
+                raise RateLimitedError(host, retry_after)
+            if resp.status_code >= 400:
+                self.logger.warning(f"Indeed RSS returned HTTP {resp.status_code}")
+                return None
             # Use tolerant parsing - ignore some XML errors
             feed = feedparser.parse(
-                url,
+                resp.content,
                 response_headers={'Content-Type': 'application/xml'},
                 sanitize_html=False
             )
@@ -57,6 +88,8 @@ class IndeedRSSCollector(BaseCollector):
                 self.logger.warning(f"RSS feed parsing issue: {feed.bozo_exception}")
             # Return feed even if bozo - we may still have entries
             return feed
+        except RateLimitedError:
+            raise
         except Exception as e:
             self.logger.error(f"Failed to fetch RSS feed: {e}")
             return None
@@ -75,32 +108,36 @@ class IndeedRSSCollector(BaseCollector):
         """
         self.logger.info(f"Fetching Indeed RSS: {role} in {city}")
         
-        # Try multiple URL formats (Indeed has changed RSS over time)
-        urls_to_try = [
-            self._build_url(city, role, base="https://rss.indeed.com/rss"),
-            self._build_url(city, role, base="https://ca.indeed.com/rss"),
-        ]
+        # Try multiple URL formats (Indeed has changed RSS over time). They are
+        # on different hosts, so fetch them all at once and take the first in
+        # order that has entries - a failing endpoint no longer delays the next
+        urls_to_try = [self._build_url(city, role, base=base) for base in self.BASE_URLS]
         
         feed = None
-        for url in urls_to_try:
-            feed = self._fetch_feed(url)
-            if feed and feed.entries:
-                break
+        executor = ThreadPoolExecutor(max_workers=len(urls_to_try))
+        try:
+            futures = [executor.submit(self._fetch_feed, url) for url in urls_to_try]
+            for future in futures:
+                feed = future.result()
+                if feed and feed.entries:
+                    break
+        finally:
+            # Don't wait on fallback fetches once a feed has been chosen
+            executor.shutdown(wait=False, cancel_futures=True)
         
         if not feed or not feed.entries:
             self.logger.warning("Failed to fetch Indeed RSS feed or no entries found")
             return []
         
-        # Parse jobs from feed
+        # Parse jobs from feed; province and fallback date are the same for every entry
+        province = self._infer_province(city)
+        today = datetime.now().date().isoformat()
         jobs = []
         for entry in feed.entries:
-            try:
-                job = self._parse_entry(entry, city)
-                if job:
-                    jobs.append(job)
-            except Exception as e:
-                self.logger.debug(f"Failed to parse RSS entry: {e}")
-                continue
+            # _parse_entry logs and returns None for entries it can't parse
+            job = self._parse_entry(entry, city, province, today)
+            if job:
+                jobs.append(job)
         
         self.logger.info(f"Collected {len(jobs)} jobs from Indeed RSS")
         return jobs
@@ -132,13 +169,16 @@ class IndeedRSSCollector(BaseCollector):
         query_string = urlencode(params)
         return f"{base}?{query_string}"
     
-    def _parse_entry(self, entry: feedparser.FeedParserDict, city: str) -> Optional[Dict[str, Any]]:
+    def _parse_entry(self, entry: feedparser.FeedParserDict, city: str,
+                     province: str = None, today: str = None) -> Optional[Dict[str, Any]]:
         """
         Parse single RSS entry to job dictionary.
         
         Args:
             entry: Feed entry
             city: City for location normalization
+            province: Province code for city, if already known
+            today: Fallback posted date (ISO); computed if not given
             
         Returns:
             Job dictionary or None
@@ -153,22 +193,22 @@ class IndeedRSSCollector(BaseCollector):
                 return None
             
             # Generate job ID from link
-            job_id = hashlib.md5(link.encode()).hexdigest()[:12]
+            job_id = short_hash(link)
             
             # Extract company (Indeed puts company in title like "Job Title - Company")
             company = "Unknown"
-            if ' - ' in title:
-                parts = title.split(' - ')
-                if len(parts) >= 2:
-                    company = parts[-1].strip()
-                    title = ' - '.join(parts[:-1]).strip()
+            head, sep, tail = title.rpartition(' - ')
+            if sep:
+                company = tail.strip()
+                title = head.strip()
             
             # Parse published date
             published = entry.get('published_parsed') or entry.get('updated_parsed')
-            posted_date = self._parse_date(published)
+            posted_date = self._parse_date(published, today)
             
-            # Parse province from city
-            province = self._infer_province(city)
+            # Parse province from city, unless the caller already did
+            if province is None:
+                province = self._infer_province(city)
             
             return {
                 'source': 'indeed',
@@ -189,12 +229,13 @@ class IndeedRSSCollector(BaseCollector):
             self.logger.debug(f"Failed to parse RSS entry: {e}")
             return None
     
-    def _parse_date(self, published: Optional[tuple]) -> str:
+    def _parse_date(self, published: Optional[tuple], today: str = None) -> str:
         """
         Parse published date from feed.
         
         Args:
             published: Time tuple from feedparser
+            today: Returned when published is missing or invalid; computed if not given
             
         Returns:
             ISO format date string
@@ -203,9 +244,9 @@ class IndeedRSSCollector(BaseCollector):
             try:
                 date = datetime(*published[:6]).date()
                 return date.isoformat()
-            except:
+            except (TypeError, ValueError, OverflowError):
                 pass
-        return datetime.now().date().isoformat()
+        return today or datetime.now().date().isoformat()
     
     def _infer_province(self, city: str) -> str:
         """
@@ -217,15 +258,7 @@ class IndeedRSSCollector(BaseCollector):
         Returns:
             2-letter province code
         """
-        province_map = {
-            'toronto': 'ON', 'ottawa': 'ON', 'mississauga': 'ON', 'hamilton': 'ON',
-            'calgary': 'AB', 'edmonton': 'AB',
-            'vancouver': 'BC', 'victoria': 'BC', 'surrey': 'BC',
-            'saskatoon': 'SK', 'regina': 'SK',
-            'winnipeg': 'MB',
-            'montreal': 'QC', 'quebec city': 'QC', 'laval': 'QC'
-        }
-        return province_map.get(city.lower(), '')
+        return _PROVINCE_BY_CITY.get(city.lower(), '')
 
 
 class WorkopolisRSSCollector(BaseCollector):
@@ -251,26 +284,40 @@ class WorkopolisRSSCollector(BaseCollector):
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize Workopolis RSS collector."""
         super().__init__(config or {})
+        # Shared session so feeds for every city/role reuse keep-alive connections
+        self.session = self._create_session(headers=_FEED_HEADERS)
     
     @retry_on_exception(
         exceptions=(Exception,),
-        max_attempts=Config.MAX_RETRIES
+        max_attempts=Config.MAX_RETRIES,
+        return_none=True
     )
     def _fetch_feed(self, url: str) -> Optional[feedparser.FeedParserDict]:
         """Fetch and parse RSS feed. Use Accept header to request XML."""
         try:
-            import requests
-            headers = {'User-Agent': Config.USER_AGENT, 'Accept': 'application/rss+xml, application/xml, text/xml'}
-            resp = requests.get(url, headers=headers, timeout=15)
-            resp.raise_for_status()
-            ct = (resp.headers.get('Content-Type') or '').lower()
-            if 'text/html' in ct and 'xml' not in ct:
-                self.logger.warning("Workopolis returned HTML instead of RSS (feed may be deprecated)")
-                return None
-            feed = feedparser.parse(resp.content)
+            host = urlparse(url).netloc
+            host_rate_limiter.acquire(host)
+            # Streamed, so the body is only downloaded once the headers show a
+            # feed; the response is closed on every path
+            with self.session.get(url, timeout=15, stream=True) as resp:
+                retry_after = host_rate_limiter.update_from_headers(host, resp.headers)
+                if resp.status_code == 429:
+                    self.logger.warning("Workopolis RSS rate limit reached")
+                    raise RateLimitedError(host, retry_after)
+                resp.raise_for_status()
+                ct = (resp.headers.get('Content-Type') or '').lower()
+                if 'text/html' in ct and 'xml' not in ct:
+                    self.logger.warning("Workopolis returned HTML instead of RSS (feed may be deprecated)")
+                    return None
+                body = resp.content
+            # Skip feedparser's HTML sanitizer (about half its parse time), as
+            # for Indeed - summaries are only cut to 500 chars and stored
+            feed = feedparser.parse(body, sanitize_html=False)
             if feed.bozo:
                 self.logger.warning(f"RSS feed parsing issue: {feed.bozo_exception}")
             return feed
+        except RateLimitedError:
+            raise
         except Exception as e:
             self.logger.error(f"Failed to fetch RSS feed: {e}")
             return None
@@ -301,16 +348,15 @@ class WorkopolisRSSCollector(BaseCollector):
             self.logger.warning("Failed to fetch Workopolis RSS feed or no entries found")
             return []
         
-        # Parse jobs from feed
+        # Parse jobs from feed; province and fallback date are the same for every entry
+        province = self._infer_province(city)
+        today = datetime.now().date().isoformat()
         jobs = []
         for entry in feed.entries:
-            try:
-                job = self._parse_entry(entry, city)
-                if job:
-                    jobs.append(job)
-            except Exception as e:
-                self.logger.debug(f"Failed to parse RSS entry: {e}")
-                continue
+            # _parse_entry logs and returns None for entries it can't parse
+            job = self._parse_entry(entry, city, province, today)
+            if job:
+                jobs.append(job)
         
         self.logger.info(f"Collected {len(jobs)} jobs from Workopolis RSS")
         return jobs
@@ -339,7 +385,8 @@ class WorkopolisRSSCollector(BaseCollector):
         query_string = urlencode(params)
         return f"{self.BASE_URL}?{query_string}"
     
-    def _parse_entry(self, entry: feedparser.FeedParserDict, city: str) -> Optional[Dict[str, Any]]:
+    def _parse_entry(self, entry: feedparser.FeedParserDict, city: str,
+                     province: str = None, today: str = None) -> Optional[Dict[str, Any]]:
         """Parse single RSS entry to job dictionary."""
         try:
             # Extract basic fields
@@ -351,17 +398,18 @@ class WorkopolisRSSCollector(BaseCollector):
                 return None
             
             # Generate job ID from link
-            job_id = hashlib.md5(link.encode()).hexdigest()[:12]
+            job_id = short_hash(link)
             
             # Extract company
             company = entry.get('source', {}).get('title', 'Unknown')
             
             # Parse published date
             published = entry.get('published_parsed') or entry.get('updated_parsed')
-            posted_date = self._parse_date(published)
+            posted_date = self._parse_date(published, today)
             
-            # Parse province from city
-            province = self._infer_province(city)
+            # Parse province from city, unless the caller already did
+            if province is None:
+                province = self._infer_province(city)
             
             return {
                 'source': 'workopolis',
@@ -382,24 +430,16 @@ class WorkopolisRSSCollector(BaseCollector):
             self.logger.debug(f"Failed to parse RSS entry: {e}")
             return None
     
-    def _parse_date(self, published: Optional[tuple]) -> str:
+    def _parse_date(self, published: Optional[tuple], today: str = None) -> str:
         """Parse published date from feed."""
         if published:
             try:
                 date = datetime(*published[:6]).date()
                 return date.isoformat()
-            except:
+            except (TypeError, ValueError, OverflowError):
                 pass
-        return datetime.now().date().isoformat()
+        return today or datetime.now().date().isoformat()
     
     def _infer_province(self, city: str) -> str:
         """Infer province from city name."""
-        province_map = {
-            'toronto': 'ON', 'ottawa': 'ON', 'mississauga': 'ON',
-            'calgary': 'AB', 'edmonton': 'AB',
-            'vancouver': 'BC', 'victoria': 'BC',
-            'saskatoon': 'SK', 'regina': 'SK',
-            'winnipeg': 'MB',
-            'montreal': 'QC', 'quebec city': 'QC'
-        }
-        return province_map.get(city.lower(), '')
+        return _PROVINCE_BY_CITY.get(city.lower(), '')
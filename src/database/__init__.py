@@ -2,7 +2,7 @@
 
 from .models import Base, JobRaw, JobFeatures, SkillsMaster, ScraperMetrics
 from .connection import DatabaseConnection, get_db, close_db
-from .storage import JobStorage
+from .storage import JobStorage, BulkJobBuffer
 
 __all__ = [
     'Base',
@@ -12,6 +12,7 @@ __all__ = [
     'ScraperMetrics',
     'DatabaseConnection',
     'JobStorage',
+    'BulkJobBuffer',
     'get_db',
     'close_db'
 ]
@@ -3,8 +3,14 @@ Database connection management for Canada Tech Job Compass.
 """
 
 from contextlib import contextmanager
-from typing import Generator
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, Optional, Tuple
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
@@ -24,6 +30,76 @@ _POOLER_REGIONS = [
     'sa-east-1',
 ]
 
+# Tables reported by DatabaseConnection.get_table_counts()
+_COUNTED_TABLES = ('jobs_raw', 'jobs_features', 'skills_master', 'scraper_metrics')
+
+
+def _pooler_cache_path() -> str:
+    return os.path.join(Config.CACHE_DIR, 'pooler_region.json')
+
+
+def _db_url_fingerprint() -> str:
+    # Identifies the project without writing its credentials to disk
+    return hashlib.sha256((Config.SUPABASE_DB_URL or '').encode()).hexdigest()
+
+
+def _load_cached_pooler() -> Optional[Tuple[bool, str]]:
+    """
+    (use_session_port, region) that last connected for this SUPABASE_DB_URL, if any.
+    
+    Lets startup try the known-good pooler first instead of probing every
+    region again.
+    """
+    if not Config.CACHE_ENABLED:
+        return None
+    try:
+        with open(_pooler_cache_path(), encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('db_url_sha256') == _db_url_fingerprint():
+            return bool(cached['use_session']), cached['region']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
+
+
+def _save_cached_pooler(region: Optional[str], use_session: bool = True) -> None:
+    """Remember the pooler that connected (region None forgets it). Best-effort."""
+    if not Config.CACHE_ENABLED:
+        return
+    path = _pooler_cache_path()
+    try:
+        if region is None:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'db_url_sha256': _db_url_fingerprint(), 'region': region,
+                       'use_session': use_session, 'ts': time.time()}, f)
+    except OSError:
+        pass
+
+
+def _new_engine(url: str):
+    """
+    Pooled engine for url.
+    
+    Connections are handed out most-recently-used first, so a few stay warm
+    and idle extras age out, and are replaced after DB_POOL_RECYCLE seconds
+    rather than pinged with SELECT 1 on every checkout (DB_PRE_PING opts back in).
+    """
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_pre_ping=Config.DB_PRE_PING,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_use_lifo=True,
+        echo=Config.DEBUG,
+        future=True
+    )
+
 
 def _create_engine_with_retry():
     """Create engine, trying other pooler regions when derived pooler returns Tenant/user not found."""
@@ -35,30 +111,14 @@ def _create_engine_with_retry():
         )
     # Explicit pooler or direct URL - try once
     if Config.SUPABASE_DB_POOLER_URL and 'pooler.supabase.com' in Config.SUPABASE_DB_POOLER_URL:
-        engine = create_engine(
-            db_url,
-            poolclass=QueuePool,
-            pool_size=Config.DB_POOL_SIZE,
-            max_overflow=Config.DB_MAX_OVERFLOW,
-            pool_pre_ping=True,
-            echo=Config.DEBUG,
-            future=True
-        )
+        engine = _new_engine(db_url)
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
         logger.info("Database connected (explicit pooler URL)")
         return engine
     if 'pooler' not in db_url:
         try:
-            engine = create_engine(
-                db_url,
-                poolclass=QueuePool,
-                pool_size=Config.DB_POOL_SIZE,
-                max_overflow=Config.DB_MAX_OVERFLOW,
-                pool_pre_ping=True,
-                echo=Config.DEBUG,
-                future=True
-            )
+            engine = _new_engine(db_url)
             with engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
             logger.info("Database connected (direct URL)")
@@ -70,35 +130,35 @@ def _create_engine_with_retry():
                     raise
             else:
                 raise
-    # Derived pooler or fallback from DNS - try Session (5432) then Transaction (6543) per region
+    # Derived pooler or fallback from DNS - try Session (5432) then Transaction (6543) per region,
+    # starting with whichever pooler connected last time
     regions = [Config.SUPABASE_POOLER_REGION] + [r for r in _POOLER_REGIONS if r != Config.SUPABASE_POOLER_REGION]
+    attempts = [(use_session, region) for use_session in (True, False) for region in regions]
+    cached = _load_cached_pooler()
+    if cached in attempts:
+        attempts.remove(cached)
+        attempts.insert(0, cached)
     last_error = None
-    for use_session in (True, False):
+    for use_session, region in attempts:
         mode = "Session" if use_session else "Transaction"
-        for region in regions:
-            derived = _derive_pooler_url(Config.SUPABASE_DB_URL, region, use_session_port=use_session)
-            if not derived:
-                continue
-            try:
-                engine = create_engine(
-                    derived,
-                    poolclass=QueuePool,
-                    pool_size=Config.DB_POOL_SIZE,
-                    max_overflow=Config.DB_MAX_OVERFLOW,
-                    pool_pre_ping=True,
-                    echo=Config.DEBUG,
-                    future=True
-                )
-                with engine.connect() as conn:
-                    conn.execute(text("SELECT 1"))
-                logger.info(f"Database connected (pooler {mode} mode, region={region})")
-                return engine
-            except Exception as e:
-                last_error = e
-                err_lower = str(e).lower()
-                if 'tenant' in err_lower or 'user not found' in err_lower:
-                    continue  # Try next region
-                raise
+        derived = _derive_pooler_url(Config.SUPABASE_DB_URL, region, use_session_port=use_session)
+        if not derived:
+            continue
+        try:
+            engine = _new_engine(derived)
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            logger.info(f"Database connected (pooler {mode} mode, region={region})")
+            _save_cached_pooler(region, use_session)
+            return engine
+        except Exception as e:
+            last_error = e
+            if (use_session, region) == cached:
+                _save_cached_pooler(None)  # Stale - probe the rest as usual
+            err_lower = str(e).lower()
+            if 'tenant' in err_lower or 'user not found' in err_lower:
+                continue  # Try next region
+            raise
     import re
     project_ref = ""
     if Config.SUPABASE_DB_URL:
@@ -120,6 +180,10 @@ def _create_engine_with_retry():
 class DatabaseConnection:
     """Manages database connections with connection pooling."""
     
+    # Seconds test_connection() / get_table_counts() results are reused, so
+    # health checks polled in a burst cost one round trip instead of one each
+    RESULT_CACHE_TTL = 5.0
+    
     def __init__(self):
         """Initialize database connection with connection pooling."""
         logger.info("Initializing database connection...")
@@ -131,8 +195,39 @@ class DatabaseConnection:
             bind=self.engine
         )
         
+        # method name -> (monotonic time computed, result)
+        self._result_cache: Dict[str, Tuple[float, Any]] = {}
+        self._result_cache_lock = threading.Lock()
+        
         logger.info("Database connection initialized successfully")
     
+    def _cached_result(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return compute()'s result, reusing one from the last RESULT_CACHE_TTL seconds.
+        
+        Args:
+            name: Cache key (the calling method's name)
+            compute: Runs the query; results that are False or None are not cached
+            
+        Returns:
+            Cached or freshly computed result
+        """
+        now = time.monotonic()
+        with self._result_cache_lock:
+            hit = self._result_cache.get(name)
+        if hit and now - hit[0] < self.RESULT_CACHE_TTL:
+            return hit[1]
+        result = compute()
+        if result:
+            with self._result_cache_lock:
+                self._result_cache[name] = (now, result)
+        return result
+    
+    def invalidate_cached_results(self):
+        """Drop cached test_connection() / get_table_counts() results."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+    
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """
@@ -149,6 +244,8 @@ class DatabaseConnection:
         try:
             yield session
             session.commit()
+            # Row counts may have changed
+            self.invalidate_cached_results()
         except Exception as e:
             session.rollback()
             logger.error(f"Database transaction failed: {e}", exc_info=True)
@@ -158,11 +255,15 @@ class DatabaseConnection:
     
     def test_connection(self) -> bool:
         """
-        Test database connection.
+        Test database connection. A success is reused for RESULT_CACHE_TTL seconds.
         
         Returns:
             True if connection successful, False otherwise
         """
+        return self._cached_result('test_connection', self._run_connection_test)
+    
+    def _run_connection_test(self) -> bool:
+        """Run SELECT 1 and report whether it returned 1."""
         try:
             with self.engine.connect() as conn:
                 result = conn.execute(text("SELECT 1"))
@@ -177,30 +278,75 @@ class DatabaseConnection:
             logger.error(f"✗ Database connection test failed: {e}", exc_info=True)
             return False
     
-    def get_table_counts(self) -> dict:
+    def get_table_counts(self, exact: bool = True) -> dict:
         """
         Get row counts for all main tables.
         
+        Reused for RESULT_CACHE_TTL seconds, or until a session commits.
+        
+        Args:
+            exact: COUNT(*) every table in one query (scans each table). With
+                False, read the planner's pg_class.reltuples estimates instead -
+                a catalog lookup, current as of the last VACUUM/ANALYZE
+            
         Returns:
-            Dictionary with table names and row counts
+            Dictionary with table names and row counts (None where unknown)
         """
-        counts = {}
-        tables = ['jobs_raw', 'jobs_features', 'skills_master', 'scraper_metrics']
+        if exact:
+            return dict(self._cached_result('get_table_counts', self._count_tables))
+        return dict(self._cached_result('get_table_counts_estimate', self._estimate_table_counts))
+    
+    def _count_tables(self) -> dict:
+        """COUNT(*) each main table in one round trip (None where it fails)."""
+        query = " UNION ALL ".join(
+            f"SELECT '{table}', COUNT(*) FROM {table}" for table in _COUNTED_TABLES
+        )
         
         with self.engine.connect() as conn:
-            for table in tables:
+            try:
+                return dict(conn.execute(text(query)).all())
+            except Exception as e:
+                # A missing table fails the whole query; count one by one so
+                # the others are still reported
+                logger.debug(f"Combined table count failed, counting separately: {e}")
+                conn.rollback()
+            
+            counts = {}
+            for table in _COUNTED_TABLES:
                 try:
                     result = conn.execute(text(f"SELECT COUNT(*) FROM {table}"))
                     counts[table] = result.scalar()
                 except Exception as e:
                     logger.warning(f"Could not get count for {table}: {e}")
+                    conn.rollback()
                     counts[table] = None
         
         return counts
     
+    def _estimate_table_counts(self) -> dict:
+        """Planner row estimates for the main tables (None if never analyzed or missing)."""
+        counts = dict.fromkeys(_COUNTED_TABLES)
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(
+                    text(
+                        "SELECT c.relname, c.reltuples::bigint FROM pg_class c "
+                        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                        "WHERE n.nspname = current_schema() AND c.relname = ANY(:names)"
+                    ),
+                    {"names": list(_COUNTED_TABLES)}
+                ).all()
+        except Exception as e:
+            logger.warning(f"Could not read table estimates: {e}")
+            return counts
+        for name, estimate in rows:
+            counts[name] = estimate if estimate >= 0 else None  # -1: never analyzed
+        return counts
+    
     def close(self):
         """Close database connection and dispose of connection pool."""
         logger.info("Closing database connection...")
+        self.invalidate_cached_results()
         self.engine.dispose()
         logger.info("Database connection closed")
 
@@ -2,8 +2,12 @@
 Storage layer - Database operations for job data.
 """
 
-from typing import List, Dict, Any, Set, Optional
-from sqlalchemy import text
+import io
+import threading
+from collections import defaultdict
+from typing import List, Dict, Any, Set, Optional, Tuple
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 
 from database import DatabaseConnection, JobRaw, JobFeatures, ScraperMetrics
@@ -11,6 +15,25 @@ from utils import setup_logger
 
 logger = setup_logger(__name__)
 
+# Column order used when streaming rows through COPY
+RAW_JOB_COLUMNS = (
+    'source', 'job_id', 'title', 'company', 'city', 'province', 'description',
+    'salary_min', 'salary_max', 'remote_type', 'posted_date', 'url'
+)
+
+
+def _copy_value(value: Any) -> str:
+    """Format a value for PostgreSQL COPY text format."""
+    if value is None:
+        return '\\N'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
 
 class JobStorage:
     """Handle database storage operations."""
@@ -29,6 +52,11 @@ class JobStorage:
         """
         Insert raw jobs into database.
         
+        Uses a single INSERT ... ON CONFLICT (job_id) DO NOTHING RETURNING job_id,
+        so duplicates are skipped server-side and the inserted count comes from
+        the returned rows. If the batch fails (e.g. one row violates a column
+        constraint) it is retried row by row so the good rows still land.
+        
         Args:
             jobs: List of validated job dictionaries
             source: Source name for metrics
@@ -39,6 +67,67 @@ class JobStorage:
         if not jobs:
             return 0
         
+        rows = []
+        for job in jobs:
+            # Fix invalid salary (min > max violates DB constraint)
+            salary_min = job.get('salary_min')
+            salary_max = job.get('salary_max')
+            if salary_min is not None and salary_max is not None and salary_min > salary_max:
+                salary_min, salary_max = salary_max, salary_min
+            rows.append({
+                'source': job['source'],
+                'job_id': job['job_id'],
+                'title': job['title'],
+                'company': job['company'],
+                'city': job['city'],
+                'province': job['province'],
+                'description': job.get('description', ''),
+                'salary_min': salary_min,
+                'salary_max': salary_max,
+                'remote_type': job.get('remote_type'),
+                'posted_date': job['posted_date'],
+                'url': job['url']
+            })
+        
+        try:
+            with self.db.get_session() as session:
+                stmt = (
+                    pg_insert(JobRaw)
+                    .values(rows)
+                    .on_conflict_do_nothing(index_elements=['job_id'])
+                    .returning(JobRaw.job_id)
+                )
+                inserted = len(session.execute(stmt).fetchall())
+                session.commit()
+        except Exception as e:
+            self.logger.warning(f"Batch insert failed for {source} ({e}); retrying row by row")
+            return self._insert_raw_jobs_rowwise(jobs, source)
+        
+        duplicates = len(jobs) - inserted
+        self.logger.info(
+            f"Inserted {inserted} jobs from {source} "
+            f"({duplicates} duplicates, 0 errors)"
+        )
+        
+        # Record metrics
+        try:
+            self._record_metrics(source, len(jobs), inserted, duplicates, 0)
+        except Exception as e:
+            self.logger.warning(f"Failed to record metrics: {e}")
+        
+        return inserted
+    
+    def _insert_raw_jobs_rowwise(self, jobs: List[Dict[str, Any]], source: str) -> int:
+        """
+        Insert raw jobs one at a time, counting failures instead of aborting.
+        
+        Args:
+            jobs: List of validated job dictionaries
+            source: Source name for metrics
+            
+        Returns:
+            Number of jobs inserted
+        """
         inserted = 0
         duplicates = 0
         errors = 0
@@ -99,6 +188,74 @@ class JobStorage:
         
         return inserted
     
+    def bulk_insert_raw_jobs(self, jobs: List[Dict[str, Any]], source: str) -> int:
+        """
+        Insert raw jobs in one round-trip using COPY into a temp staging table.
+        
+        Rows are streamed with COPY, then moved into jobs_raw with
+        INSERT ... SELECT ... ON CONFLICT DO NOTHING so duplicates are skipped
+        server-side. Falls back to insert_raw_jobs() if the bulk path fails
+        (e.g. one row violates a column constraint).
+        
+        Args:
+            jobs: List of validated job dictionaries
+            source: Source name for metrics
+            
+        Returns:
+            Number of jobs inserted
+        """
+        if not jobs:
+            return 0
+        
+        buf = io.StringIO()
+        for job in jobs:
+            # Fix invalid salary (min > max violates DB constraint)
+            salary_min = job.get('salary_min')
+            salary_max = job.get('salary_max')
+            if salary_min is not None and salary_max is not None and salary_min > salary_max:
+                salary_min, salary_max = salary_max, salary_min
+            row = {**job, 'salary_min': salary_min, 'salary_max': salary_max,
+                   'description': job.get('description', '')}
+            buf.write('\t'.join(_copy_value(row.get(col)) for col in RAW_JOB_COLUMNS))
+            buf.write('\n')
+        buf.seek(0)
+        
+        columns = ', '.join(RAW_JOB_COLUMNS)
+        conn = self.db.engine.raw_connection()
+        try:
+            cur = conn.cursor()
+            cur.execute(
+                "CREATE TEMP TABLE jobs_raw_stage (LIKE jobs_raw INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cur.copy_expert(f"COPY jobs_raw_stage ({columns}) FROM STDIN", buf)
+            cur.execute(
+                f"INSERT INTO jobs_raw ({columns}) "
+                f"SELECT DISTINCT ON (job_id) {columns} FROM jobs_raw_stage "
+                f"ON CONFLICT (job_id) DO NOTHING"
+            )
+            inserted = cur.rowcount
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            self.logger.warning(f"Bulk insert failed for {source} ({e}); falling back to row inserts")
+            return self._insert_raw_jobs_rowwise(jobs, source)
+        finally:
+            conn.close()
+        
+        duplicates = len(jobs) - inserted
+        self.logger.info(
+            f"Inserted {inserted} jobs from {source} "
+            f"({duplicates} duplicates, 0 errors)"
+        )
+        
+        # Record metrics
+        try:
+            self._record_metrics(source, len(jobs), inserted, duplicates, 0)
+        except Exception as e:
+            self.logger.warning(f"Failed to record metrics: {e}")
+        
+        return inserted
+    
     def insert_features(self, features: List[Dict[str, Any]]) -> int:
         """
         Insert job features into database.
@@ -196,21 +353,82 @@ class JobStorage:
             self.logger.error(f"Failed to update job {job_id}: {e}")
             return False
 
-    def get_existing_job_ids(self, source: str = None) -> Set[str]:
+    def update_jobs_description_and_salary(
+        self,
+        updates: List[Tuple[str, str, Optional[int], Optional[int]]],
+        page_size: int = 1000
+    ) -> int:
+        """
+        Batch version of update_job_description_and_salary().
+        
+        Sends all rows with UPDATE ... FROM (VALUES ...) via execute_values, so
+        each page of rows is one statement instead of a SELECT + UPDATE per job.
+        Same semantics as the single-row method: an empty description or a
+        None salary leaves the stored value unchanged.
+        
+        Args:
+            updates: List of (job_id, description, salary_min, salary_max) tuples
+            page_size: Rows per generated UPDATE statement
+            
+        Returns:
+            Number of jobs updated
+        """
+        if not updates:
+            return 0
+        
+        from psycopg2.extras import execute_values
+        
+        conn = self.db.engine.raw_connection()
+        try:
+            cur = conn.cursor()
+            returned = execute_values(
+                cur,
+                """
+                UPDATE jobs_raw AS j SET
+                    description = COALESCE(NULLIF(v.description, ''), j.description),
+                    salary_min = COALESCE(v.salary_min, j.salary_min),
+                    salary_max = COALESCE(v.salary_max, j.salary_max)
+                FROM (VALUES %s) AS v(job_id, description, salary_min, salary_max)
+                WHERE j.job_id = v.job_id
+                RETURNING j.job_id
+                """,
+                updates,
+                template="(%s, %s, %s::int, %s::int)",
+                page_size=page_size,
+                fetch=True  # rowcount only covers the last page
+            )
+            updated = len(returned)
+            conn.commit()
+            return updated
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Failed to batch update {len(updates)} jobs: {e}")
+            return 0
+        finally:
+            conn.close()
+
+    def get_existing_job_ids(self, source: str = None, job_ids: List[str] = None) -> Set[str]:
         """
         Get set of job IDs already in database.
         
         Args:
             source: Optional source filter
+            job_ids: Optional candidate IDs - only these are looked up (an
+                index probe per ID instead of reading every stored job_id)
             
         Returns:
             Set of job_id strings
         """
+        if job_ids is not None and not job_ids:
+            return set()
+        
         with self.db.get_session() as session:
             query = session.query(JobRaw.job_id)
             
             if source:
                 query = query.filter_by(source=source)
+            if job_ids is not None:
+                query = query.filter(JobRaw.job_id.in_(job_ids))
             
             results = query.all()
             return {row[0] for row in results}
@@ -251,11 +469,100 @@ class JobStorage:
         Returns:
             Dictionary of {table_name: row_count}
         """
-        counts = {}
+        models = {'jobs_raw': JobRaw, 'jobs_features': JobFeatures, 'scraper_metrics': ScraperMetrics}
         
+        # One round trip: a scalar COUNT(*) subquery per table
         with self.db.get_session() as session:
-            counts['jobs_raw'] = session.query(JobRaw).count()
-            counts['jobs_features'] = session.query(JobFeatures).count()
-            counts['scraper_metrics'] = session.query(ScraperMetrics).count()
+            row = session.execute(select(*(
+                select(func.count()).select_from(model).scalar_subquery()
+                for model in models.values()
+            ))).one()
         
-        return counts
+        return dict(zip(models, row))
+
+
+class BulkJobBuffer:
+    """
+    Buffer collected jobs in memory and write them with bulk COPY inserts.
+    
+    Job IDs already buffered this run are dropped on add(), and the rest are
+    looked up in the database one batch at a time (no startup scan of every
+    job_id), so its return value is the number of new jobs, same as what
+    insert_raw_jobs() would have reported. `inserted` counts what the flushes
+    actually wrote. add() and flush() are serialized with a lock so several
+    collector threads can share one buffer.
+    
+    Example:
+        buffer = BulkJobBuffer(storage)
+        new = buffer.add(jobs, 'jobbank')
+        ...
+        buffer.flush()
+    """
+    
+    def __init__(self, storage: JobStorage, flush_threshold: int = 5000):
+        """
+        Initialize buffer.
+        
+        Args:
+            storage: Storage layer used to write batches
+            flush_threshold: Number of pending jobs that triggers a flush
+        """
+        self.storage = storage
+        self.flush_threshold = flush_threshold
+        self._pending: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._seen: Set[str] = set()
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.added = 0
+        self.inserted = 0
+    
+    def add(self, jobs: List[Dict[str, Any]], source: str) -> int:
+        """
+        Queue jobs for insertion, flushing once the threshold is reached.
+        
+        Args:
+            jobs: List of validated job dictionaries
+            source: Source name for metrics
+            
+        Returns:
+            Number of new jobs queued
+        """
+        with self._lock:
+            candidates = {}
+            for job in jobs:
+                if job['job_id'] not in self._seen and job['job_id'] not in candidates:
+                    candidates[job['job_id']] = job
+            self._seen.update(candidates)
+            
+            # Stored by an earlier run - one indexed lookup for the whole batch
+            stored = self.storage.get_existing_job_ids(job_ids=list(candidates))
+            new_jobs = [job for job_id, job in candidates.items() if job_id not in stored]
+            
+            self._pending[source].extend(new_jobs)
+            self.pending += len(new_jobs)
+            self.added += len(new_jobs)
+            
+            if self.pending >= self.flush_threshold:
+                self._flush_locked()
+        
+        return len(new_jobs)
+    
+    def flush(self) -> int:
+        """
+        Write all pending jobs to the database.
+        
+        Returns:
+            Number of jobs inserted by this flush
+        """
+        with self._lock:
+            return self._flush_locked()
+    
+    def _flush_locked(self) -> int:
+        """Flush pending jobs; caller must hold the lock."""
+        inserted = 0
+        for source, jobs in self._pending.items():
+            inserted += self.storage.bulk_insert_raw_jobs(jobs, source)
+        self._pending.clear()
+        self.pending = 0
+        self.inserted += inserted
+        return inserted
@@ -8,10 +8,6 @@ import sys
 import os
 from pathlib import Path
 
-# Add src to path for imports
-src_path = Path(__file__).parent
-sys.path.insert(0, str(src_path))
-
 import requests
 from bs4 import BeautifulSoup
 
@@ -60,6 +60,10 @@ def collect(city, role, pages, source):
     storage = JobStorage(db)
     
     all_jobs = []
+    # Postings repeat across city/role searches; drop IDs already collected
+    # this run. Ones stored by earlier runs are skipped by the insert's
+    # ON CONFLICT (job_id) DO NOTHING, so no job_id scan at startup
+    seen = set()
     
     # Collect from Job Bank
     if source in ('jobbank', 'all'):
@@ -69,15 +73,17 @@ def collect(city, role, pages, source):
             for r in roles:
                 logger.info(f"\n📥 Collecting {r} jobs in {c} from Job Bank...")
                 jobs = collector.collect_with_validation(c, r, pages)
-                all_jobs.extend(jobs)
-                logger.info(f"✓ Collected {len(jobs)} jobs")
+                new_jobs = [j for j in jobs if j['job_id'] not in seen]
+                seen.update(j['job_id'] for j in new_jobs)
+                all_jobs.extend(new_jobs)
+                logger.info(f"✓ Collected {len(jobs)} jobs ({len(new_jobs)} new this run)")
     
     logger.info(f"\n{'='*80}")
     logger.info(f"TOTAL COLLECTED: {len(all_jobs)} jobs")
     logger.info(f"{'='*80}")
     
     if not all_jobs:
-        logger.warning("No jobs collected!")
+        logger.warning("No new jobs collected!")
         return
     
     # Store raw jobs
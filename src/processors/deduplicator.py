@@ -2,7 +2,6 @@
 Data deduplicator - Remove duplicate job postings.
 """
 
-import hashlib
 import re
 from typing import List, Dict, Any, Set, Tuple
 from difflib import SequenceMatcher
@@ -83,18 +82,19 @@ class JobDeduplicator:
     
     def _compute_content_hash(self, job: Dict[str, Any]) -> str:
         """
-        Compute content-based hash for job.
+        Compute content-based key for job.
         
-        Uses title, company, city to identify duplicates.
+        Uses title, company, city to identify duplicates. The key only lives
+        in an in-memory set, so the normalized text itself is used rather
+        than a digest of it - no hashing cost and no collisions.
         """
         # Normalize title and company
         title = self._normalize_text(job.get('title', ''))
         company = self._normalize_text(job.get('company', ''))
         city = self._normalize_text(job.get('city', ''))
         
-        # Create hash from key fields
-        content = f"{title}::{company}::{city}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        # Create key from key fields
+        return f"{title}::{company}::{city}"
     
     def _normalize_text(self, text: str) -> str:
         """
@@ -4,14 +4,10 @@ Simple CLI to test job collection.
 
 import sys
 import os
-from pathlib import Path
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from src.collectors import JobBankCollector, RapidAPICollector, IndeedRSSCollector
-from src.database import get_db, JobRaw
-from src.utils import setup_logger, Config
+from collectors import JobBankCollector, RapidAPICollector, IndeedRSSCollector
+from database import get_db, JobRaw
+from utils import setup_logger, Config
 
 logger = setup_logger(__name__)
 
@@ -3,10 +3,6 @@ Test database connection and verify setup.
 """
 
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
 
 from database import get_db
 from utils import setup_logger
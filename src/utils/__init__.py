@@ -2,7 +2,11 @@
 
 from .config import Config
 from .logger import setup_logger, default_logger
-from .retry_logic import retry_on_exception, rate_limit, RateLimiter
+from .retry_logic import (
+    retry_on_exception, rate_limit, RateLimiter,
+    HostRateLimiter, RateLimitedError, host_rate_limiter
+)
+from .http_cache import ConditionalCache
 
 __all__ = [
     'Config',
@@ -10,5 +14,9 @@ __all__ = [
     'default_logger',
     'retry_on_exception',
     'rate_limit',
-    'RateLimiter'
+    'RateLimiter',
+    'HostRateLimiter',
+    'RateLimitedError',
+    'host_rate_limiter',
+    'ConditionalCache'
 ]
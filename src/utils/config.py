@@ -69,10 +69,16 @@ class Config:
         return cls.SUPABASE_DB_URL or ''
     DB_POOL_SIZE: int = int(os.getenv('DB_POOL_SIZE', '5'))
     DB_MAX_OVERFLOW: int = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+    # Replace pooled connections older than this many seconds (before the
+    # Supabase pooler drops them as idle), instead of pinging on every checkout
+    DB_POOL_RECYCLE: int = int(os.getenv('DB_POOL_RECYCLE', '300'))
+    DB_PRE_PING: bool = os.getenv('DB_PRE_PING', 'false').lower() == 'true'
     
     # API Keys
     RAPIDAPI_KEY: str = os.getenv('RAPIDAPI_KEY', '')
     RAPIDAPI_HOST: str = os.getenv('RAPIDAPI_HOST', 'linkedin-jobs.p.rapidapi.com')
+    # Call RapidAPI hosts over HTTP/2 when httpx[http2] is installed (ignored otherwise)
+    RAPIDAPI_HTTP2: bool = os.getenv('RAPIDAPI_HTTP2', 'true').lower() == 'true'
     ADZUNA_APP_ID: str = os.getenv('ADZUNA_APP_ID', '')
     ADZUNA_APP_KEY: str = os.getenv('ADZUNA_APP_KEY', '')
 
@@ -86,6 +92,14 @@ class Config:
     JOBBANK_RATE_LIMIT_SECONDS: float = float(os.getenv('JOBBANK_RATE_LIMIT_SECONDS', '2.5'))
     JOBBANK_MAX_PAGES: int = int(os.getenv('JOBBANK_MAX_PAGES', '5'))
     JOBBANK_REQUEST_TIMEOUT: int = int(os.getenv('JOBBANK_REQUEST_TIMEOUT', '30'))
+    # Keep-alive connections kept to jobbank.gc.ca; size to the number of concurrent searches
+    JOBBANK_POOL_SIZE: int = int(os.getenv('JOBBANK_POOL_SIZE', '20'))
+    # Result pages of one search fetched ahead in parallel (1 = one page at a time)
+    JOBBANK_PAGE_WORKERS: int = int(os.getenv('JOBBANK_PAGE_WORKERS', '2'))
+    # Fetch Job Bank over HTTP/2 when httpx[http2] is installed (ignored otherwise)
+    JOBBANK_HTTP2: bool = os.getenv('JOBBANK_HTTP2', 'true').lower() == 'true'
+    # Starting per-host request rate for APIs; adjusted from their rate-limit headers
+    API_REQUESTS_PER_SECOND: float = float(os.getenv('API_REQUESTS_PER_SECOND', '2'))
     
     # Selenium Configuration
     SELENIUM_HEADLESS: bool = os.getenv('SELENIUM_HEADLESS', 'true').lower() == 'true'
@@ -123,6 +137,8 @@ class Config:
     CACHE_ENABLED: bool = os.getenv('CACHE_ENABLED', 'true').lower() == 'true'
     CACHE_DIR: str = os.getenv('CACHE_DIR', 'cache')
     CACHE_TTL_HOURS: int = int(os.getenv('CACHE_TTL_HOURS', '24'))
+    # Seconds a quota-limited API response (JSearch, RapidAPI) is reused without a request (0 = off)
+    HTTP_CACHE_TTL: int = int(os.getenv('HTTP_CACHE_TTL', '900'))
     
     # Logging Configuration
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
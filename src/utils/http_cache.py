@@ -0,0 +1,150 @@
+"""
+Conditional-GET cache - remembers ETag / Last-Modified per request so
+unchanged pages come back as a bodiless 304 instead of a full download.
+With a TTL it also serves recent bodies without any request at all.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .config import Config
+
+
+class ConditionalCache:
+    """
+    SQLite store of (validators, body) per request key.
+
+    Only responses that carry an ETag or Last-Modified are stored, since
+    nothing else can be revalidated - unless ttl_seconds is set, in which
+    case every stored body is also served by get_fresh() until it is that
+    old (for quota-limited APIs that send no validators). Entries older
+    than max_age_seconds are pruned as new ones are stored, so the file
+    doesn't keep every page ever fetched. Thread-safe; errors are swallowed
+    so the cache can never fail a fetch.
+
+    Example:
+        cache = ConditionalCache()
+
+        response = session.get(url, headers=cache.conditional_headers(key))
+        body, response = cache.body_or_refetch(key, response, lambda: session.get(url))
+        if not body:
+            cache.store(key, response)
+    """
+
+    # Minimum seconds between two prunes of expired entries
+    PRUNE_INTERVAL = 300
+
+    def __init__(self, db_path: str = None, ttl_seconds: float = None, max_age_seconds: float = None):
+        """
+        Initialize conditional cache.
+
+        Args:
+            db_path: SQLite file (default: CACHE_DIR/http_cache.sqlite3)
+            ttl_seconds: Serve stored bodies from get_fresh() for this long
+                (default: None - revalidation only)
+            max_age_seconds: Delete entries stored longer ago than this
+                (default: CACHE_TTL_HOURS)
+        """
+        self.db_path = db_path or os.path.join(Config.CACHE_DIR, 'http_cache.sqlite3')
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds if max_age_seconds is not None else Config.CACHE_TTL_HOURS * 3600
+        self._lock = threading.Lock()
+        self._conn = None
+        self._last_prune = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, stored REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS http_cache_stored ON http_cache (stored)")
+            self._conn = conn
+        return self._conn
+
+    def _lookup(self, key: str) -> Optional[Tuple[str, str, bytes, float]]:
+        try:
+            with self._lock:
+                return self._connect().execute(
+                    "SELECT etag, last_modified, body, stored FROM http_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+
+    def get_fresh(self, key: str) -> Optional[Union[bytes, str]]:
+        """Return the cached body for key if it is younger than ttl_seconds (no request needed)."""
+        if not self.ttl_seconds:
+            return None
+        row = self._lookup(key)
+        if row and row[3] and time.time() - row[3] < self.ttl_seconds:
+            return row[2]
+        return None
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for key, if cached."""
+        row = self._lookup(key)
+        if not row:
+            return {}
+        headers = {}
+        if row[0]:
+            headers['If-None-Match'] = row[0]
+        if row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def get_body(self, key: str) -> Optional[Union[bytes, str]]:
+        """Return the cached raw body for key (use after a 304); str for entries stored as text."""
+        row = self._lookup(key)
+        return row[2] if row else None
+
+    def body_or_refetch(self, key: str, response,
+                        refetch: Callable[[], Any]) -> Tuple[Optional[Union[bytes, str]], Any]:
+        """
+        Resolve the response to a request sent with conditional_headers(key).
+
+        Args:
+            key: Cache key the validators came from
+            response: Response to the conditional request
+            refetch: Sends the request again without validators
+
+        Returns:
+            (body, response): the cached body and the 304 while the entry is
+            still there; (None, refetch()) if it vanished since the validators
+            were sent; (None, response) for any other status
+        """
+        if response.status_code != 304:
+            return None, response
+        body = self.get_body(key)
+        if body:
+            return body, response
+        return None, refetch()
+
+    def store(self, key: str, response) -> None:
+        """Remember a 200 response's validators and body."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified and not self.ttl_seconds:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO http_cache (key, etag, last_modified, body, stored) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, etag, last_modified, response.content, now),
+                )
+                # Drop expired entries now and then (an index range delete)
+                if self.max_age_seconds and now - self._last_prune >= self.PRUNE_INTERVAL:
+                    conn.execute("DELETE FROM http_cache WHERE stored < ?", (now - self.max_age_seconds,))
+                    self._last_prune = now
+                conn.commit()
+        except sqlite3.Error:
+            pass  # Best-effort; a missing entry just means a full download next time
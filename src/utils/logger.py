@@ -2,15 +2,95 @@
 Centralized logging configuration for Canada Tech Job Compass.
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from multiprocessing.util import Finalize
+from typing import Dict, List, Optional
 
 from .config import Config
 
 
+# One background listener per log file. Loggers only enqueue records; the
+# listener thread does the formatting and the console/file writes, so threads
+# logging from hot loops never contend for the stdout or file locks.
+_queue_handlers: Dict[str, QueueHandler] = {}
+_listeners: List[QueueListener] = []
+_listeners_lock = threading.Lock()
+
+
+def _restart_listeners_after_fork():
+    """Forked children (e.g. parse worker processes) inherit queues but not threads."""
+    global _listeners_lock
+    _listeners_lock = threading.Lock()
+    for i, old in enumerate(_listeners):
+        listener = QueueListener(old.queue, *old.handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        # multiprocessing children exit via os._exit, which skips atexit
+        Finalize(None, listener.stop, exitpriority=0)
+        _listeners[i] = listener
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_listeners_after_fork)
+
+
+def _get_queue_handler(log_file: str) -> QueueHandler:
+    """Return the shared QueueHandler for log_file, starting its listener on first use."""
+    with _listeners_lock:
+        handler = _queue_handlers.get(log_file)
+        if handler is not None:
+            return handler
+        
+        # Create formatters
+        detailed_formatter = logging.Formatter(
+            Config.LOG_FORMAT,
+            datefmt=Config.LOG_DATE_FORMAT
+        )
+        
+        simple_formatter = logging.Formatter(
+            '%(levelname)s - %(message)s'
+        )
+        
+        # Console handler (INFO and above)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(simple_formatter)
+        
+        # Ensure log directory exists
+        log_path = Path(log_file)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # File handler (rotating)
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=Config.LOG_MAX_BYTES,
+            backupCount=Config.LOG_BACKUP_COUNT,
+            encoding='utf-8'
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(detailed_formatter)
+        
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        # Drain anything still queued when the interpreter exits
+        atexit.register(listener.stop)
+        _listeners.append(listener)
+        
+        handler = QueueHandler(log_queue)
+        _queue_handlers[log_file] = handler
+        return handler
+
+
 def setup_logger(
     name: str,
     log_file: Optional[str] = None,
@@ -19,6 +99,9 @@ def setup_logger(
     """
     Set up a logger with console and file handlers.
     
+    Records are handed to a background QueueListener that owns the console
+    and rotating file handlers, so logging calls return without doing I/O.
+    
     Args:
         name: Logger name (usually __name__ from calling module)
         log_file: Path to log file (defaults to Config.LOG_FILE)
@@ -37,39 +120,10 @@ def setup_logger(
     if logger.handlers:
         return logger
     
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        Config.LOG_FORMAT,
-        datefmt=Config.LOG_DATE_FORMAT
-    )
-    
-    simple_formatter = logging.Formatter(
-        '%(levelname)s - %(message)s'
-    )
-    
-    # Console handler (INFO and above)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(simple_formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler (rotating)
     if log_file is None:
         log_file = Config.LOG_FILE
     
-    # Ensure log directory exists
-    log_path = Path(log_file)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=Config.LOG_MAX_BYTES,
-        backupCount=Config.LOG_BACKUP_COUNT,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
+    logger.addHandler(_get_queue_handler(log_file))
     
     return logger
 
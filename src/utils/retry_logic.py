@@ -3,8 +3,10 @@ Retry logic utilities with exponential backoff.
 """
 
 import time
+import threading
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Callable, Type, Tuple, Any
+from typing import Callable, Type, Tuple, Any, Dict, Mapping, Optional
 import logging
 
 from tenacity import (
@@ -25,6 +27,10 @@ def rate_limit(min_interval: float = 2.0):
     """
     Decorator to enforce minimum interval between function calls.
     
+    Thread-safe: concurrent callers reserve consecutive slots spaced
+    min_interval apart, so the start rate stays bounded while requests
+    themselves may overlap.
+    
     Args:
         min_interval: Minimum seconds between calls
         
@@ -34,18 +40,19 @@ def rate_limit(min_interval: float = 2.0):
             return requests.get(url)
     """
     def decorator(func: Callable) -> Callable:
-        last_called = [0.0]
+        next_slot = [0.0]
+        lock = threading.Lock()
         
         @wraps(func)
         def wrapper(*args, **kwargs):
-            elapsed = time.time() - last_called[0]
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
+            with lock:
+                now = time.monotonic()
+                sleep_time = next_slot[0] - now
+                next_slot[0] = max(now, next_slot[0]) + min_interval
+            if sleep_time > 0:
                 time.sleep(sleep_time)
             
-            result = func(*args, **kwargs)
-            last_called[0] = time.time()
-            return result
+            return func(*args, **kwargs)
         
         return wrapper
     return decorator
@@ -55,7 +62,8 @@ def retry_on_exception(
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
     max_attempts: int = None,
     min_wait: int = None,
-    max_wait: int = None
+    max_wait: int = None,
+    return_none: bool = False
 ):
     """
     Decorator for retrying function calls with exponential backoff.
@@ -65,6 +73,8 @@ def retry_on_exception(
         max_attempts: Maximum number of retry attempts (default: Config.MAX_RETRIES)
         min_wait: Minimum wait time in seconds (default: Config.RETRY_MIN_WAIT)
         max_wait: Maximum wait time in seconds (default: Config.RETRY_MAX_WAIT)
+        return_none: Return None instead of raising RetryError once attempts
+            are exhausted (for fetchers whose callers treat None as "no data")
         
     Example:
         @retry_on_exception(exceptions=(requests.Timeout, requests.ConnectionError))
@@ -87,7 +97,8 @@ def retry_on_exception(
         ),
         retry=retry_if_exception_type(exceptions),
         before_sleep=before_sleep_log(logger, logging.WARNING),
-        after=after_log(logger, logging.DEBUG)
+        after=after_log(logger, logging.DEBUG),
+        retry_error_callback=(lambda retry_state: None) if return_none else None
     )
 
 
@@ -95,6 +106,9 @@ class RateLimiter:
     """
     Rate limiter class for controlling request frequency.
     
+    Thread-safe: like rate_limit(), each wait() reserves the next slot under
+    a lock and sleeps outside it, so one limiter can pace a worker pool.
+    
     Example:
         limiter = RateLimiter(min_interval=2.5)
         
@@ -112,15 +126,156 @@ class RateLimiter:
         """
         self.min_interval = min_interval
         self.last_called = 0.0
+        self._lock = threading.Lock()
     
     def wait(self):
         """Wait until minimum interval has passed since last call."""
-        elapsed = time.time() - self.last_called
-        if elapsed < self.min_interval:
-            sleep_time = self.min_interval - elapsed
+        with self._lock:
+            now = time.monotonic()
+            sleep_time = self.last_called + self.min_interval - now
+            self.last_called = max(now, self.last_called + self.min_interval)
+        if sleep_time > 0:
             time.sleep(sleep_time)
-        self.last_called = time.time()
     
     def reset(self):
         """Reset the rate limiter."""
-        self.last_called = 0.0
+        with self._lock:
+            self.last_called = 0.0
+
+
+class RateLimitedError(Exception):
+    """Raised when a host answers 429; list it in retry_on_exception to back off and retry."""
+    
+    def __init__(self, host: str, retry_after: Optional[float] = None):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f"Rate limited by {host}" + (f" (retry after {retry_after:.0f}s)" if retry_after else ""))
+
+
+class HostRateLimiter:
+    """
+    Per-host token bucket that adapts to the rate-limit headers APIs send back.
+    
+    Each host starts at default_rate requests/second. After every response,
+    update_from_headers() reads Retry-After and X-RateLimit-Remaining/Reset
+    (including RapidAPI's x-ratelimit-requests-* variants) and either pauses
+    the host until the window resets or spreads the remaining quota over it.
+    Thread-safe; sleeping happens outside the lock.
+    
+    Example:
+        limiter = HostRateLimiter(default_rate=2.0)
+        
+        limiter.acquire(host)
+        response = session.get(url)
+        limiter.update_from_headers(host, response.headers)
+    """
+    
+    REMAINING_HEADERS = ('x-ratelimit-requests-remaining', 'x-ratelimit-remaining')
+    RESET_HEADERS = ('x-ratelimit-requests-reset', 'x-ratelimit-reset')
+    
+    def __init__(self, default_rate: float = 2.0, max_rate: float = 10.0, burst: int = 1):
+        """
+        Initialize host rate limiter.
+        
+        Args:
+            default_rate: Requests per second for hosts without rate headers
+            max_rate: Upper bound when headers suggest a faster rate
+            burst: Bucket capacity (requests allowed back to back)
+        """
+        self.default_rate = default_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict[str, float]] = {}
+    
+    def _bucket(self, host: str, now: float) -> Dict[str, float]:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = {'tokens': float(self.burst), 'rate': self.default_rate,
+                      'updated': now, 'blocked_until': 0.0}
+            self._buckets[host] = bucket
+        return bucket
+    
+    def acquire(self, host: str):
+        """Block until a request to host is allowed, then consume a token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                bucket = self._bucket(host, now)
+                bucket['tokens'] = min(
+                    self.burst, bucket['tokens'] + (now - bucket['updated']) * bucket['rate']
+                )
+                bucket['updated'] = now
+                if now >= bucket['blocked_until'] and bucket['tokens'] >= 1:
+                    bucket['tokens'] -= 1
+                    return
+                sleep_time = max(
+                    bucket['blocked_until'] - now,
+                    (1 - bucket['tokens']) / bucket['rate']
+                )
+            time.sleep(sleep_time)
+    
+    def block(self, host: str, seconds: float):
+        """Stop issuing requests to host for the given number of seconds."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            bucket['blocked_until'] = max(bucket['blocked_until'], now + seconds)
+    
+    def update_from_headers(self, host: str, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Adjust the host's allowance from response headers.
+        
+        Args:
+            host: Host the response came from
+            headers: Response headers (any case)
+            
+        Returns:
+            Retry-After in seconds if the response carried one, else None
+        """
+        lowered = {k.lower(): v for k, v in headers.items()}
+        retry_after = _parse_retry_after(lowered.get('retry-after'))
+        remaining = _first_number(lowered, self.REMAINING_HEADERS)
+        reset = _first_number(lowered, self.RESET_HEADERS)
+        if reset is not None and reset > 1e9:
+            reset = max(0.0, reset - time.time())  # Epoch timestamp, not seconds
+        
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            if retry_after:
+                bucket['blocked_until'] = max(bucket['blocked_until'], now + retry_after)
+            if remaining is not None and reset:
+                if remaining <= 0:
+                    bucket['blocked_until'] = max(bucket['blocked_until'], now + reset)
+                else:
+                    bucket['rate'] = min(self.max_rate, remaining / reset)
+        return retry_after
+
+
+def _first_number(headers: Mapping[str, str], names: Tuple[str, ...]) -> Optional[float]:
+    """Return the first header in names that parses as a number."""
+    for name in names:
+        try:
+            return float(headers[name])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse Retry-After given as seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# Shared across collectors so every API host has one budget per process
+host_rate_limiter = HostRateLimiter(default_rate=Config.API_REQUESTS_PER_SECOND)
@@ -9,13 +9,6 @@ Run: streamlit run streamlit_app.py
 """
 
 import re
-import sys
-from pathlib import Path
-
-# Add src and project root for imports
-_root = Path(__file__).resolve().parent
-sys.path.insert(0, str(_root / "src"))
-sys.path.insert(0, str(_root))
 
 import streamlit as st
 import pandas as pd